@@ -0,0 +1,280 @@
+import dataclasses
+import datetime
+import time
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Iterable
+from typing import Optional
+from typing import Type
+
+from pydantic import ConfigDict
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.entities.asset import Asset
+from armis_sdk.entities.asset_field_description import AssetFieldDescription
+from armis_sdk.entities.device import Device
+from armis_sdk.entities.device_custom_property import DeviceCustomProperty
+
+FIELD_SCHEMA_TTL = 300.0
+FIELD_SCHEMA_MAX_ERRORS = 20
+
+FieldsLoader = Callable[[Type[Asset]], AsyncIterator[AssetFieldDescription]]
+PropertiesLoader = Callable[[], AsyncIterator[DeviceCustomProperty]]
+
+_DATETIME_ADAPTER = TypeAdapter(datetime.datetime, config=ConfigDict(strict=False))
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldSpec:
+    """The server-side description of a single field."""
+
+    type: str
+    """The type of the field, e.g. `"string"`, `"integer"` or `"enum"`."""
+
+    is_list: bool = False
+    """Whether the field holds a list of values."""
+
+    allowed_values: Optional[frozenset[str]] = None
+    """The allowed values of an `"enum"` custom property, if known."""
+
+
+@dataclasses.dataclass
+class _Entry:
+    fields: dict[str, FieldSpec]
+    expires_at: float
+
+
+class AssetFieldSchema:
+    # pylint: disable=line-too-long
+    """
+    A cache of the fields that exist on the server, used to validate custom and integration
+    fields (e.g. `"custom.MyField"`) locally instead of failing after a request was sent.
+
+    The fields of each asset type are loaded from
+    [list_fields][armis_sdk.clients.assets_client.AssetsClient.list_fields] and, for devices, from
+    [DeviceCustomPropertiesClient.list][armis_sdk.clients.device_custom_properties_client.DeviceCustomPropertiesClient.list],
+    and kept for `ttl` seconds. When validation fails, the schema is reloaded once before raising,
+    so fields or allowed values that were added on the server in the meantime are picked up.
+
+    Usually created by [AssetsClient][armis_sdk.clients.assets_client.AssetsClient] when
+    `field_schema_ttl` is given, rather than directly.
+
+    Example:
+        ```python linenums="1" hl_lines="9 11"
+        import asyncio
+
+        from armis_sdk.clients.assets_client import AssetsClient
+        from armis_sdk.entities.device import Device
+
+
+        async def main():
+            assets_client = AssetsClient(field_schema_ttl=300)
+            device = Device(device_id=1, custom={"Size": "xl"})
+
+            # Raises ArmisError before sending anything if "xl" isn't an allowed value of "Size"
+            await assets_client.update([device], ["custom.Size"])
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        fields_loader: FieldsLoader,
+        properties_loader: Optional[PropertiesLoader] = None,
+        ttl: float = FIELD_SCHEMA_TTL,
+    ):
+        """
+        Args:
+            fields_loader: Lists the fields of an asset class, such as `AssetsClient.list_fields`.
+            properties_loader: Lists the device custom properties, such as `DeviceCustomPropertiesClient.list`.
+            ttl: The number of seconds the fields of an asset type are kept before they're reloaded.
+        """
+        self._fields_loader = fields_loader
+        self._properties_loader = properties_loader
+        self._ttl = ttl
+        self._entries: dict[str, _Entry] = {}
+
+    def invalidate(self):
+        """Drop all the cached fields, so they're reloaded on the next validation."""
+        self._entries.clear()
+
+    async def get_fields(
+        self, asset_class: Type[Asset], refresh: bool = False
+    ) -> dict[str, FieldSpec]:
+        """Get the fields of an asset class, loading them if they aren't cached.
+
+        Args:
+            asset_class: The asset class. Must inherit from [Asset][armis_sdk.entities.asset.Asset].
+            refresh: Whether to reload the fields even if they're cached.
+
+        Returns:
+            A mapping from the name of each field to its description.
+        """
+        now = time.monotonic()
+        entry = self._entries.get(asset_class.asset_type)
+        if refresh or entry is None or now >= entry.expires_at:
+            entry = _Entry(await self._load(asset_class), now + self._ttl)
+            self._entries[asset_class.asset_type] = entry
+
+        return entry.fields
+
+    async def validate_fields(self, asset_class: Type[Asset], fields: Iterable[str]):
+        """Validate that the custom and integration fields exist on the server.
+
+        Other fields aren't checked.
+
+        Args:
+            asset_class: The asset class. Must inherit from [Asset][armis_sdk.entities.asset.Asset].
+            fields: The fields to validate.
+
+        Raises:
+            ArmisError: If any of the fields doesn't exist, even after reloading the schema.
+        """
+        fields = [field for field in fields if _is_dynamic_field(field)]
+        if not fields:
+            return
+
+        await self._validate(asset_class, lambda schema: _get_unknown(schema, fields))
+
+    async def validate_updates(
+        self,
+        asset_class: Type[Asset],
+        updates: Iterable[tuple[str, Any]],
+        offset: int = 0,
+    ):
+        """Validate that the fields of `(field, value)` updates exist and that the values match their types.
+
+        Values of `None` (which unset the field) are always valid.
+
+        Args:
+            asset_class: The asset class. Must inherit from [Asset][armis_sdk.entities.asset.Asset].
+            updates: The `(field, value)` pairs to validate.
+            offset: The index of the first update, used in the error message.
+
+        Raises:
+            ArmisError: If any of the updates is invalid, even after reloading the schema.
+        """
+        updates = list(updates)
+        if not updates:
+            return
+
+        await self._validate(
+            asset_class, lambda schema: _get_update_errors(schema, updates, offset)
+        )
+
+    async def _validate(
+        self,
+        asset_class: Type[Asset],
+        get_errors: Callable[[dict[str, FieldSpec]], list[str]],
+    ):
+        reloading = self._is_expired(asset_class)
+        errors = get_errors(await self.get_fields(asset_class))
+        if errors and not reloading:
+            # The schema may have changed on the server since it was cached.
+            errors = get_errors(await self.get_fields(asset_class, refresh=True))
+
+        if errors:
+            if len(errors) > FIELD_SCHEMA_MAX_ERRORS:
+                more = len(errors) - FIELD_SCHEMA_MAX_ERRORS
+                errors = [*errors[:FIELD_SCHEMA_MAX_ERRORS], f"... and {more} more"]
+            raise ArmisError("\n".join(errors))
+
+    def _is_expired(self, asset_class: Type[Asset]) -> bool:
+        entry = self._entries.get(asset_class.asset_type)
+        return entry is None or time.monotonic() >= entry.expires_at
+
+    async def _load(self, asset_class: Type[Asset]) -> dict[str, FieldSpec]:
+        fields = {
+            description.name: FieldSpec(description.type, description.is_list)
+            async for description in self._fields_loader(asset_class)
+        }
+        if (
+            self._properties_loader is not None
+            and asset_class.asset_type == Device.asset_type
+        ):
+            async for property_ in self._properties_loader():
+                name = f"custom.{property_.name}"
+                allowed_values = (
+                    frozenset(property_.allowed_values)
+                    if property_.allowed_values is not None
+                    else None
+                )
+                is_list = name in fields and fields[name].is_list
+                fields[name] = FieldSpec(property_.type, is_list, allowed_values)
+
+        return fields
+
+
+def _is_dynamic_field(field: str) -> bool:
+    return field.startswith(("custom.", "integration."))
+
+
+def _get_unknown(schema: dict[str, FieldSpec], fields: list[str]) -> list[str]:
+    if unknown := [field for field in fields if field not in schema]:
+        fields_str = ", ".join(map(repr, unknown))
+        return [f"The following fields don't exist: {fields_str}"]
+
+    return []
+
+
+def _get_update_errors(
+    schema: dict[str, FieldSpec], updates: list[tuple[str, Any]], offset: int
+) -> list[str]:
+    errors = []
+    for index, (field, value) in enumerate(updates, start=offset):
+        if (spec := schema.get(field)) is None:
+            errors.append(f"Item at index {index}: the field {field!r} doesn't exist")
+        elif value is not None and (error := _get_value_error(spec, value)):
+            errors.append(f"Item at index {index}: {field!r} {error}")
+
+    return errors
+
+
+def _get_value_error(spec: FieldSpec, value: Any) -> Optional[str]:
+    if not spec.is_list:
+        return _get_item_error(spec, value)
+
+    if not isinstance(value, list):
+        return f"must be a list, got {value!r}"
+
+    for item in value:
+        if error := _get_item_error(spec, item):
+            return error
+
+    return None
+
+
+def _get_item_error(spec: FieldSpec, value: Any) -> Optional[str]:
+    # pylint: disable=too-many-return-statements
+    if spec.type == "boolean":
+        return None if isinstance(value, bool) else f"must be a boolean, got {value!r}"
+
+    if spec.type == "integer":
+        if isinstance(value, int) and not isinstance(value, bool):
+            return None
+        return f"must be an integer, got {value!r}"
+
+    if spec.type in ("string", "externalLink"):
+        return None if isinstance(value, str) else f"must be a string, got {value!r}"
+
+    if spec.type == "enum":
+        if spec.allowed_values is None or value in spec.allowed_values:
+            return None
+        allowed_str = ", ".join(map(repr, sorted(spec.allowed_values)))
+        return f"must be one of {allowed_str}, got {value!r}"
+
+    if spec.type == "timestamp":
+        if isinstance(value, str):
+            try:
+                _DATETIME_ADAPTER.validate_python(value)
+                return None
+            except ValidationError:
+                pass
+        return f"must be an ISO 8601 timestamp, got {value!r}"
+
+    # Types that aren't known locally are left for the server to validate.
+    return None
@@ -0,0 +1,221 @@
+import abc
+import asyncio
+import datetime
+import pathlib
+from typing import Generic
+from typing import Optional
+from typing import Type
+from typing import Union
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from armis_sdk.clients.assets_client import AssetsClient
+from armis_sdk.entities.asset import AssetT
+
+SYNC_BATCH_SIZE = 1000
+SYNC_INITIAL_LOOKBACK = datetime.timedelta(days=1)
+SYNC_OVERLAP = datetime.timedelta(minutes=5)
+
+
+class SyncState(BaseModel):
+    """
+    The persisted progress of an [AssetSyncEngine][armis_sdk.clients.asset_sync.AssetSyncEngine].
+    """
+
+    high_water_mark: Optional[datetime.datetime] = None
+    """The maximal `last_seen` of all the delivered assets."""
+
+    delivered: dict[int, datetime.datetime] = Field(default_factory=dict)
+    """
+    The `last_seen` of the assets delivered within the overlap before the high-water mark,
+    by asset id. These assets will be fetched again by the next sync and are skipped
+    unless they were seen again.
+    """
+
+
+class SyncStateStore(abc.ABC):
+    """A place to persist the [SyncState][armis_sdk.clients.asset_sync.SyncState] between syncs."""
+
+    @abc.abstractmethod
+    async def load(self) -> Optional[SyncState]:
+        """Load the last saved state, or `None` if nothing was saved yet."""
+
+    @abc.abstractmethod
+    async def save(self, state: SyncState):
+        """Save the state."""
+
+
+class MemorySyncStateStore(SyncStateStore):
+    """Keeps the state in memory, for the lifetime of the process."""
+
+    def __init__(self):
+        self._state: Optional[SyncState] = None
+
+    async def load(self) -> Optional[SyncState]:
+        return self._state.model_copy(deep=True) if self._state else None
+
+    async def save(self, state: SyncState):
+        self._state = state.model_copy(deep=True)
+
+
+class FileSyncStateStore(SyncStateStore):
+    """Keeps the state as a JSON file."""
+
+    def __init__(self, path: Union[str, pathlib.Path]):
+        self._path = pathlib.Path(path)
+
+    async def load(self) -> Optional[SyncState]:
+        if not self._path.exists():
+            return None
+
+        data = await asyncio.to_thread(self._path.read_text)
+        return SyncState.model_validate_json(data)
+
+    async def save(self, state: SyncState):
+        # Write to a temporary file first, so a crash never leaves a corrupted state.
+        temp_path = self._path.with_name(f"{self._path.name}.tmp")
+        await asyncio.to_thread(temp_path.write_text, state.model_dump_json())
+        await asyncio.to_thread(temp_path.replace, self._path)
+
+
+class AssetSink(abc.ABC, Generic[AssetT]):  # pylint: disable=too-few-public-methods
+    """
+    The destination of the assets delivered by an
+    [AssetSyncEngine][armis_sdk.clients.asset_sync.AssetSyncEngine].
+    """
+
+    @abc.abstractmethod
+    async def upsert(self, assets: list[AssetT]):
+        """Insert the assets, or replace the existing ones with the same id."""
+
+
+class AssetSyncEngine(Generic[AssetT]):
+    # pylint: disable=line-too-long,too-many-instance-attributes
+    """
+    Incrementally synchronizes assets into an [AssetSink][armis_sdk.clients.asset_sync.AssetSink].
+
+    Each call to [sync][armis_sdk.clients.asset_sync.AssetSyncEngine.sync] fetches only the
+    assets seen since the high-water mark of the previous sync (the maximal `last_seen`
+    delivered so far), minus an `overlap` that protects against assets whose `last_seen`
+    is reported with a delay. Assets in the overlap that were already delivered with the
+    same `last_seen` are skipped. The new state is saved only after the sink accepted all
+    the assets, so every asset is delivered at least once.
+
+    Example:
+        ```python linenums="1" hl_lines="17-22"
+        import asyncio
+
+        from armis_sdk.clients.asset_sync import AssetSink
+        from armis_sdk.clients.asset_sync import AssetSyncEngine
+        from armis_sdk.clients.asset_sync import FileSyncStateStore
+        from armis_sdk.clients.assets_client import AssetsClient
+        from armis_sdk.entities.device import Device
+
+
+        class PrintSink(AssetSink[Device]):
+            async def upsert(self, assets):
+                for asset in assets:
+                    print(asset)
+
+
+        async def main():
+            engine = AssetSyncEngine(
+                AssetsClient(),
+                Device,
+                PrintSink(),
+                state_store=FileSyncStateStore("/tmp/devices_sync.json"),
+            )
+            await engine.run(interval=300)
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        assets_client: AssetsClient,
+        asset_class: Type[AssetT],
+        sink: AssetSink[AssetT],
+        state_store: Optional[SyncStateStore] = None,
+        fields: Optional[list[str]] = None,
+        initial_lookback: datetime.timedelta = SYNC_INITIAL_LOOKBACK,
+        overlap: datetime.timedelta = SYNC_OVERLAP,
+        batch_size: int = SYNC_BATCH_SIZE,
+    ):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self._assets_client = assets_client
+        self._asset_class = asset_class
+        self._sink = sink
+        self._state_store = state_store or MemorySyncStateStore()
+        self._fields = fields
+        if fields is not None:
+            required = ["device_id", "last_seen"]
+            self._fields = [
+                *fields,
+                *(field for field in required if field not in fields),
+            ]
+        self._initial_lookback = initial_lookback
+        self._overlap = overlap
+        self._batch_size = batch_size
+
+    async def sync(self) -> int:
+        """Deliver the assets that were seen since the previous sync.
+
+        Returns:
+            The number of assets delivered to the sink.
+        """
+        state = await self._state_store.load() or SyncState()
+        last_seen: Union[datetime.datetime, datetime.timedelta] = (
+            state.high_water_mark - self._overlap
+            if state.high_water_mark is not None
+            else self._initial_lookback
+        )
+
+        delivered = dict(state.delivered)
+        high_water_mark = state.high_water_mark
+        count = 0
+        batch: list[AssetT] = []
+        async for asset in self._assets_client.list_by_last_seen(
+            self._asset_class, last_seen, fields=self._fields
+        ):
+            asset_id = self._assets_client.get_asset_id(asset, index=count)
+            asset_last_seen = getattr(asset, "last_seen", None)
+            if asset_last_seen is not None:
+                if delivered.get(asset_id) == asset_last_seen:
+                    continue
+                delivered[asset_id] = asset_last_seen
+                if high_water_mark is None or asset_last_seen > high_water_mark:
+                    high_water_mark = asset_last_seen
+
+            batch.append(asset)
+            count += 1
+            if len(batch) >= self._batch_size:
+                await self._sink.upsert(batch)
+                batch = []
+
+        if batch:
+            await self._sink.upsert(batch)
+
+        if high_water_mark is not None:
+            oldest = high_water_mark - self._overlap
+            delivered = {
+                asset_id: asset_last_seen
+                for asset_id, asset_last_seen in delivered.items()
+                if asset_last_seen >= oldest
+            }
+
+        await self._state_store.save(
+            SyncState(high_water_mark=high_water_mark, delivered=delivered)
+        )
+        return count
+
+    async def run(self, interval: float):
+        """Sync forever, waiting `interval` seconds between syncs.
+
+        Args:
+            interval: The number of seconds to wait after each sync.
+        """
+        while True:
+            await self.sync()
+            await asyncio.sleep(interval)
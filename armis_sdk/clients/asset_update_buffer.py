@@ -0,0 +1,222 @@
+import asyncio
+import contextlib
+import itertools
+from typing import Any
+from typing import Generic
+from typing import Iterable
+from typing import Optional
+from typing import Type
+from typing import Union
+
+from armis_sdk.clients.assets_client import BULK_UPDATE_BATCH_SIZE
+from armis_sdk.clients.assets_client import AssetsClient
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.core.armis_error import BulkUpdateError
+from armis_sdk.core.bulk_update_retry import BulkUpdateRetry
+from armis_sdk.entities.asset import AssetT
+from armis_sdk.types.asset_id_source import AssetIdSource
+
+
+class AssetUpdateBuffer(Generic[AssetT]):
+    # pylint: disable=line-too-long,too-many-instance-attributes
+    """
+    A write-behind buffer for bulk updating assets.
+
+    Instead of sending a request per update, updates are collected in memory and sent
+    in batches using [update_stream][armis_sdk.clients.assets_client.AssetsClient.update_stream].
+    Repeated updates of the same field of the same asset are coalesced, so only the
+    last value is sent (a falsy value means `UNSET`, just like with
+    [update][armis_sdk.clients.assets_client.AssetsClient.update]).
+
+    The buffer is flushed when:
+
+    1. It holds `max_batch_size` pending updates. The caller that filled the buffer
+       waits until the flush is done, which applies backpressure on fast producers.
+    2. `flush_interval` seconds have passed since the last periodic flush.
+    3. [flush][armis_sdk.clients.asset_update_buffer.AssetUpdateBuffer.flush] or
+       [close][armis_sdk.clients.asset_update_buffer.AssetUpdateBuffer.close] are called explicitly.
+
+    Updates that failed with a retryable status (see
+    [BulkUpdateRetry][armis_sdk.core.bulk_update_retry.BulkUpdateRetry]) are kept, and sent
+    again by the next flush. Other failed updates are dropped, and reported once.
+    Errors of periodic flushes are raised by the next call to the buffer.
+
+    Example:
+        ```python linenums="1" hl_lines="10 11"
+        import asyncio
+
+        from armis_sdk.clients.asset_update_buffer import AssetUpdateBuffer
+        from armis_sdk.clients.assets_client import AssetsClient
+        from armis_sdk.entities.device import Device
+
+
+        async def main():
+            assets_client = AssetsClient()
+            async with AssetUpdateBuffer(assets_client, Device) as buffer:
+                await buffer.set(1, "custom.MyField", "Hello, World")
+                await buffer.add(Device(device_id=2, custom={"MyField": "Hi"}), ["custom.MyField"])
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        assets_client: AssetsClient,
+        asset_class: Type[AssetT],
+        asset_id_source: AssetIdSource = "ASSET_ID",
+        max_batch_size: int = BULK_UPDATE_BATCH_SIZE,
+        flush_interval: Optional[float] = 5.0,
+        retry: Optional[BulkUpdateRetry] = None,
+    ):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        if max_batch_size < 1:
+            raise ArmisError("max_batch_size must be at least 1")
+
+        self._assets_client = assets_client
+        self._asset_class = asset_class
+        self._asset_id_source = asset_id_source
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._retry = retry
+        self._pending: dict[tuple[Union[str, int], str], Any] = {}
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._periodic_flush: Optional[asyncio.Future] = None
+        self._error: Optional[Exception] = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def __aenter__(self) -> "AssetUpdateBuffer[AssetT]":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def add(self, asset: AssetT, fields: list[str]):
+        """Buffer updates of the given fields, taking the values from the asset.
+
+        Args:
+            asset: The asset to take the identifier and values from.
+            fields: The fields to update. Currently only custom properties are supported (i.e.  `custom.MyField`).
+        """
+        updates = self._assets_client.get_updates(asset, fields, self._asset_id_source)
+        for asset_id, field, value in updates:
+            await self.set(asset_id, field, value)
+
+    async def set(self, asset_id: Union[str, int], field: str, value: Any):
+        """Buffer an update of a single field of a single asset.
+
+        Args:
+            asset_id: The identifier of the asset, according to `asset_id_source`.
+            field: The field to update (i.e. `custom.MyField`).
+            value: The new value. A falsy value unsets the field.
+        """
+        self._raise_pending_error()
+        if self._closed:
+            raise ArmisError("Can't update a closed buffer.")
+
+        self._assets_client.validate_update(asset_id, field, value)
+        self._pending[(asset_id, field)] = value
+        self._ensure_flush_task()
+
+        if len(self._pending) >= self._max_batch_size:
+            await self.flush()
+
+    async def unset(self, asset_id: Union[str, int], field: str):
+        """Buffer removal of a single field of a single asset.
+
+        Args:
+            asset_id: The identifier of the asset, according to `asset_id_source`.
+            field: The field to unset (i.e. `custom.MyField`).
+        """
+        await self.set(asset_id, field, None)
+
+    async def flush(self):
+        """Send all the pending updates.
+
+        Raises:
+            BulkUpdateError: If an error occurs while trying to update any of the items.
+        """
+        self._raise_pending_error()
+        await self._flush_pending()
+
+    async def close(self):
+        """Stop periodic flushing and send all the pending updates.
+
+        Raises:
+            BulkUpdateError: If an error occurs while trying to update any of the items.
+        """
+        self._closed = True
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+
+        if self._periodic_flush is not None:
+            # Cancelling the periodic task doesn't interrupt a flush in flight, so wait for it.
+            # If it failed, its updates were restored and are sent again below.
+            with contextlib.suppress(Exception):
+                await self._periodic_flush
+            self._periodic_flush = None
+
+        await self.flush()
+
+    def _ensure_flush_task(self):
+        if self._flush_interval is None or self._flush_task is not None:
+            return
+
+        self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def _flush_pending(self):
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            while self._pending:
+                keys = list(itertools.islice(self._pending, self._max_batch_size))
+                updates = [(*key, self._pending.pop(key)) for key in keys]
+                try:
+                    await self._assets_client.update_stream(
+                        self._asset_class,
+                        updates,
+                        asset_id_source=self._asset_id_source,
+                        batch_size=self._max_batch_size,
+                        retry=self._retry,
+                    )
+                except BulkUpdateError as error:
+                    retry = self._retry or BulkUpdateRetry()
+                    self._restore(
+                        updates[item.index]
+                        for item in error.items
+                        if retry.is_retryable(item.response.get("status", 0))
+                    )
+                    raise
+                except BaseException:
+                    # It's unknown which of the updates were sent, so all of them are kept.
+                    self._restore(updates)
+                    raise
+
+    def _restore(self, updates: Iterable[tuple[Union[str, int], str, Any]]):
+        # Newer values that were set in the meantime take precedence.
+        for asset_id, field, value in updates:
+            self._pending.setdefault((asset_id, field), value)
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            # Shielded, so closing the buffer doesn't cancel a flush in flight.
+            self._periodic_flush = asyncio.ensure_future(self._flush_pending())
+            try:
+                await asyncio.shield(self._periodic_flush)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self._error = error
+            self._periodic_flush = None
+
+    def _raise_pending_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
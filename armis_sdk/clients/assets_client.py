@@ -1,22 +1,56 @@
+# pylint: disable=too-many-lines
+import asyncio
 import datetime
+from typing import Any
+from typing import AsyncIterable
 from typing import AsyncIterator
+from typing import Iterable
+from typing import Iterator
+from typing import Mapping
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import Union
 
+import httpx
+import pandas
+import pyarrow
+import pyarrow.compute
 import universalasync
 
+from armis_sdk.clients.asset_field_schema import AssetFieldSchema
+from armis_sdk.clients.device_custom_properties_client import (
+    DeviceCustomPropertiesClient,
+)
+from armis_sdk.core import async_utils
 from armis_sdk.core import response_utils
+from armis_sdk.core.armis_client import ArmisClient
 from armis_sdk.core.armis_error import ArmisError
 from armis_sdk.core.armis_error import BulkUpdateError
 from armis_sdk.core.armis_error import BulkUpdateItemError
+from armis_sdk.core.arrow_decoder import ArrowDecoder
+from armis_sdk.core.asset_decoder import AssetDecoder
 from armis_sdk.core.base_entity_client import BaseEntityClient
+from armis_sdk.core.bulk_update_retry import BulkUpdateRetry
+from armis_sdk.core.decoder_pool import DecoderPool
+from armis_sdk.core.interner import Interner
+from armis_sdk.core.lazy_asset import LazyAsset
+from armis_sdk.core.records import Record
 from armis_sdk.entities.asset import Asset
 from armis_sdk.entities.asset import AssetT
 from armis_sdk.entities.asset_field_description import AssetFieldDescription
 from armis_sdk.entities.device import Device
 from armis_sdk.types.asset_id_source import AssetIdSource
 
+BULK_UPDATE_BATCH_SIZE = 1000
+MULTI_SCAN_BUFFER_SIZE = 1000
+AssetUpdate = Tuple[Union[str, int], str, Any]
+"""A single `(asset_id, field, value)` update, e.g. `(1, "custom.MyField", "Hello")`."""
+ColumnUpdates = Union[
+    Mapping[str, Mapping[Union[str, int], Any]], pandas.DataFrame, pyarrow.Table
+]
+"""The values of each field, e.g. `{"custom.MyField": {1: "Hello"}}`, or a table of them."""
+
 
 @universalasync.wrap
 class AssetsClient(BaseEntityClient):  # pylint: disable=too-few-public-methods
@@ -27,8 +61,49 @@ class AssetsClient(BaseEntityClient):  # pylint: disable=too-few-public-methods
     The primary entities for this client inherit from [Asset][armis_sdk.entities.asset.Asset]:
 
     1. [Device][armis_sdk.entities.device.Device]
+
+    Custom and integration fields (e.g. `"custom.MyField"`) are validated by the server.
+    Pass `field_schema_ttl` to also validate them locally with an
+    [AssetFieldSchema][armis_sdk.clients.asset_field_schema.AssetFieldSchema], which caches the
+    server's fields for that many seconds. Unknown fields and values that don't match
+    the type of the field (e.g. an enum value that isn't allowed) then raise an `ArmisError`
+    before any request is built.
+
+    Pass `lazy_nested_fields=True` to skip validating nested entities (such as `site`,
+    `boundaries` and `network_interfaces`) of listed assets until they're first accessed,
+    which makes large listings cheaper when only top-level fields are read.
+    Listings then yield [LazyAsset][armis_sdk.core.lazy_asset.LazyAsset]s instead of assets,
+    which [update_stream][armis_sdk.clients.assets_client.AssetsClient.update_stream] and the
+    exporters of [asset_exporter][armis_sdk.core.asset_exporter] accept as well.
+
+    Pass an [Interner][armis_sdk.core.interner.Interner] to share identical nested entities and
+    strings between all the listed assets, which makes large listings use less memory.
+
+    Pass a `decoder_pool` to decode the pages of all listings in a
+    [DecoderPool][armis_sdk.core.decoder_pool.DecoderPool] of processes, for listings that
+    are limited by decoding on a single core. Nested entities are then always validated
+    while decoding, regardless of `lazy_nested_fields`, and the `interner` isn't used.
     """
 
+    def __init__(
+        self,
+        armis_client: Optional[ArmisClient] = None,
+        field_schema_ttl: Optional[float] = None,
+        lazy_nested_fields: bool = False,
+        decoder_pool: Optional[DecoderPool] = None,
+        interner: Optional[Interner] = None,
+    ) -> None:
+        super().__init__(armis_client)
+        self.lazy_nested_fields = lazy_nested_fields
+        self.interner = interner
+        self.decoder_pool = decoder_pool
+        self.field_schema: Optional[AssetFieldSchema] = None
+        if field_schema_ttl is not None:
+            properties_client = DeviceCustomPropertiesClient(self._armis_client)
+            self.field_schema = AssetFieldSchema(
+                self.list_fields, properties_client.list, ttl=field_schema_ttl
+            )
+
     async def list_by_asset_id(
         self,
         asset_class: Type[AssetT],
@@ -87,6 +162,10 @@ class AssetsClient(BaseEntityClient):  # pylint: disable=too-few-public-methods
     ) -> AsyncIterator[AssetT]:
         """List assets by last seen timestamp.
 
+        The assets are paged sequentially. The search API only filters `last_seen` by a lower bound
+        and doesn't guarantee the order of the results, so the range can't be split into
+        windows that are paged concurrently without downloading each window up until now.
+
         Args:
             asset_class: The asset class to list. Must inherit from [Asset][armis_sdk.entities.asset.Asset].
             last_seen: Either a datetime (assets seen on or after this time) or timedelta (assets seen within this duration).
@@ -120,18 +199,261 @@ class AssetsClient(BaseEntityClient):  # pylint: disable=too-few-public-methods
             asyncio.run(main())
             ```
         """
-        filter_: dict[str, Union[str, int]] = {"filter_criteria": "LAST_SEEN"}
-
-        if isinstance(last_seen, datetime.datetime):
-            filter_["last_seen_ge"] = last_seen.isoformat()
-        elif isinstance(last_seen, datetime.timedelta):
-            filter_["last_seen_seconds"] = int(last_seen.total_seconds())
-        else:
-            raise ArmisError(f"Invalid 'last_seen' type {type(last_seen)}")
-
+        filter_ = self._get_last_seen_filter(last_seen)
         async for item in self._list_assets(asset_class, fields, filter_):
             yield item
 
+    async def list_batches_by_asset_id(
+        self,
+        asset_class: Type[AssetT],
+        asset_ids: Union[list[int], list[str]],
+        asset_id_source: AssetIdSource = "ASSET_ID",
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[pyarrow.RecordBatch]:
+        # pylint: disable=line-too-long
+        """List assets by asset ID or other identifiers, as Arrow record batches.
+
+        This is the columnar equivalent of [list_by_asset_id][armis_sdk.clients.assets_client.AssetsClient.list_by_asset_id].
+        Each page of results is decoded directly into a record batch, without creating an asset object per item.
+        See [ArrowDecoder][armis_sdk.core.arrow_decoder.ArrowDecoder] for how fields are mapped to columns.
+
+        Args:
+            asset_class: The asset class to list. Must inherit from [Asset][armis_sdk.entities.asset.Asset].
+            asset_ids: A list of asset identifiers (int or str depending on asset_id_source).
+            asset_id_source: The type of identifier provided in asset_ids.
+            fields: Optional list of fields to retrieve. If None, all non-custom fields are retrieved.
+
+        Yields:
+            A record batch per page of results. At least one batch is yielded, even if no asset matches.
+
+        Example:
+            ```python linenums="1" hl_lines="11"
+            import asyncio
+
+            import pyarrow
+
+            from armis_sdk.clients.assets_client import AssetsClient
+            from armis_sdk.entities.device import Device
+
+            async def main():
+                assets_client = AssetsClient()
+                batches = assets_client.list_batches_by_asset_id(Device, [1, 2, 3])
+                table = pyarrow.Table.from_batches([batch async for batch in batches])
+                print(table.to_pandas())
+
+            asyncio.run(main())
+            ```
+        """
+        filter_ = {
+            "filter_criteria": "ASSET_ID",
+            "asset_ids": asset_ids,
+            "asset_id_source": asset_id_source,
+        }
+        async for batch in self._list_batches(asset_class, fields, filter_):
+            yield batch
+
+    async def list_batches_by_last_seen(
+        self,
+        asset_class: Type[AssetT],
+        last_seen: Union[datetime.datetime, datetime.timedelta],
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[pyarrow.RecordBatch]:
+        # pylint: disable=line-too-long
+        """List assets by last seen timestamp, as Arrow record batches.
+
+        This is the columnar equivalent of [list_by_last_seen][armis_sdk.clients.assets_client.AssetsClient.list_by_last_seen].
+        Each page of results is decoded directly into a record batch, without creating an asset object per item.
+        See [ArrowDecoder][armis_sdk.core.arrow_decoder.ArrowDecoder] for how fields are mapped to columns.
+
+        Args:
+            asset_class: The asset class to list. Must inherit from [Asset][armis_sdk.entities.asset.Asset].
+            last_seen: Either a datetime (assets seen on or after this time) or timedelta (assets seen within this duration).
+            fields: Optional list of fields to retrieve. If None, all non-custom fields are retrieved.
+
+        Yields:
+            A record batch per page of results. At least one batch is yielded, even if no asset matches.
+
+        Raises:
+            ArmisError: If last_seen is neither datetime nor timedelta.
+
+        Example:
+            ```python linenums="1" hl_lines="12-13"
+            import asyncio
+            import datetime
+
+            import pyarrow
+
+            from armis_sdk.clients.assets_client import AssetsClient
+            from armis_sdk.entities.device import Device
+
+            async def main():
+                assets_client = AssetsClient()
+                fields = ["device_id", "type", "last_seen"]
+                batches = assets_client.list_batches_by_last_seen(Device, datetime.timedelta(days=1), fields)
+                table = pyarrow.Table.from_batches([batch async for batch in batches])
+                print(table.group_by("type").aggregate([("device_id", "count")]))
+
+            asyncio.run(main())
+            ```
+        """
+        filter_ = self._get_last_seen_filter(last_seen)
+        async for batch in self._list_batches(asset_class, fields, filter_):
+            yield batch
+
+    async def list_records_by_asset_id(
+        self,
+        asset_class: Type[AssetT],
+        asset_ids: Union[list[int], list[str]],
+        asset_id_source: AssetIdSource = "ASSET_ID",
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[Record]:
+        # pylint: disable=line-too-long
+        """List assets by asset ID or other identifiers, as compact records.
+
+        This is the compact equivalent of [list_by_asset_id][armis_sdk.clients.assets_client.AssetsClient.list_by_asset_id].
+        Each asset is converted into a [Record][armis_sdk.core.records.Record] of `asset_class`
+        (e.g. `DeviceRecord`) as soon as it's decoded, which is useful for holding many assets in memory.
+
+        Args:
+            asset_class: The asset class to list. Must inherit from [Asset][armis_sdk.entities.asset.Asset].
+            asset_ids: A list of asset identifiers (int or str depending on asset_id_source).
+            asset_id_source: The type of identifier provided in asset_ids.
+            fields: Optional list of fields to retrieve. If None, all non-custom fields are retrieved.
+
+        Yields:
+            Records of the assets matching the provided identifiers.
+
+        Example:
+            ```python linenums="1" hl_lines="8"
+            import asyncio
+
+            from armis_sdk.clients.assets_client import AssetsClient
+            from armis_sdk.entities.device import Device
+
+            async def main():
+                assets_client = AssetsClient()
+                records = [record async for record in assets_client.list_records_by_asset_id(Device, [1, 2, 3])]
+                print(records[0].to_model())
+
+            asyncio.run(main())
+            ```
+        """
+        filter_ = {
+            "filter_criteria": "ASSET_ID",
+            "asset_ids": asset_ids,
+            "asset_id_source": asset_id_source,
+        }
+        async for record in self._list_records(asset_class, fields, filter_):
+            yield record
+
+    async def list_records_by_last_seen(
+        self,
+        asset_class: Type[AssetT],
+        last_seen: Union[datetime.datetime, datetime.timedelta],
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[Record]:
+        # pylint: disable=line-too-long
+        """List assets by last seen timestamp, as compact records.
+
+        This is the compact equivalent of [list_by_last_seen][armis_sdk.clients.assets_client.AssetsClient.list_by_last_seen].
+        Each asset is converted into a [Record][armis_sdk.core.records.Record] of `asset_class`
+        (e.g. `DeviceRecord`) as soon as it's decoded, which is useful for holding many assets in memory.
+
+        Args:
+            asset_class: The asset class to list. Must inherit from [Asset][armis_sdk.entities.asset.Asset].
+            last_seen: Either a datetime (assets seen on or after this time) or timedelta (assets seen within this duration).
+            fields: Optional list of fields to retrieve. If None, all non-custom fields are retrieved.
+
+        Yields:
+            Records of the assets matching the last seen criteria.
+
+        Raises:
+            ArmisError: If last_seen is neither datetime nor timedelta.
+
+        Example:
+            ```python linenums="1" hl_lines="9"
+            import asyncio
+            import datetime
+
+            from armis_sdk.clients.assets_client import AssetsClient
+            from armis_sdk.entities.device import Device
+
+            async def main():
+                assets_client = AssetsClient()
+                records = [record async for record in assets_client.list_records_by_last_seen(Device, datetime.timedelta(days=1))]
+                print(len(records))
+
+            asyncio.run(main())
+            ```
+        """
+        filter_ = self._get_last_seen_filter(last_seen)
+        async for record in self._list_records(asset_class, fields, filter_):
+            yield record
+
+    async def list_many_by_last_seen(
+        self,
+        asset_classes: Iterable[Type[Asset]],
+        last_seen: Union[datetime.datetime, datetime.timedelta],
+        fields: Optional[Mapping[Type[Asset], list[str]]] = None,
+        buffer_size: int = MULTI_SCAN_BUFFER_SIZE,
+    ) -> AsyncIterator[Tuple[Type[Asset], Asset]]:
+        # pylint: disable=line-too-long
+        """List several asset classes by last seen timestamp, concurrently.
+
+        The same filter is run for every asset class at the same time, over a single
+        connection pool, and the results are merged into one stream as they arrive.
+        Each asset is tagged with the class it was listed as, so assets of different
+        classes (or projections) that share an asset type can be told apart.
+
+        Args:
+            asset_classes: The asset classes to list. Must inherit from [Asset][armis_sdk.entities.asset.Asset].
+            last_seen: Either a datetime (assets seen on or after this time) or timedelta (assets seen within this duration).
+            fields: Optional mapping from an asset class to the fields to retrieve. Classes that aren't mapped retrieve all their non-custom fields.
+            buffer_size: The maximal number of assets that are fetched ahead of the consumer.
+
+        Yields:
+            `(asset_class, asset)` tuples, ordered per asset class but interleaved across classes.
+
+        Raises:
+            ArmisError: If last_seen is neither datetime nor timedelta.
+
+        Example:
+            ```python linenums="1" hl_lines="11"
+            import asyncio
+            import datetime
+
+            from armis_sdk.clients.assets_client import AssetsClient
+            from armis_sdk.entities.device import Device
+            from armis_sdk.entities.device import LightDevice
+
+            async def main():
+                assets_client = AssetsClient()
+
+                async for asset_class, asset in assets_client.list_many_by_last_seen([Device, LightDevice], datetime.timedelta(days=1)):
+                    print(asset_class.__name__, asset)
+
+            asyncio.run(main())
+            ```
+        """
+        filter_ = self._get_last_seen_filter(last_seen)
+        fields = fields or {}
+
+        async def scan(
+            asset_class: Type[Asset], client: httpx.AsyncClient
+        ) -> AsyncIterator[Tuple[Type[Asset], Asset]]:
+            async for asset in self._list_assets(
+                asset_class, fields.get(asset_class), filter_, client=client
+            ):
+                yield asset_class, asset
+
+        async with self._armis_client.client() as client:
+            scans = [
+                scan(asset_class, client)
+                for asset_class in dict.fromkeys(asset_classes)
+            ]
+            async for item in async_utils.merge(scans, buffer_size=buffer_size):
+                yield item
+
     async def list_fields(
         self, asset_class: Type[AssetT]
     ) -> AsyncIterator[AssetFieldDescription]:
@@ -168,11 +490,74 @@ class AssetsClient(BaseEntityClient):  # pylint: disable=too-few-public-methods
             for item in data["items"]:
                 yield AssetFieldDescription.model_validate(item)
 
+    @classmethod
+    def get_asset_id(
+        cls,
+        asset: Asset,
+        asset_id_source: AssetIdSource = "ASSET_ID",
+        index: int = 0,
+    ) -> Union[str, int]:
+        """Get the unique identifier of an asset, as used by bulk updates.
+
+        Args:
+            asset: The asset to take the identifier from.
+            asset_id_source: From where on the asset to take the unique identifier.
+            index: The position of the asset in its stream, used in error messages.
+
+        Returns:
+            The identifier, e.g. the `device_id` of a device for `"ASSET_ID"`.
+
+        Raises:
+            ArmisError: If the asset doesn't have the identifier.
+        """
+        return cls._get_asset_id(asset, index, asset_id_source)
+
+    @classmethod
+    def get_updates(
+        cls,
+        asset: Asset,
+        fields: list[str],
+        asset_id_source: AssetIdSource = "ASSET_ID",
+    ) -> list[AssetUpdate]:
+        """Get the updates of the given fields of an asset, as accepted by
+        [update_stream][armis_sdk.clients.assets_client.AssetsClient.update_stream].
+
+        Args:
+            asset: The asset to take the identifier and values from.
+            fields: The fields to update. Currently only custom properties are supported (i.e.  `custom.MyField`).
+            asset_id_source: From where on the asset to take the unique identifier.
+
+        Returns:
+            An `(asset_id, field, value)` tuple per field.
+
+        Raises:
+            ArmisError: If the asset doesn't have the identifier, or a field can't be updated.
+        """
+        asset_id = cls.get_asset_id(asset, asset_id_source)
+        return [
+            (
+                asset_id,
+                field,
+                cls._create_bulk_update_request(asset, asset_id, field).get("value"),
+            )
+            for field in fields
+        ]
+
+    @classmethod
+    def validate_update(cls, asset_id: Union[str, int], field: str, value: Any):
+        """Validate that an `(asset_id, field, value)` update can be sent.
+
+        Raises:
+            ArmisError: If the field can't be updated.
+        """
+        cls._create_bulk_update_item(asset_id, field, value)
+
     async def update(
         self,
         assets: list[AssetT],
         fields: list[str],
         asset_id_source: AssetIdSource = "ASSET_ID",
+        retry: Optional[BulkUpdateRetry] = None,
     ) -> None:
         # pylint: disable=line-too-long
         """Bulk update assets.
@@ -181,9 +566,10 @@ class AssetsClient(BaseEntityClient):  # pylint: disable=too-few-public-methods
             assets: A list of assets. Items must inherit from [Asset][armis_sdk.entities.asset.Asset].
             fields: A list of fields to update. Currently only custom properties are supported (i.e.  `custom.MyField`).
             asset_id_source: From where on the asset to take the unique identifier.
+            retry: How to retry items that failed with a retryable status. Defaults to [BulkUpdateRetry()][armis_sdk.core.bulk_update_retry.BulkUpdateRetry].
 
         Raises:
-            BulkUpdateError: If an error occurs while trying to update any of the assets.
+            BulkUpdateError: If an error occurs while trying to update any of the assets, after retrying.
 
         Example:
             ```python linenums="1" hl_lines="13 16"
@@ -224,21 +610,368 @@ class AssetsClient(BaseEntityClient):  # pylint: disable=too-few-public-methods
         if not items:
             return
 
-        payload = {
-            "items": items,
-            "asset_type": asset_class.asset_type,
-            "asset_id_source": asset_id_source,
-        }
+        if errors := await self._bulk_update(
+            asset_class, items, asset_id_source, retry=retry
+        ):
+            raise BulkUpdateError(errors)
+
+    async def update_stream(
+        self,
+        asset_class: Type[AssetT],
+        updates: Union[
+            Iterable[Union[AssetT, AssetUpdate]],
+            AsyncIterable[Union[AssetT, AssetUpdate]],
+        ],
+        fields: Optional[list[str]] = None,
+        asset_id_source: AssetIdSource = "ASSET_ID",
+        batch_size: int = BULK_UPDATE_BATCH_SIZE,
+        retry: Optional[BulkUpdateRetry] = None,
+    ) -> None:
+        # pylint: disable=line-too-long,too-many-arguments,too-many-positional-arguments
+        """Bulk update assets from a (possibly very large) stream.
+
+        Unlike [update][armis_sdk.clients.assets_client.AssetsClient.update], the updates
+        are not materialized up front. They are consumed lazily and sent in batches of
+        `batch_size` items, so memory usage doesn't depend on the size of the input.
+
+        Args:
+            asset_class: The class of the updated assets. Must inherit from [Asset][armis_sdk.entities.asset.Asset].
+            updates: An (async) iterable of either assets of type `asset_class` (or [LazyAsset][armis_sdk.core.lazy_asset.LazyAsset]s of them) or `(asset_id, field, value)` tuples.
+            fields: The fields to update on each asset. Required when `updates` contains assets, ignored for tuples.
+            asset_id_source: From where on the asset to take the unique identifier, or the type of `asset_id` in tuples.
+            batch_size: The maximal number of items sent in each request.
+            retry: How to retry items that failed with a retryable status. Defaults to [BulkUpdateRetry()][armis_sdk.core.bulk_update_retry.BulkUpdateRetry].
+
+        Raises:
+            BulkUpdateError: If an error occurs while trying to update any of the items, after retrying.
+                The index of each error is the position of the item in the whole stream.
+
+        Example:
+            ```python linenums="1" hl_lines="18 21"
+            import asyncio
+            import datetime
+
+            from armis_sdk.clients.assets_client import AssetsClient
+            from armis_sdk.entities.device import Device
+
+
+            async def main():
+                assets_client = AssetsClient()
+
+                async def devices():
+                    async for device in assets_client.list_by_last_seen(Device, datetime.timedelta(days=1)):
+                        device.custom["MyField"] = "Hello, World"
+                        yield device
+
+                # Update assets
+                await assets_client.update_stream(Device, devices(), ["custom.MyField"])
+
+                # Update (asset_id, field, value) tuples
+                await assets_client.update_stream(Device, [(1, "custom.MyField", "Hello, World")])
+
+            asyncio.run(main())
+            ```
+        """
+        fields = fields or []
+        self._validate_fields(asset_class, fields, allow_model_members=False)
+
+        items = self._iter_bulk_update_items(
+            asset_class, updates, fields, asset_id_source
+        )
+        await self._bulk_update_stream(
+            asset_class, items, asset_id_source, batch_size, retry
+        )
+
+    async def update_columns(
+        self,
+        asset_class: Type[AssetT],
+        columns: ColumnUpdates,
+        asset_id_source: AssetIdSource = "ASSET_ID",
+        id_column: str = "asset_id",
+        batch_size: int = BULK_UPDATE_BATCH_SIZE,
+        retry: Optional[BulkUpdateRetry] = None,
+    ) -> None:
+        # pylint: disable=line-too-long,too-many-arguments,too-many-positional-arguments
+        """Bulk update custom properties from columns of values, without creating an asset per row.
+
+        The values are given per field, either as a mapping of `{field: {asset_id: value}}`,
+        or as a `pandas.DataFrame` / `pyarrow.Table` with an `id_column` and a column per field.
+        Like [update][armis_sdk.clients.assets_client.AssetsClient.update], empty values (e.g. `None` or `""`)
+        unset the field. For tables, which values are set is computed for whole columns at once,
+        and the table is sent in slices of `batch_size` rows.
+
+        Args:
+            asset_class: The class of the updated assets. Must inherit from [Asset][armis_sdk.entities.asset.Asset].
+            columns: The values of each field, keyed by the asset identifier.
+            asset_id_source: The type of the asset identifiers.
+            id_column: The column of the asset identifiers, when `columns` is a table.
+            batch_size: The maximal number of items sent in each request.
+            retry: How to retry items that failed with a retryable status. Defaults to [BulkUpdateRetry()][armis_sdk.core.bulk_update_retry.BulkUpdateRetry].
+
+        Raises:
+            ArmisError: If any of the fields isn't a custom property, or the table doesn't have an `id_column`.
+            BulkUpdateError: If an error occurs while trying to update any of the items, after retrying.
+
+        Example:
+            ```python linenums="1" hl_lines="12 16"
+            import asyncio
+
+            import pandas
+
+            from armis_sdk.clients.assets_client import AssetsClient
+            from armis_sdk.entities.device import Device
+
+
+            async def main():
+                assets_client = AssetsClient()
+
+                await assets_client.update_columns(Device, {"custom.Owner": {1: "Jane", 2: "John", 3: None}})
+
+                owners = pandas.DataFrame({"asset_id": ["1.1.1.1", "2.2.2.2"], "custom.Owner": ["Jane", "John"]})
+                await assets_client.update_columns(Device, owners, asset_id_source="IPV4_ADDRESS")
+
+            asyncio.run(main())
+            ```
+        """
+        if isinstance(columns, pandas.DataFrame):
+            columns = pyarrow.Table.from_pandas(columns, preserve_index=False)
+
+        if isinstance(columns, pyarrow.Table):
+            if id_column not in columns.column_names:
+                raise ArmisError(f"The table doesn't have an {id_column!r} column")
+            fields = [name for name in columns.column_names if name != id_column]
+            items: Iterable[dict] = self._iter_table_update_items(
+                columns, fields, id_column, batch_size
+            )
+        else:
+            fields = list(columns)
+            items = (
+                self._create_bulk_update_item(asset_id, field, value)
+                for field, values in columns.items()
+                for asset_id, value in values.items()
+            )
+
+        self._validate_fields(asset_class, fields, allow_model_members=False)
+        if unsupported := [
+            field for field in fields if not self._is_custom_field(field)
+        ]:
+            raise ArmisError(
+                f"Updating the field {unsupported[0]!r} is currently not supported"
+            )
+
+        await self._bulk_update_stream(
+            asset_class, items, asset_id_source, batch_size, retry
+        )
+
+    async def update_changed(
+        self,
+        assets: list[AssetT],
+        asset_id_source: AssetIdSource = "ASSET_ID",
+        batch_size: int = BULK_UPDATE_BATCH_SIZE,
+        retry: Optional[BulkUpdateRetry] = None,
+    ) -> None:
+        # pylint: disable=line-too-long
+        """Bulk update only the custom properties that changed since the assets were fetched.
+
+        The changes are determined by [Asset.changed_fields][armis_sdk.entities.asset.Asset.changed_fields].
+        Assets without changes are skipped entirely, and assets that were updated
+        successfully are marked as clean, so calling this method again sends nothing.
+        Integration properties are read-only and are never sent.
+
+        Args:
+            assets: A list of assets. Items must inherit from [Asset][armis_sdk.entities.asset.Asset].
+            asset_id_source: From where on the asset to take the unique identifier.
+            batch_size: The maximal number of items sent in each request.
+            retry: How to retry items that failed with a retryable status. Defaults to [BulkUpdateRetry()][armis_sdk.core.bulk_update_retry.BulkUpdateRetry].
+
+        Raises:
+            BulkUpdateError: If an error occurs while trying to update any of the items, after retrying.
+
+        Example:
+            ```python linenums="1" hl_lines="14"
+            import asyncio
+            import datetime
+
+            from armis_sdk.clients.assets_client import AssetsClient
+            from armis_sdk.entities.device import Device
+
+
+            async def main():
+                assets_client = AssetsClient()
+                devices = [device async for device in assets_client.list_by_last_seen(Device, datetime.timedelta(days=1))]
+                for device in devices:
+                    device.custom["MyField"] = "Hello, World"
+
+                await assets_client.update_changed(devices)
+
+            asyncio.run(main())
+            ```
+        """
+        self._validate_asset_class(assets)
+
+        changed = []
+        for index, asset in enumerate(assets):
+            if fields := [
+                field
+                for field in asset.changed_fields()
+                if self._is_custom_field(field)
+            ]:
+                asset_id = self._get_asset_id(asset, index, asset_id_source)
+                changed.append((asset, asset_id, fields))
+
+        if not changed:
+            return
+
+        updates = (
+            (asset_id, field, asset.custom.get(field.split(".", 1)[1]))
+            for asset, asset_id, fields in changed
+            for field in fields
+        )
+        try:
+            await self.update_stream(
+                type(assets[0]),
+                updates,
+                asset_id_source=asset_id_source,
+                batch_size=batch_size,
+                retry=retry,
+            )
+        except BulkUpdateError as error:
+            failed = {item.request["asset_id"] for item in error.items}
+            for asset, asset_id, _ in changed:
+                if asset_id not in failed:
+                    asset.mark_clean()
+            raise
+
+        for asset, _, _ in changed:
+            asset.mark_clean()
+
+    async def _bulk_update_stream(
+        self,
+        asset_class: Type[AssetT],
+        items: Union[Iterable[dict], AsyncIterable[dict]],
+        asset_id_source: AssetIdSource,
+        batch_size: int,
+        retry: Optional[BulkUpdateRetry],
+    ) -> None:
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        errors = []
+        offset = 0
+        async for batch in async_utils.batched(items, batch_size):
+            errors.extend(
+                await self._bulk_update(
+                    asset_class, batch, asset_id_source, offset=offset, retry=retry
+                )
+            )
+            offset += len(batch)
+
+        if errors:
+            raise BulkUpdateError(errors)
+
+    async def _bulk_update(
+        self,
+        asset_class: Type[AssetT],
+        items: list[dict],
+        asset_id_source: AssetIdSource,
+        offset: int = 0,
+        retry: Optional[BulkUpdateRetry] = None,
+    ) -> list[BulkUpdateItemError]:
+        # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        if self.field_schema is not None:
+            await self.field_schema.validate_updates(
+                asset_class,
+                ((item["key"], item.get("value")) for item in items),
+                offset=offset,
+            )
+
+        retry = retry or BulkUpdateRetry()
+        errors = []
+        pending = list(enumerate(items, start=offset))
+        attempt = 0
         async with self._armis_client.client() as client:
-            response = await client.post("/v3/assets/_bulk", json=payload)
-            data = response_utils.get_data_dict(response)
-            errors = [
-                BulkUpdateItemError(index=index, request=items[index], response=item)
-                for index, item in enumerate(data["items"])
-                if item["status"] != 202
-            ]
-            if errors:
-                raise BulkUpdateError(errors)
+            while pending:
+                if attempt:
+                    await asyncio.sleep(retry.get_backoff_time(attempt))
+
+                payload = {
+                    "items": [item for _, item in pending],
+                    "asset_type": asset_class.asset_type,
+                    "asset_id_source": asset_id_source,
+                }
+                response = await client.post("/v3/assets/_bulk", json=payload)
+                data = response_utils.get_data_dict(response)
+                retryable = []
+                for (index, item), result in zip(pending, data["items"]):
+                    if result["status"] == 202:
+                        continue
+
+                    if attempt < retry.total and retry.is_retryable(result["status"]):
+                        retryable.append((index, item))
+                    else:
+                        errors.append(
+                            BulkUpdateItemError(
+                                index=index, request=item, response=result
+                            )
+                        )
+
+                pending = retryable
+                attempt += 1
+
+        return sorted(errors, key=lambda error: error.index)
+
+    async def _iter_bulk_update_items(
+        self,
+        asset_class: Type[AssetT],
+        updates: Union[
+            Iterable[Union[AssetT, AssetUpdate]],
+            AsyncIterable[Union[AssetT, AssetUpdate]],
+        ],
+        fields: list[str],
+        asset_id_source: AssetIdSource,
+    ) -> AsyncIterator[dict]:
+        index = 0
+        async for update in async_utils.to_async_iterator(updates):
+            if isinstance(update, LazyAsset):
+                update = update.load()
+
+            if isinstance(update, tuple):
+                asset_id, field, value = update
+                yield self._create_bulk_update_item(asset_id, field, value)
+            elif type(update) is asset_class:  # pylint: disable=unidiomatic-typecheck
+                if not fields:
+                    raise ArmisError("Updating assets requires a list of fields")
+                asset_id = self._get_asset_id(update, index, asset_id_source)
+                for field in fields:
+                    yield self._create_bulk_update_request(update, asset_id, field)
+            else:
+                raise ArmisError(
+                    f"Item at index {index} is neither a {asset_class.__name__!r} "
+                    f"nor an (asset_id, field, value) tuple"
+                )
+            index += 1
+
+    @classmethod
+    def _iter_table_update_items(
+        cls,
+        table: pyarrow.Table,
+        fields: list[str],
+        id_column: str,
+        batch_size: int,
+    ) -> Iterator[dict]:
+        for batch in table.to_batches(max_chunksize=batch_size):
+            asset_ids = batch.column(id_column).to_pylist()
+            for field in fields:
+                column = batch.column(field)
+                is_set = _get_set_mask(column).to_pylist()
+                for asset_id, value, set_ in zip(asset_ids, column.to_pylist(), is_set):
+                    if set_:
+                        yield {
+                            "asset_id": asset_id,
+                            "key": field,
+                            "operation": "SET",
+                            "value": value,
+                        }
+                    else:
+                        yield {"asset_id": asset_id, "key": field, "operation": "UNSET"}
 
     @classmethod
     def _create_bulk_update_request(
@@ -247,17 +980,29 @@ class AssetsClient(BaseEntityClient):  # pylint: disable=too-few-public-methods
         asset_id: Union[str, int],
         field: str,
     ):
-        request = {"asset_id": asset_id, "key": field}
+        value = None
         if cls._is_custom_field(field):
-            key = field.split(".", 1)[1]
-            if value := asset.custom.get(key):
-                request["operation"] = "SET"
-                request["value"] = value
-            else:
-                request["operation"] = "UNSET"
-        else:
+            value = asset.custom.get(field.split(".", 1)[1])
+
+        return cls._create_bulk_update_item(asset_id, field, value)
+
+    @classmethod
+    def _create_bulk_update_item(
+        cls,
+        asset_id: Union[str, int],
+        field: str,
+        value: Any,
+    ) -> dict:
+        if not cls._is_custom_field(field):
             raise ArmisError(f"Updating the field {field!r} is currently not supported")
 
+        request = {"asset_id": asset_id, "key": field}
+        if value:
+            request["operation"] = "SET"
+            request["value"] = value
+        else:
+            request["operation"] = "UNSET"
+
         return request
 
     @classmethod
@@ -267,7 +1012,8 @@ class AssetsClient(BaseEntityClient):  # pylint: disable=too-few-public-methods
         index: int,
         asset_id_source: AssetIdSource,
     ) -> Union[str, int]:
-        if isinstance(asset, Device):
+        # Projections of devices aren't subclasses of Device, but have the same asset type.
+        if getattr(asset, "asset_type", None) == Device.asset_type:
             return cls._get_device_asset_id(asset, index, asset_id_source)
 
         raise ArmisError(f"Can't get {asset_id_source} of asset {asset!r}")
@@ -275,42 +1021,46 @@ class AssetsClient(BaseEntityClient):  # pylint: disable=too-few-public-methods
     @classmethod
     def _get_device_asset_id(
         cls,
-        device: Device,
+        device: Asset,
         index: int,
         asset_id_source: AssetIdSource,
     ):
         if asset_id_source == "ASSET_ID":
-            if device.device_id is None:
+            if (device_id := getattr(device, "device_id", None)) is None:
                 raise ArmisError(f"Device at index {index} doesn't have a device id")
-            return device.device_id
+            return device_id
 
         if asset_id_source == "MAC_ADDRESS":
-            if device.mac_addresses is None or len(device.mac_addresses) != 1:
+            mac_addresses = getattr(device, "mac_addresses", None)
+            if mac_addresses is None or len(mac_addresses) != 1:
                 raise ArmisError(
                     f"Device at index {index} doesn't have exactly one mac address"
                 )
-            return device.mac_addresses[0]
+            return mac_addresses[0]
 
         if asset_id_source == "IPV4_ADDRESS":
-            if device.ipv4_addresses is None or len(device.ipv4_addresses) != 1:
+            ipv4_addresses = getattr(device, "ipv4_addresses", None)
+            if ipv4_addresses is None or len(ipv4_addresses) != 1:
                 raise ArmisError(
                     f"Device at index {index} doesn't have exactly one IPv4 address"
                 )
-            return device.ipv4_addresses[0]
+            return ipv4_addresses[0]
 
         if asset_id_source == "IPV6_ADDRESS":
-            if device.ipv6_addresses is None or len(device.ipv6_addresses) != 1:
+            ipv6_addresses = getattr(device, "ipv6_addresses", None)
+            if ipv6_addresses is None or len(ipv6_addresses) != 1:
                 raise ArmisError(
                     f"Device at index {index} doesn't have exactly one IPv6 address"
                 )
-            return device.ipv6_addresses[0]
+            return ipv6_addresses[0]
 
         if asset_id_source == "SERIAL_NUMBER":
-            if device.serial_numbers is None or len(device.serial_numbers) != 1:
+            serial_numbers = getattr(device, "serial_numbers", None)
+            if serial_numbers is None or len(serial_numbers) != 1:
                 raise ArmisError(
                     f"Device at index {index} doesn't have exactly one serial number"
                 )
-            return device.serial_numbers[0]
+            return serial_numbers[0]
 
         raise ArmisError(f"Can't get {asset_id_source!r} of device at index {index}")
 
@@ -322,23 +1072,126 @@ class AssetsClient(BaseEntityClient):  # pylint: disable=too-few-public-methods
     def _is_integration_field(cls, field: str) -> bool:
         return field.startswith("integration.")
 
-    async def _list_assets(
-        self,
+    @classmethod
+    def _get_last_seen_filter(
+        cls, last_seen: Union[datetime.datetime, datetime.timedelta]
+    ) -> dict[str, Union[str, int]]:
+        filter_: dict[str, Union[str, int]] = {"filter_criteria": "LAST_SEEN"}
+
+        if isinstance(last_seen, datetime.datetime):
+            filter_["last_seen_ge"] = last_seen.isoformat()
+        elif isinstance(last_seen, datetime.timedelta):
+            filter_["last_seen_seconds"] = int(last_seen.total_seconds())
+        else:
+            raise ArmisError(f"Invalid 'last_seen' type {type(last_seen)}")
+
+        return filter_
+
+    @classmethod
+    def _get_search_body(
+        cls,
         asset_class: Type[AssetT],
         fields: Optional[list[str]],
         filter_: dict,
-    ) -> AsyncIterator[AssetT]:
+    ) -> dict:
         fields = fields or sorted(asset_class.all_fields())
 
-        self._validate_fields(asset_class, fields)
+        cls._validate_fields(asset_class, fields)
 
-        body = {
+        return {
             "asset_type": asset_class.asset_type,
             "fields": fields,
             "filter": filter_,
         }
-        async for item in self._armis_client.list("/v3/assets/_search", body=body):
-            yield asset_class.from_search_result(item)
+
+    async def _get_validated_search_body(
+        self,
+        asset_class: Type[AssetT],
+        fields: Optional[list[str]],
+        filter_: dict,
+    ) -> dict:
+        body = self._get_search_body(asset_class, fields, filter_)
+        if self.field_schema is not None:
+            await self.field_schema.validate_fields(asset_class, body["fields"])
+
+        return body
+
+    async def _list_assets(
+        self,
+        asset_class: Type[AssetT],
+        fields: Optional[list[str]],
+        filter_: dict,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> AsyncIterator[AssetT]:
+        if self.decoder_pool is not None:
+            async for page in self._decode_pages_in_pool(
+                self.decoder_pool, asset_class, fields, filter_, client, records=False
+            ):
+                for item in page:
+                    yield item
+            return
+
+        body = await self._get_validated_search_body(asset_class, fields, filter_)
+        decoder = AssetDecoder.for_class(asset_class)
+        decode_page = (
+            decoder.decode_page_lazy if self.lazy_nested_fields else decoder.decode_page
+        )
+        async for items in self._armis_client.list_pages(
+            "/v3/assets/_search", body=body, client=client
+        ):
+            for item in decode_page(items, interner=self.interner):
+                yield item  # type: ignore[misc]
+
+    async def _list_records(
+        self,
+        asset_class: Type[AssetT],
+        fields: Optional[list[str]],
+        filter_: dict,
+    ) -> AsyncIterator[Record]:
+        if self.decoder_pool is not None:
+            # Records are converted in the pool too, as they're cheaper to send back.
+            async for page in self._decode_pages_in_pool(
+                self.decoder_pool, asset_class, fields, filter_, None, records=True
+            ):
+                for record in page:
+                    yield record
+            return
+
+        record_class = Record.for_model(asset_class)
+        async for asset in self._list_assets(asset_class, fields, filter_):
+            yield record_class.from_model(asset)
+
+    async def _decode_pages_in_pool(
+        self,
+        decoder_pool: DecoderPool,
+        asset_class: Type[AssetT],
+        fields: Optional[list[str]],
+        filter_: dict,
+        client: Optional[httpx.AsyncClient],
+        records: bool,
+    ) -> AsyncIterator[list]:
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        body = await self._get_validated_search_body(asset_class, fields, filter_)
+        contents = self._armis_client.list_page_contents(
+            "/v3/assets/_search", body=body, client=client
+        )
+        async for page in decoder_pool.decode_pages(
+            asset_class, contents, records=records
+        ):
+            yield page
+
+    async def _list_batches(
+        self,
+        asset_class: Type[AssetT],
+        fields: Optional[list[str]],
+        filter_: dict,
+    ) -> AsyncIterator[pyarrow.RecordBatch]:
+        body = await self._get_validated_search_body(asset_class, fields, filter_)
+        decoder = ArrowDecoder.for_fields(asset_class, body["fields"])
+        async for items in self._armis_client.list_pages(
+            "/v3/assets/_search", body=body
+        ):
+            yield decoder.decode_page(items)
 
     @classmethod
     def _validate_asset_class(cls, assets: list[AssetT]):
@@ -376,3 +1229,24 @@ class AssetsClient(BaseEntityClient):  # pylint: disable=too-few-public-methods
             raise ArmisError(
                 f"The following fields are not supported with this operation: {fields_str}"
             )
+
+
+def _get_set_mask(column: pyarrow.Array) -> pyarrow.BooleanArray:
+    """Which values of a column are set, matching the truthiness check of single updates."""
+    # pylint: disable=no-member
+    if pyarrow.types.is_boolean(column.type):
+        truthy = column
+    elif pyarrow.types.is_string(column.type) or pyarrow.types.is_large_string(
+        column.type
+    ):
+        truthy = pyarrow.compute.greater(pyarrow.compute.utf8_length(column), 0)
+    elif pyarrow.types.is_integer(column.type) or pyarrow.types.is_floating(
+        column.type
+    ):
+        truthy = pyarrow.compute.not_equal(column, 0)
+    elif pyarrow.types.is_list(column.type):
+        truthy = pyarrow.compute.greater(pyarrow.compute.list_value_length(column), 0)
+    else:
+        truthy = pyarrow.compute.is_valid(column)
+
+    return pyarrow.compute.fill_null(truthy, False)
@@ -0,0 +1,267 @@
+import asyncio
+import collections
+import dataclasses
+import time
+from typing import Iterable
+from typing import NamedTuple
+from typing import Optional
+from typing import Union
+
+from armis_sdk.clients.assets_client import AssetsClient
+from armis_sdk.core.device_index import ADDRESS_ATTRIBUTES
+from armis_sdk.core.device_index import DeviceIndex
+from armis_sdk.entities.device import Device
+from armis_sdk.types.asset_id_source import AssetIdSource
+
+CACHE_MAX_SIZE = 10_000
+CACHE_TTL = 60.0
+CACHE_STALE_TTL = 300.0
+CACHE_NEGATIVE_TTL = 30.0
+CACHE_MAX_BATCH_SIZE = 1000
+
+AssetId = Union[int, str]
+
+
+class CacheKey(NamedTuple):
+    asset_type: str
+    asset_id_source: AssetIdSource
+    asset_id: AssetId
+    fields: Optional[tuple[str, ...]]
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """Counters of a [DeviceCache][armis_sdk.clients.device_cache.DeviceCache]."""
+
+    hits: int = 0
+    """Lookups answered by a fresh entry (including cached "not found" entries)."""
+
+    stale_hits: int = 0
+    """Lookups answered by an expired entry, while it's refreshed in the background."""
+
+    misses: int = 0
+    """Lookups that had to wait for a request."""
+
+    evictions: int = 0
+    """Entries that were removed to keep the cache within its maximal size."""
+
+    refreshes: int = 0
+    """Background refreshes of stale entries."""
+
+
+@dataclasses.dataclass
+class _Entry:
+    device: Optional[Device]
+    expires_at: float
+    stale_until: float
+
+
+class DeviceCache:
+    # pylint: disable=line-too-long,too-many-instance-attributes
+    """
+    A read-through cache of devices, on top of
+    [list_by_asset_id][armis_sdk.clients.assets_client.AssetsClient.list_by_asset_id].
+
+    Entries are keyed by `(asset_type, asset_id_source, asset_id, fields)` and are:
+
+    1. Fresh for `ttl` seconds, and served without a request.
+    2. Stale for `stale_ttl` seconds after that. Stale entries are still served, while
+       a background request refreshes them (stale-while-revalidate).
+    3. Expired afterwards, so the next lookup waits for a request.
+
+    Identifiers that don't match any device are cached as `None` for `negative_ttl` seconds.
+    The cache holds at most `max_size` entries, evicting the least recently used ones.
+    Misses of the same lookup are batched into a single request, and concurrent misses
+    of the same key share a single request.
+
+    Example:
+        ```python linenums="1" hl_lines="9 10"
+        import asyncio
+
+        from armis_sdk.clients.assets_client import AssetsClient
+        from armis_sdk.clients.device_cache import DeviceCache
+
+
+        async def main():
+            cache = DeviceCache(AssetsClient(), ttl=60)
+            device = await cache.get(1)
+            devices = await cache.get_many(["1.1.1.1", "2.2.2.2"], "IPV4_ADDRESS")
+            print(cache.stats)
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        assets_client: AssetsClient,
+        ttl: float = CACHE_TTL,
+        stale_ttl: float = CACHE_STALE_TTL,
+        negative_ttl: float = CACHE_NEGATIVE_TTL,
+        max_size: int = CACHE_MAX_SIZE,
+    ):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self.stats = CacheStats()
+        self._assets_client = assets_client
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._negative_ttl = negative_ttl
+        self._max_size = max_size
+        self._entries: collections.OrderedDict[CacheKey, _Entry] = (
+            collections.OrderedDict()
+        )
+        self._inflight: dict[CacheKey, asyncio.Future] = {}
+        self._refreshing: set[CacheKey] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all the entries."""
+        self._entries.clear()
+
+    async def get(
+        self,
+        asset_id: AssetId,
+        asset_id_source: AssetIdSource = "ASSET_ID",
+        fields: Optional[list[str]] = None,
+    ) -> Optional[Device]:
+        """Get a single device.
+
+        Args:
+            asset_id: The identifier of the device.
+            asset_id_source: The type of the identifier.
+            fields: Optional list of fields to retrieve. If None, all non-custom fields are retrieved.
+
+        Returns:
+            The device, or `None` if no device matches the identifier.
+        """
+        (device,) = await self.get_many([asset_id], asset_id_source, fields)
+        return device
+
+    async def get_many(
+        self,
+        asset_ids: Iterable[AssetId],
+        asset_id_source: AssetIdSource = "ASSET_ID",
+        fields: Optional[list[str]] = None,
+    ) -> list[Optional[Device]]:
+        """Get several devices, fetching all the missing ones together.
+
+        Args:
+            asset_ids: The identifiers of the devices.
+            asset_id_source: The type of the identifiers.
+            fields: Optional list of fields to retrieve. If None, all non-custom fields are retrieved.
+
+        Returns:
+            The devices, in the order of `asset_ids`, with `None` for identifiers that don't match any device.
+        """
+        fields_key = tuple(fields) if fields is not None else None
+        keys = [
+            CacheKey(Device.asset_type, asset_id_source, asset_id, fields_key)
+            for asset_id in asset_ids
+        ]
+        now = time.monotonic()
+        results: dict[CacheKey, Optional[Device]] = {}
+        waiting: dict[CacheKey, asyncio.Future] = {}
+        missing: list[CacheKey] = []
+        stale: list[CacheKey] = []
+        for key in dict.fromkeys(keys):
+
+            entry = self._entries.get(key)
+            if entry is not None and now < entry.stale_until:
+                self._entries.move_to_end(key)
+                results[key] = entry.device
+                if now < entry.expires_at:
+                    self.stats.hits += 1
+                else:
+                    self.stats.stale_hits += 1
+                    stale.append(key)
+            elif (future := self._inflight.get(key)) is not None:
+                self.stats.misses += 1
+                waiting[key] = future
+            else:
+                self.stats.misses += 1
+                missing.append(key)
+
+        if stale:
+            self._refresh(stale)
+
+        if missing:
+            future = asyncio.ensure_future(self._fetch(missing))
+            for key in missing:
+                self._inflight[key] = future
+                waiting[key] = future
+
+        for key, future in waiting.items():
+            results[key] = (await asyncio.shield(future))[key]
+
+        return [results[key] for key in keys]
+
+    async def _fetch(self, keys: list[CacheKey]) -> dict[CacheKey, Optional[Device]]:
+        try:
+            results = {}
+            for start in range(0, len(keys), CACHE_MAX_BATCH_SIZE):
+                batch = keys[start : start + CACHE_MAX_BATCH_SIZE]
+                results.update(await self._fetch_batch(batch))
+            return results
+        finally:
+            for key in keys:
+                self._inflight.pop(key, None)
+
+    async def _fetch_batch(
+        self, keys: list[CacheKey]
+    ) -> dict[CacheKey, Optional[Device]]:
+        _, asset_id_source, _, fields = keys[0]
+        if fields is not None:
+            required = ["device_id", ADDRESS_ATTRIBUTES.get(asset_id_source)]
+            fields = (
+                *fields,
+                *(field for field in required if field and field not in fields),
+            )
+
+        index = DeviceIndex()
+        await index.ingest(
+            self._assets_client.list_by_asset_id(
+                Device,
+                [key.asset_id for key in keys],  # type: ignore[misc]
+                asset_id_source=asset_id_source,
+                fields=list(fields) if fields is not None else None,
+            )
+        )
+
+        now = time.monotonic()
+        results = {}
+        for key in keys:
+            devices = index.find(key.asset_id, asset_id_source)
+            results[key] = device = devices[0] if devices else None
+            ttl = self._ttl if device is not None else self._negative_ttl
+            self._entries[key] = _Entry(device, now + ttl, now + ttl + self._stale_ttl)
+            self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+        return results
+
+    def _refresh(self, keys: list[CacheKey]):
+        keys = [key for key in keys if key not in self._refreshing]
+        if not keys:
+            return
+
+        self.stats.refreshes += 1
+        self._refreshing.update(keys)
+
+        async def refresh():
+            try:
+                await self._fetch(keys)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # The stale entries are kept until they expire, the next lookup will retry.
+                pass
+            finally:
+                self._refreshing.difference_update(keys)
+
+        task = asyncio.ensure_future(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
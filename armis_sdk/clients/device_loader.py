@@ -0,0 +1,172 @@
+import asyncio
+from typing import Iterable
+from typing import Optional
+from typing import Union
+
+from armis_sdk.clients.assets_client import AssetsClient
+from armis_sdk.core.device_index import ADDRESS_ATTRIBUTES
+from armis_sdk.core.device_index import DeviceIndex
+from armis_sdk.entities.device import Device
+from armis_sdk.types.asset_id_source import AssetIdSource
+
+LOADER_MAX_BATCH_SIZE = 1000
+
+AssetId = Union[int, str]
+
+
+class DeviceLoader:
+    # pylint: disable=line-too-long,too-many-instance-attributes
+    """
+    Batches single-device lookups into as few requests as possible.
+
+    All the calls to [load][armis_sdk.clients.device_loader.DeviceLoader.load] that are made
+    within the same iteration of the event loop (or within `batch_window` seconds of the first
+    one) are sent as a single [list_by_asset_id][armis_sdk.clients.assets_client.AssetsClient.list_by_asset_id]
+    request per `asset_id_source`, and each caller gets the device it asked for.
+
+    Results are memoized for the lifetime of the loader, so create a loader per unit of work
+    (e.g. per incoming request) or call [clear][armis_sdk.clients.device_loader.DeviceLoader.clear].
+    Failed lookups are not memoized.
+
+    Example:
+        ```python linenums="1" hl_lines="11-15"
+        import asyncio
+
+        from armis_sdk.clients.assets_client import AssetsClient
+        from armis_sdk.clients.device_loader import DeviceLoader
+
+
+        async def main():
+            loader = DeviceLoader(AssetsClient())
+
+            # A single request is sent for each asset id source.
+            device1, device2, device3 = await asyncio.gather(
+                loader.load(1),
+                loader.load(2),
+                loader.load("1.2.3.4", "IPV4_ADDRESS"),
+            )
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        assets_client: AssetsClient,
+        fields: Optional[list[str]] = None,
+        batch_window: float = 0,
+        max_batch_size: int = LOADER_MAX_BATCH_SIZE,
+    ):
+        self._assets_client = assets_client
+        self._fields = fields
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._memo: dict[tuple[AssetIdSource, AssetId], asyncio.Future] = {}
+        self._pending: dict[AssetIdSource, dict[AssetId, asyncio.Future]] = {}
+        self._dispatch_scheduled = False
+        self._tasks: set[asyncio.Task] = set()
+
+    def clear(self):
+        """Forget all the memoized results."""
+        self._memo.clear()
+
+    async def load(
+        self,
+        asset_id: AssetId,
+        asset_id_source: AssetIdSource = "ASSET_ID",
+    ) -> Optional[Device]:
+        """Load a single device.
+
+        Args:
+            asset_id: The identifier of the device.
+            asset_id_source: The type of the identifier.
+
+        Returns:
+            The device, or `None` if no device matches the identifier.
+            If several devices match (e.g. a shared IP address), the one with the lowest `device_id` is returned.
+        """
+        key = (asset_id_source, asset_id)
+        if (future := self._memo.get(key)) is None:
+            future = asyncio.get_running_loop().create_future()
+            self._memo[key] = future
+            self._pending.setdefault(asset_id_source, {})[asset_id] = future
+            self._schedule_dispatch()
+
+        return await asyncio.shield(future)
+
+    async def load_many(
+        self,
+        asset_ids: Iterable[AssetId],
+        asset_id_source: AssetIdSource = "ASSET_ID",
+    ) -> list[Optional[Device]]:
+        """Load several devices, see [load][armis_sdk.clients.device_loader.DeviceLoader.load]."""
+        return list(
+            await asyncio.gather(
+                *(self.load(asset_id, asset_id_source) for asset_id in asset_ids)
+            )
+        )
+
+    def _schedule_dispatch(self):
+        if self._dispatch_scheduled:
+            return
+
+        self._dispatch_scheduled = True
+        loop = asyncio.get_running_loop()
+        if self._batch_window > 0:
+            loop.call_later(self._batch_window, self._dispatch)
+        else:
+            loop.call_soon(self._dispatch)
+
+    def _dispatch(self):
+        pending, self._pending = self._pending, {}
+        self._dispatch_scheduled = False
+        for asset_id_source, futures in pending.items():
+            asset_ids = list(futures)
+            for start in range(0, len(asset_ids), self._max_batch_size):
+                batch = {
+                    asset_id: futures[asset_id]
+                    for asset_id in asset_ids[start : start + self._max_batch_size]
+                }
+                task = asyncio.ensure_future(self._fetch(asset_id_source, batch))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(
+        self,
+        asset_id_source: AssetIdSource,
+        futures: dict[AssetId, asyncio.Future],
+    ):
+        try:
+            index = DeviceIndex()
+            await index.ingest(
+                self._assets_client.list_by_asset_id(
+                    Device,
+                    list(futures),  # type: ignore[arg-type]
+                    asset_id_source=asset_id_source,
+                    fields=self._get_fields(asset_id_source),
+                )
+            )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            for asset_id, future in futures.items():
+                self._memo.pop((asset_id_source, asset_id), None)
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for asset_id, future in futures.items():
+            if not future.done():
+                devices = index.find(asset_id, asset_id_source)
+                future.set_result(devices[0] if devices else None)
+
+    def _get_fields(self, asset_id_source: AssetIdSource) -> Optional[list[str]]:
+        if self._fields is None:
+            return None
+
+        required = ["device_id"]
+        if attribute := ADDRESS_ATTRIBUTES.get(asset_id_source):
+            required.append(attribute)
+
+        return [
+            *self._fields,
+            *(field for field in required if field not in self._fields),
+        ]
@@ -1,13 +1,62 @@
+import asyncio
+import dataclasses
+import time
+from typing import Any
 from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Iterable
 from typing import List
+from typing import Literal
+from typing import Optional
 
+import httpx
 import universalasync
 
 from armis_sdk.core import response_utils
+from armis_sdk.core.armis_client import ArmisClient
 from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.core.armis_error import BulkSiteError
+from armis_sdk.core.armis_error import BulkSiteItemError
 from armis_sdk.core.base_entity_client import BaseEntityClient
+from armis_sdk.core.site_tree import SiteTree
 from armis_sdk.entities.site import Site
 
+SITE_BULK_CONCURRENCY = 10
+SITE_TREE_TTL = 300.0
+
+BulkSiteOperation = Callable[[httpx.AsyncClient, int, list], Awaitable[Any]]
+SiteKey = Literal["id", "name"]
+PLAN_IGNORED_FIELDS = {"children", "id", "lat", "lng"}
+
+
+@dataclasses.dataclass
+class SitePlan:
+    # pylint: disable=line-too-long
+    """
+    The changes that bring the tenant's sites to a desired state, computed by
+    [plan][armis_sdk.clients.sites_client.SitesClient.plan] and executed by
+    [apply][armis_sdk.clients.sites_client.SitesClient.apply].
+    """
+
+    creates: List[Site] = dataclasses.field(default_factory=list)
+    """The sites to create. New sites under other new sites are nested in their `children`."""
+
+    updates: List[Site] = dataclasses.field(default_factory=list)
+    """The sites to update, each with its `id` and only the fields that changed."""
+
+    deletes: List[Site] = dataclasses.field(default_factory=list)
+    """The existing sites to delete."""
+
+    reparents: dict[int, int] = dataclasses.field(default_factory=dict)
+    """
+    Updated sites that move under a new site, from the id of the updated site to the index of the new site
+    in the depth-first order of `creates`. Their `parent_id` is set once the new site was created.
+    """
+
+    def __bool__(self) -> bool:
+        return bool(self.creates or self.updates or self.deletes)
+
 
 @universalasync.wrap
 class SitesClient(BaseEntityClient):
@@ -16,8 +65,58 @@ class SitesClient(BaseEntityClient):
     A client for interacting with sites.
 
     The primary entity for this client is [Site][armis_sdk.entities.site.Site].
+
+    The [SiteTree][armis_sdk.core.site_tree.SiteTree] returned by `tree()` is cached for
+    `tree_ttl` seconds. Sites created, updated and deleted through the client are applied
+    to the cached tree, so it doesn't need to be listed again.
+
+    The `create_many`, `update_many` and `delete_many` methods handle many sites concurrently,
+    over a single connection pool, in an order that respects their parent-child relationships.
     """
 
+    def __init__(
+        self,
+        armis_client: Optional[ArmisClient] = None,
+        tree_ttl: float = SITE_TREE_TTL,
+    ) -> None:
+        super().__init__(armis_client)
+        self._tree_ttl = tree_ttl
+        self._tree: Optional[SiteTree] = None
+        self._tree_expires_at = 0.0
+
+    async def apply(self, plan: SitePlan, concurrency: int = SITE_BULK_CONCURRENCY):
+        """Execute a plan computed by [plan][armis_sdk.clients.sites_client.SitesClient.plan].
+
+        The sites are created first, then updated (so sites can move under new sites, and away from
+        sites that are about to be deleted), then deleted, each step using the bulk methods.
+
+        Args:
+            plan: The plan to execute.
+            concurrency: The maximum number of sites being processed at once.
+
+        Raises:
+            BulkSiteError: If any of the sites of a step failed. The following steps aren't executed.
+        """
+        created: List[Site] = []
+        if plan.creates:
+            created = await self.create_many(plan.creates, concurrency)
+
+        updates = [
+            (
+                site.model_copy(
+                    update={"parent_id": created[plan.reparents[site.id]].id}
+                )
+                if site.id in plan.reparents
+                else site
+            )
+            for site in plan.updates
+        ]
+        if updates:
+            await self.update_many(updates, concurrency)
+
+        if plan.deletes:
+            await self.delete_many(plan.deletes, concurrency)
+
     async def create(self, site: Site) -> Site:
         """Create a `Site`.
 
@@ -48,23 +147,60 @@ class SitesClient(BaseEntityClient):
             Site(id=1, name="my site")
             ```
         """
-        if site.id is not None:
-            raise ArmisError(
-                "Can't create a site that already has an id. "
-                "Did you mean to call `.update(site)`?"
-            )
+        async with self._armis_client.client() as client:
+            return await self._create(client, site)
 
-        if not site.name:
-            raise ArmisError("Can't create a site without a name.")
+    async def create_many(
+        self, sites: Iterable[Site], concurrency: int = SITE_BULK_CONCURRENCY
+    ) -> List[Site]:
+        """Create many sites concurrently, parents before their children.
 
-        payload = site.model_dump(
-            exclude={"children"},
-            exclude_none=True,
+        The sites to create can be nested in the `children` of other sites, like the result of
+        [hierarchy][armis_sdk.clients.sites_client.SitesClient.hierarchy]. Each site is created as soon
+        as its parent was, with the parent's new id as its `parent_id`. Top-level sites keep their `parent_id`.
+
+        Args:
+            sites: The sites to create, possibly with nested `children` to create under them.
+            concurrency: The maximum number of sites being created at once.
+
+        Returns:
+            The created sites, in depth-first order of the input (each site followed by its children).
+
+        Raises:
+            BulkSiteError: If any of the sites failed to be created. The children of a site that
+                failed aren't created, and are reported as failed too.
+
+        Example:
+            ```python linenums="1" hl_lines="10"
+            import asyncio
+
+            from armis_sdk.clients.sites_client import SitesClient
+            from armis_sdk.entities.site import Site
+
+
+            async def main():
+                sites_client = SitesClient()
+                region = Site(name="EMEA", children=[Site(name="Geneva"), Site(name="Paris")])
+                print(await sites_client.create_many([region]))
+
+            asyncio.run(main())
+            ```
+            Will output:
+            ```python linenums="1"
+            [Site(id=1, name="EMEA"), Site(id=2, name="Geneva", parent_id=1), Site(id=3, name="Paris", parent_id=1)]
+            ```
+        """
+        nodes, parents = _flatten(sites)
+
+        async def create(client: httpx.AsyncClient, index: int, results: List) -> Site:
+            site = nodes[index]
+            if (parent := parents[index]) is not None:
+                site = site.model_copy(update={"parent_id": results[parent].id})
+            return await self._create(client, site)
+
+        return await self._run_bulk(
+            "create", nodes, _get_parent_dependencies(parents), create, concurrency
         )
-        async with self._armis_client.client() as client:
-            response = await client.post("/v3/settings/sites", json=payload)
-            data = response_utils.get_data_dict(response)
-            return Site.model_validate(data)
 
     async def delete(self, site: Site):
         """Delete a `Site`.
@@ -89,12 +225,48 @@ class SitesClient(BaseEntityClient):
             asyncio.run(main())
             ```
         """
-        if site.id is None:
-            raise ArmisError("Can't delete a site without an id.")
-
         async with self._armis_client.client() as client:
-            response = await client.delete(f"/v3/settings/sites/{site.id}")
-            response_utils.raise_for_status(response)
+            await self._delete(client, site)
+
+    async def delete_many(
+        self, sites: Iterable[Site], concurrency: int = SITE_BULK_CONCURRENCY
+    ):
+        """Delete many sites concurrently, children before their parents.
+
+        Sites are deleted leaves first: a site is deleted only after all the sites under it
+        (by `parent_id`, or nested in its `children`) that are also being deleted were.
+
+        Args:
+            sites: The sites to delete, possibly with nested `children` to delete as well.
+            concurrency: The maximum number of sites being deleted at once.
+
+        Raises:
+            BulkSiteError: If any of the sites failed to be deleted. The ancestors of a site that
+                failed aren't deleted, and are reported as failed too.
+
+        Example:
+            ```python linenums="1" hl_lines="9"
+            import asyncio
+
+            from armis_sdk.clients.sites_client import SitesClient
+            from armis_sdk.entities.site import Site
+
+
+            async def main():
+                sites_client = SitesClient()
+                await sites_client.delete_many([Site(id=1), Site(id=2, parent_id=1)])
+
+            asyncio.run(main())
+            ```
+        """
+        nodes, parents = _flatten(sites)
+
+        async def delete(client: httpx.AsyncClient, index: int, _: List) -> None:
+            await self._delete(client, nodes[index])
+
+        await self._run_bulk(
+            "delete", nodes, _get_child_dependencies(parents), delete, concurrency
+        )
 
     async def get(self, site_id: int) -> Site:
         """Get a `Site` by its ID.
@@ -202,6 +374,105 @@ class SitesClient(BaseEntityClient):
         async for item in self._list("/v3/settings/sites", Site):
             yield item
 
+    async def plan(
+        self,
+        sites: Iterable[Site],
+        key: SiteKey = "name",
+        delete_missing: bool = True,
+    ) -> SitePlan:
+        """Compute the changes that bring the tenant's sites to a desired state.
+
+        The existing sites are listed once, and matched to the desired ones by `key`.
+        Desired sites can be nested in the `children` of other desired sites, to place them under them.
+
+        1. Desired sites that don't match an existing site are created.
+        2. Matching sites are updated with only the fields that differ. Fields that are `None`
+           in the desired site are left as they are, like in [update][armis_sdk.clients.sites_client.SitesClient.update].
+        3. If `delete_missing` is set, existing sites that don't match a desired site are deleted,
+           except for the ancestors of sites that are kept (e.g. the existing parent of a desired
+           site that isn't moved), since deleting them would delete those sites as well.
+
+        Listing the sites also refreshes the cached [tree][armis_sdk.clients.sites_client.SitesClient.tree].
+
+        Args:
+            sites: The desired sites.
+            key: The field that identifies a site, `"name"` or `"id"`.
+            delete_missing: Whether to delete the existing sites that aren't desired.
+
+        Returns:
+            The plan, to review and pass to [apply][armis_sdk.clients.sites_client.SitesClient.apply].
+
+        Raises:
+            ArmisError: If the key of a desired site isn't unique, or when matching by `"id"`,
+                if a desired site has an id that doesn't exist.
+
+        Example:
+            ```python linenums="1" hl_lines="10 12"
+            import asyncio
+
+            from armis_sdk.clients.sites_client import SitesClient
+            from armis_sdk.entities.site import Site
+
+
+            async def main():
+                sites_client = SitesClient()
+                desired = [Site(name="EMEA", children=[Site(name="Geneva", tier="Gold")])]
+                plan = await sites_client.plan(desired)
+                print(plan)
+                await sites_client.apply(plan)
+
+            asyncio.run(main())
+            ```
+        """
+        current = [site async for site in self.list()]
+        self._tree = SiteTree(current)
+        self._tree_expires_at = time.monotonic() + self._tree_ttl
+
+        nodes, parents = _flatten(sites)
+        matches = _match_sites(nodes, key, current)
+        plan = _plan_sites(nodes, parents, matches)
+        if delete_missing:
+            plan.deletes = _get_missing_sites(current, matches, plan)
+
+        return plan
+
+    async def tree(self, refresh: bool = False) -> SiteTree:
+        """Get an index of the tenant's site hierarchy.
+
+        The tree is listed once and cached for `tree_ttl` seconds (see [SitesClient][armis_sdk.clients.sites_client.SitesClient]).
+
+        Args:
+            refresh: Whether to list the sites again even if the tree is cached.
+
+        Returns:
+            A [SiteTree][armis_sdk.core.site_tree.SiteTree] of all the sites.
+
+        Example:
+            ```python linenums="1" hl_lines="8"
+            import asyncio
+
+            from armis_sdk.clients.sites_client import SitesClient
+
+
+            async def main():
+                sites_client = SitesClient()
+                tree = await sites_client.tree()
+                print([site.id for site in tree.descendants(1)])
+
+            asyncio.run(main())
+            ```
+            Will output:
+            ```python linenums="1"
+            [3, 4]
+            ```
+        """
+        now = time.monotonic()
+        if refresh or self._tree is None or now >= self._tree_expires_at:
+            self._tree = SiteTree([site async for site in self.list()])
+            self._tree_expires_at = now + self._tree_ttl
+
+        return self._tree
+
     async def update(self, site: Site) -> Site:
         """Update a site's properties.
 
@@ -227,6 +498,145 @@ class SitesClient(BaseEntityClient):
             asyncio.run(main())
             ```
         """
+        async with self._armis_client.client() as client:
+            return await self._update(client, site)
+
+    async def update_many(
+        self, sites: Iterable[Site], concurrency: int = SITE_BULK_CONCURRENCY
+    ) -> List[Site]:
+        """Update many sites concurrently, parents before their children.
+
+        Like [update][armis_sdk.clients.sites_client.SitesClient.update], only the fields that
+        aren't `None` are sent. A site is updated after its parent (by `parent_id`, or the site
+        it's nested in) if the parent is being updated too.
+
+        Args:
+            sites: The sites to update, possibly with nested `children` to update as well.
+            concurrency: The maximum number of sites being updated at once.
+
+        Returns:
+            The updated sites, in depth-first order of the input (each site followed by its children).
+
+        Raises:
+            BulkSiteError: If any of the sites failed to be updated.
+
+        Example:
+            ```python linenums="1" hl_lines="10"
+            import asyncio
+
+            from armis_sdk.clients.sites_client import SitesClient
+            from armis_sdk.entities.site import Site
+
+
+            async def main():
+                sites_client = SitesClient()
+                sites = [Site(id=1, tier="Gold"), Site(id=2, tier="Silver")]
+                await sites_client.update_many(sites)
+
+            asyncio.run(main())
+            ```
+        """
+        nodes, parents = _flatten(sites)
+
+        async def update(client: httpx.AsyncClient, index: int, _: List) -> Site:
+            return await self._update(client, nodes[index])
+
+        return await self._run_bulk(
+            "update",
+            nodes,
+            _get_parent_dependencies(parents),
+            update,
+            concurrency,
+            skip_dependents=False,
+        )
+
+    async def _create(self, client: httpx.AsyncClient, site: Site) -> Site:
+        if site.id is not None:
+            raise ArmisError(
+                "Can't create a site that already has an id. "
+                "Did you mean to call `.update(site)`?"
+            )
+
+        if not site.name:
+            raise ArmisError("Can't create a site without a name.")
+
+        payload = site.model_dump(
+            exclude={"children"},
+            exclude_none=True,
+        )
+        response = await client.post("/v3/settings/sites", json=payload)
+        data = response_utils.get_data_dict(response)
+        created = Site.model_validate(data)
+        if self._tree is not None:
+            self._tree.upsert(created)
+        return created
+
+    async def _delete(self, client: httpx.AsyncClient, site: Site):
+        if site.id is None:
+            raise ArmisError("Can't delete a site without an id.")
+
+        response = await client.delete(f"/v3/settings/sites/{site.id}")
+        response_utils.raise_for_status(response)
+        if self._tree is not None:
+            self._tree.remove(site.id)
+
+    async def _run_bulk(
+        self,
+        operation: str,
+        sites: List[Site],
+        dependencies: List[List[int]],
+        run: BulkSiteOperation,
+        concurrency: int,
+        skip_dependents: bool = True,
+    ) -> List:
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        if concurrency < 1:
+            raise ArmisError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        results: List = [None] * len(sites)
+        errors: dict[int, str] = {}
+        tasks: List[asyncio.Task] = []
+
+        async def run_one(client: httpx.AsyncClient, index: int):
+            # Tasks never raise, failures are recorded in "errors" instead.
+            await asyncio.gather(*(tasks[other] for other in dependencies[index]))
+            if skip_dependents and (
+                failed := [other for other in dependencies[index] if other in errors]
+            ):
+                errors[index] = f"Skipped because the site at index {failed[0]} failed."
+                return
+
+            async with semaphore:
+                try:
+                    results[index] = await run(client, index, results)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    errors[index] = str(error)
+
+        async with self._armis_client.client() as client:
+            # All the tasks exist before any of them starts, so they can wait for each other.
+            tasks.extend(
+                asyncio.create_task(run_one(client, index))
+                for index in range(len(sites))
+            )
+            await asyncio.gather(*tasks)
+
+        if errors:
+            items = [
+                BulkSiteItemError(
+                    index=index,
+                    site=sites[index].model_dump(
+                        exclude={"children"}, exclude_none=True
+                    ),
+                    detail=errors[index],
+                )
+                for index in sorted(errors)
+            ]
+            raise BulkSiteError(operation, items, results)
+
+        return results
+
+    async def _update(self, client: httpx.AsyncClient, site: Site) -> Site:
         if site.id is None:
             raise ArmisError(
                 "Can't update a site without an id. "
@@ -241,7 +651,172 @@ class SitesClient(BaseEntityClient):
         if not data:
             return site
 
-        async with self._armis_client.client() as client:
-            response = await client.patch(f"/v3/settings/sites/{site.id}", json=data)
-            data = response_utils.get_data_dict(response)
-            return Site.model_validate(data)
+        response = await client.patch(f"/v3/settings/sites/{site.id}", json=data)
+        data = response_utils.get_data_dict(response)
+        updated = Site.model_validate(data)
+        if self._tree is not None:
+            self._tree.upsert(updated)
+        return updated
+
+
+def _flatten(sites: Iterable[Site]) -> tuple[list[Site], list[Optional[int]]]:
+    # Sites nested in "children" are listed after their parent, and linked to its index.
+    nodes: list[Site] = []
+    parents: list[Optional[int]] = []
+    stack: list[tuple[Site, Optional[int]]] = [
+        (site, None) for site in reversed(list(sites))
+    ]
+    while stack:
+        site, parent = stack.pop()
+        index = len(nodes)
+        nodes.append(site)
+        parents.append(parent)
+        stack.extend((child, index) for child in reversed(site.children))
+
+    # Top-level sites can also be linked to other sites of the batch by "parent_id".
+    id_to_index = {site.id: index for index, site in enumerate(nodes) if site.id}
+    for index, site in enumerate(nodes):
+        if parents[index] is None and site.parent_id in id_to_index:
+            parents[index] = id_to_index[site.parent_id]
+
+    _check_acyclic(nodes, parents)
+    return nodes, parents
+
+
+def _check_acyclic(nodes: list[Site], parents: list[Optional[int]]):
+    checked: set[int] = set()
+    for index in range(len(nodes)):
+        path: set[int] = set()
+        current: Optional[int] = index
+        while current is not None and current not in checked:
+            if current in path:
+                raise ArmisError(
+                    f"The site at index {current} is its own ancestor "
+                    f"(id {nodes[current].id}, parent_id {nodes[current].parent_id})."
+                )
+            path.add(current)
+            current = parents[current]
+        checked.update(path)
+
+
+def _get_child_dependencies(parents: list[Optional[int]]) -> list[list[int]]:
+    dependencies: list[list[int]] = [[] for _ in parents]
+    for index, parent in enumerate(parents):
+        if parent is not None:
+            dependencies[parent].append(index)
+
+    return dependencies
+
+
+def _get_parent_dependencies(parents: list[Optional[int]]) -> list[list[int]]:
+    return [[parent] if parent is not None else [] for parent in parents]
+
+
+def _get_changes(existing: Site, desired: Site) -> dict[str, Any]:
+    current = existing.model_dump(exclude=PLAN_IGNORED_FIELDS)
+    # Only top-level fields that aren't set are skipped, nested ones (e.g. of the
+    # ASQ rule) are compared as they are.
+    return {
+        name: value
+        for name, value in desired.model_dump(exclude=PLAN_IGNORED_FIELDS).items()
+        if value is not None and current.get(name) != value
+    }
+
+
+def _match_sites(
+    nodes: list[Site], key: SiteKey, current: list[Site]
+) -> list[Optional[Site]]:
+    current_by_key: dict[Any, Site] = {}
+    ambiguous = set()
+    for site in current:
+        if (value := getattr(site, key)) is not None:
+            if value in current_by_key:
+                ambiguous.add(value)
+            current_by_key[value] = site
+
+    matches: list[Optional[Site]] = []
+    seen = set()
+    for node in nodes:
+        value = getattr(node, key)
+        if value is None:
+            matches.append(None)
+            continue
+
+        if value in seen:
+            raise ArmisError(f"More than one desired site has the {key} {value!r}.")
+        if value in ambiguous:
+            raise ArmisError(f"More than one existing site has the {key} {value!r}.")
+        if key == "id" and value not in current_by_key:
+            raise ArmisError(f"Site {value} doesn't exist, so it can't be updated.")
+
+        seen.add(value)
+        matches.append(current_by_key.get(value))
+
+    return matches
+
+
+def _get_missing_sites(
+    current: list[Site], matches: list[Optional[Site]], plan: SitePlan
+) -> list[Site]:
+    # The parent of each existing site once the plan is applied. Sites that are moved under
+    # a created site are no longer under any existing site.
+    parent_ids = {site.id: site.parent_id for site in current}
+    for update in plan.updates:
+        if update.parent_id is not None:
+            parent_ids[update.id] = update.parent_id
+    for site_id in plan.reparents:
+        parent_ids[site_id] = None
+
+    kept = {site.id for site in matches if site is not None}
+    parent_ids_to_keep = [parent_ids[site_id] for site_id in kept]
+    parent_ids_to_keep.extend(site.parent_id for site in plan.creates)
+    for parent_id in parent_ids_to_keep:
+        while parent_id in parent_ids and parent_id not in kept:
+            kept.add(parent_id)
+            parent_id = parent_ids[parent_id]
+
+    return [site for site in current if site.id not in kept]
+
+
+def _plan_sites(
+    nodes: list[Site],
+    parents: list[Optional[int]],
+    matches: list[Optional[Site]],
+) -> SitePlan:
+    plan = SitePlan()
+    to_create: dict[int, Site] = {}
+    moves: dict[int, int] = {}
+    for index, node in enumerate(nodes):
+        parent = parents[index]
+        parent_site = matches[parent] if parent is not None else None
+        if (existing := matches[index]) is None:
+            site = node.model_copy(update={"children": []})
+            if parent is not None and parent_site is None:
+                # The parent is created too, so the site is created under it.
+                to_create[parent].children.append(site)
+            else:
+                if parent_site is not None:
+                    site.parent_id = parent_site.id
+                plan.creates.append(site)
+            to_create[index] = site
+            continue
+
+        changes = _get_changes(existing, node)
+        if parent is not None:
+            changes.pop("parent_id", None)
+            if parent_site is None:
+                # The parent doesn't exist yet, so its id is only known when applying.
+                moves[existing.id] = parent  # type: ignore[index]
+            elif existing.parent_id != parent_site.id:
+                changes["parent_id"] = parent_site.id
+        if changes or existing.id in moves:
+            plan.updates.append(Site(id=existing.id, **changes))
+
+    created_order = {
+        id(site): index for index, site in enumerate(_flatten(plan.creates)[0])
+    }
+    plan.reparents = {
+        site_id: created_order[id(to_create[parent])]
+        for site_id, parent in moves.items()
+    }
+    return plan
@@ -1,7 +1,9 @@
+import contextlib
 import importlib.metadata
 import os
 import platform
 from typing import AsyncIterator
+from typing import List
 from typing import Optional
 from typing import TypeVar
 
@@ -112,8 +114,86 @@ class ArmisClient:  # pylint: disable=too-few-public-methods
             {...}
             ```
         """
+        async for items in self.list_pages(url, body=body):
+            for item in items:
+                yield item
+
+    async def list_pages(
+        self,
+        url: str,
+        body: Optional[dict] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> AsyncIterator[List[dict]]:
+        """List all items from a paginated endpoint, a page at a time.
+
+        This is useful for processing a whole page at once, such as decoding it in bulk.
+
+        Args:
+            url (str): The relative endpoint URL.
+            body (dict): Payload to send as POST request.
+            client (httpx.AsyncClient): An open client (see `client()`) to send the requests with,
+                so that concurrent listings share its connection pool.
+                If None, a new client is used.
+
+        Returns:
+            An (async) iterator of `list`s of `dict`s.
+
+        Example:
+            ```python linenums="1" hl_lines="8"
+            import asyncio
+
+            from armis_sdk.core.armis_client import ArmisClient
+
+
+            async def main():
+                armis_client = ArmisClient()
+                async for items in armis_client.list_pages("/v3/settings/sites"):
+                    print(len(items))
+
+            asyncio.run(main())
+            ```
+            Will output:
+            ```python linenums="1"
+            100
+            42
+            ```
+        """
+        async for _, data in self._list_responses(url, body, client):
+            yield data["items"]
+
+    async def list_page_contents(
+        self,
+        url: str,
+        body: Optional[dict] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> AsyncIterator[bytes]:
+        """List all pages of a paginated endpoint as raw (JSON) response bodies.
+
+        This is useful for decoding the pages elsewhere, such as in another process,
+        where bytes are much cheaper to send than parsed items.
+
+        Args:
+            url (str): The relative endpoint URL.
+            body (dict): Payload to send as POST request.
+            client (httpx.AsyncClient): An open client (see `client()`) to send the requests with.
+                If None, a new client is used.
+
+        Returns:
+            An (async) iterator of `bytes`, each a JSON object with an `"items"` list.
+        """
+        async for response, _ in self._list_responses(url, body, client):
+            yield response.content
+
+    async def _list_responses(
+        self,
+        url: str,
+        body: Optional[dict],
+        client: Optional[httpx.AsyncClient],
+    ) -> AsyncIterator[tuple[httpx.Response, dict]]:
         page_size = int(os.getenv(ARMIS_PAGE_SIZE, str(DEFAULT_PAGE_LENGTH)))
-        async with self.client() as client:
+        async with contextlib.AsyncExitStack() as stack:
+            if client is None:
+                client = await stack.enter_async_context(self.client())
             params = {"limit": page_size, **(body or {})}
             while True:
                 if body:
@@ -121,9 +201,7 @@ class ArmisClient:  # pylint: disable=too-few-public-methods
                 else:
                     response = await client.get(url, params=params)
                 data = response_utils.get_data_dict(response)
-                items = data["items"]
-                for item in items:
-                    yield item
+                yield response, data
                 if next_ := data.get("next"):
                     params["after"] = next_
                 else:
@@ -4,6 +4,7 @@ while interacting with the SDK.
 """
 
 import json
+from typing import Any
 from typing import List
 from typing import Optional
 from typing import Union
@@ -53,6 +54,37 @@ class BulkUpdateError(ArmisError):
         super().__init__(display)
 
 
+class BulkSiteItemError(BaseModel):
+    index: int
+    site: dict
+    detail: str
+
+
+class BulkSiteError(ArmisError):
+    # pylint: disable=line-too-long
+    """
+    Raised when some of the sites of a bulk operation (such as
+    [create_many][armis_sdk.clients.sites_client.SitesClient.create_many]) failed.
+    The other sites were processed, and their results are in `results`.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        items: list[BulkSiteItemError],
+        results: Optional[list[Any]] = None,
+    ):
+        self.items = items
+        self.results = results or []
+        display = "\n".join(
+            f"Failed to {operation} site at index {item.index}. "
+            f"Site: {json.dumps(item.site)}, "
+            f"Error: {item.detail}"
+            for item in items
+        )
+        super().__init__(display)
+
+
 class ResponseError(ArmisError):
     # pylint: disable=line-too-long
     """
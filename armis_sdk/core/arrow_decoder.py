@@ -0,0 +1,242 @@
+import datetime
+import functools
+import json
+import typing
+from typing import Annotated
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Optional
+from typing import Type
+from typing import Union
+
+import pyarrow
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Strict
+from pydantic import TypeAdapter
+from pydantic.fields import FieldInfo
+
+from armis_sdk.entities.asset import TRACKED_PROPERTIES
+from armis_sdk.entities.asset import Asset
+
+Converter = Callable[[Any], Any]
+NoneType = type(None)
+SCALAR_TYPES: dict[Any, pyarrow.DataType] = {
+    bool: pyarrow.bool_(),
+    float: pyarrow.float64(),
+    int: pyarrow.int64(),
+    str: pyarrow.string(),
+}
+TIMESTAMP_TYPE = pyarrow.timestamp("us", tz="UTC")
+_DATETIME_ADAPTER = TypeAdapter(datetime.datetime, config=ConfigDict(strict=False))
+
+
+class ArrowDecoder:
+    # pylint: disable=line-too-long
+    """
+    Decodes pages of search results directly into `pyarrow.RecordBatch`es, without creating
+    an [Asset][armis_sdk.entities.asset.Asset] object per item.
+
+    The schema is derived from the fields of the asset class, with a column per requested field:
+
+    1. `str`, `int`, `float` and `bool` fields are mapped to the matching Arrow types.
+    2. `datetime` fields are mapped to `timestamp[us, tz=UTC]`.
+    3. Lists are mapped to Arrow lists, and nested entities
+       (such as [Site][armis_sdk.entities.site.Site]) to Arrow structs.
+    4. Custom and integration properties (e.g. `"custom.MyField"`), which can hold any
+       value, are mapped to strings. Non-string values are JSON-encoded.
+       So are other values that Arrow can't represent, such as recursive entities.
+
+    Values are coerced like the entities coerce them: fields with validators or lax validation
+    (such as the string ids of a [Site][armis_sdk.entities.site.Site]) are validated by pydantic,
+    and so are nested entities that transform their input before validation.
+
+    Decoders are cached, so use [for_fields][armis_sdk.core.arrow_decoder.ArrowDecoder.for_fields]
+    instead of creating them directly.
+
+    Example:
+        ```python linenums="1" hl_lines="4 5"
+        from armis_sdk.core.arrow_decoder import ArrowDecoder
+        from armis_sdk.entities.device import Device
+
+        decoder = ArrowDecoder.for_fields(Device, ["device_id", "last_seen"])
+        batch = decoder.decode_page([{"fields": {"device_id": 1, "last_seen": "2025-12-03T13:52:45"}}])
+        ```
+    """
+
+    def __init__(self, asset_class: Type[Asset], fields: Iterable[str]):
+        self._columns: list[tuple[str, Optional[Converter]]] = []
+        arrow_fields = []
+        for field in fields:
+            data_type, converter = _get_field_type(asset_class, field)
+            arrow_fields.append(pyarrow.field(field, data_type))
+            self._columns.append((field, converter))
+
+        self.schema = pyarrow.schema(arrow_fields)
+        """The schema of the decoded record batches."""
+
+    @classmethod
+    def for_fields(
+        cls, asset_class: Type[Asset], fields: Iterable[str]
+    ) -> "ArrowDecoder":
+        """Get the (cached) decoder of an asset class and a list of fields.
+
+        Args:
+            asset_class: The asset class to decode. Must inherit from [Asset][armis_sdk.entities.asset.Asset].
+            fields: The fields to decode, one column per field.
+        """
+        return _get_decoder(cls, asset_class, tuple(fields))
+
+    def decode_page(self, items: list[dict]) -> pyarrow.RecordBatch:
+        """Decode a page of search results.
+
+        Args:
+            items: The items of the page, each with a `"fields"` dictionary.
+
+        Returns:
+            A record batch with a row per item, in the order of the items.
+        """
+        rows = [item["fields"] for item in items]
+        arrays = []
+        for (name, converter), field in zip(self._columns, self.schema):
+            values = [row.get(name) for row in rows]
+            if converter is not None:
+                values = [_convert(converter, value) for value in values]
+            arrays.append(pyarrow.array(values, type=field.type))
+
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_decoder(
+    decoder_class: Type[ArrowDecoder],
+    asset_class: Type[Asset],
+    fields: tuple[str, ...],
+) -> ArrowDecoder:
+    return decoder_class(asset_class, fields)
+
+
+def _convert(converter: Converter, value: Any) -> Any:
+    return converter(value) if value is not None else None
+
+
+def _get_field_type(
+    asset_class: Type[Asset], field: str
+) -> tuple[pyarrow.DataType, Optional[Converter]]:
+    if field.split(".", 1)[0] in TRACKED_PROPERTIES:
+        return pyarrow.string(), _to_text
+
+    return _get_field_info_type(asset_class, asset_class.model_fields[field], ())
+
+
+def _get_field_info_type(
+    model: Type[BaseModel], field: FieldInfo, parents: tuple[type, ...]
+) -> tuple[pyarrow.DataType, Optional[Converter]]:
+    data_type, converter = _get_type(field.annotation, parents)
+    if not _is_coerced(field, data_type):
+        return data_type, converter
+
+    strict = model.model_config.get("strict", False)
+    validate = _get_field_adapter(field, strict).validate_python
+    if converter is None:
+        return data_type, validate
+
+    return data_type, lambda value: _convert(converter, validate(value))
+
+
+def _is_coerced(field: FieldInfo, data_type: pyarrow.DataType) -> bool:
+    """Whether pydantic validates a field differently than its annotation alone."""
+    metadata = [item for item in field.metadata if item != Strict(True)]
+    # Timestamps are always validated in lax mode.
+    if data_type == TIMESTAMP_TYPE:
+        metadata = [item for item in metadata if not isinstance(item, Strict)]
+
+    return bool(metadata)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_field_adapter(field: FieldInfo, strict: bool) -> TypeAdapter:
+    # The metadata holds the constraints and validators of the field, without its aliases.
+    return TypeAdapter(
+        Annotated[(field.annotation, *field.metadata)],
+        config=ConfigDict(strict=strict),
+    )
+
+
+def _get_type(
+    annotation: Any, parents: tuple[type, ...]
+) -> tuple[pyarrow.DataType, Optional[Converter]]:
+    # pylint: disable=too-many-return-statements
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is Union:
+        args = tuple(arg for arg in args if arg is not NoneType)
+        if len(args) == 1:
+            return _get_type(args[0], parents)
+
+    elif origin is typing.Literal:
+        if all(isinstance(arg, str) for arg in args):
+            return pyarrow.string(), None
+
+    elif origin in (list, typing.List):
+        item_type, item_converter = _get_type(args[0], parents)
+        if item_converter is None:
+            return pyarrow.list_(item_type), None
+
+        return pyarrow.list_(item_type), lambda value: [
+            _convert(item_converter, item) for item in value
+        ]
+
+    elif annotation in SCALAR_TYPES:
+        return SCALAR_TYPES[annotation], None
+
+    elif annotation is datetime.datetime:
+        return TIMESTAMP_TYPE, _DATETIME_ADAPTER.validate_python
+
+    elif (
+        isinstance(annotation, type)
+        and issubclass(annotation, BaseModel)
+        and annotation not in parents
+    ):
+        return _get_struct_type(annotation, (*parents, annotation))
+
+    return pyarrow.string(), _to_text
+
+
+def _get_struct_type(
+    model: Type[BaseModel], parents: tuple[type, ...]
+) -> tuple[pyarrow.DataType, Converter]:
+    # Models that transform their input (e.g. renaming keys) are validated by pydantic first.
+    validate_model = any(
+        decorator.info.mode != "after"
+        for decorator in model.__pydantic_decorators__.model_validators.values()
+    )
+    struct_fields = []
+    keys: list[tuple[str, Optional[str], Optional[Converter]]] = []
+    for name, field in model.model_fields.items():
+        if validate_model:
+            data_type, converter = _get_type(field.annotation, parents)
+        else:
+            data_type, converter = _get_field_info_type(model, field, parents)
+        struct_fields.append(pyarrow.field(name, data_type))
+        keys.append((name, field.alias, converter))
+
+    def convert(value: dict) -> dict:
+        if validate_model:
+            value = model.model_validate(dict(value)).model_dump()
+
+        result = {}
+        for name, alias, converter in keys:
+            item = value.get(name)
+            if item is None and alias is not None:
+                item = value.get(alias)
+            result[name] = _convert(converter, item) if converter else item
+
+        return result
+
+    return pyarrow.struct(struct_fields), convert
+
+
+def _to_text(value: Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value)
@@ -0,0 +1,168 @@
+import functools
+import typing
+from typing import Any
+from typing import Generic
+from typing import Iterable
+from typing import Optional
+from typing import Type
+
+from pydantic import BaseModel
+from pydantic import TypeAdapter
+
+from armis_sdk.core.interner import Interner
+from armis_sdk.core.lazy_asset import LazyAsset
+from armis_sdk.entities.asset import AssetT
+
+Route = tuple[str, Optional[str]]
+
+
+class AssetDecoder(Generic[AssetT]):
+    # pylint: disable=line-too-long
+    """
+    Decodes search results into assets, faster than calling
+    [from_search_result][armis_sdk.entities.asset.Asset.from_search_result] for each item.
+
+    The keys of the search results (e.g. `"device_id"` or `"custom.MyField"`) are the
+    same on every item, so their routing into the nested `custom` and `integration`
+    properties is computed only once per key, and whole pages are validated in a single call.
+
+    [decode_page_lazy][armis_sdk.core.asset_decoder.AssetDecoder.decode_page_lazy] doesn't
+    validate nested entities (such as the `site`, `boundaries` and `network_interfaces`
+    of a [Device][armis_sdk.entities.device.Device]) while decoding, and returns
+    [LazyAsset][armis_sdk.core.lazy_asset.LazyAsset]s that validate them when they're first
+    accessed, which is cheaper for consumers that only read the top-level fields.
+
+    Decoders are cached, so use [for_class][armis_sdk.core.asset_decoder.AssetDecoder.for_class]
+    instead of creating them directly.
+
+    Example:
+        ```python linenums="1" hl_lines="4 5"
+        from armis_sdk.core.asset_decoder import AssetDecoder
+        from armis_sdk.entities.device import Device
+
+        decoder = AssetDecoder.for_class(Device)
+        devices = decoder.decode_page([{"fields": {"device_id": 1, "custom.Owner": "Jane"}}])
+        ```
+    """
+
+    def __init__(self, asset_class: Type[AssetT]):
+        self._asset_class = asset_class
+        self._nested_fields = _get_nested_fields(asset_class)
+        self._routes: dict[str, Route] = {}
+        self._adapter: TypeAdapter[list[AssetT]] = TypeAdapter(list[asset_class])  # type: ignore[valid-type]
+
+    @classmethod
+    def for_class(cls, asset_class: Type[AssetT]) -> "AssetDecoder[AssetT]":
+        """Get the (cached) decoder of an asset class.
+
+        Args:
+            asset_class: The asset class to decode. Must inherit from [Asset][armis_sdk.entities.asset.Asset].
+        """
+        return _get_decoder(cls, asset_class)
+
+    def decode(self, item: dict, interner: Optional[Interner] = None) -> AssetT:
+        """Decode a single search result."""
+        (asset,) = self.decode_page([item], interner=interner)
+        return asset
+
+    def decode_page(
+        self, items: Iterable[dict], interner: Optional[Interner] = None
+    ) -> list[AssetT]:
+        """Decode a page of search results.
+
+        Args:
+            items: The items of the page, each with a `"fields"` dictionary.
+            interner: An optional [Interner][armis_sdk.core.interner.Interner] that shares
+                identical nested entities and strings between assets.
+
+        Returns:
+            The assets, in the order of the items.
+
+        Raises:
+            pydantic.ValidationError: If any of the items is invalid.
+        """
+        rows = self._get_rows(items, interner)
+        assets = self._adapter.validate_python(rows)
+        for asset in assets:
+            asset.mark_clean()
+
+        return assets
+
+    def decode_page_lazy(
+        self, items: Iterable[dict], interner: Optional[Interner] = None
+    ) -> list[LazyAsset[AssetT]]:
+        """Decode a page of search results, without validating nested entities.
+
+        Args:
+            items: The items of the page, each with a `"fields"` dictionary.
+            interner: An optional [Interner][armis_sdk.core.interner.Interner] that shares
+                identical nested entities and strings between assets.
+
+        Returns:
+            The lazy assets, in the order of the items.
+
+        Raises:
+            pydantic.ValidationError: If any of the top-level fields of the items is invalid.
+        """
+        rows = self._get_rows(items, interner)
+        deferred = [
+            {name: row.pop(name) for name in self._nested_fields if name in row}
+            for row in rows
+        ]
+        assets = self._adapter.validate_python(rows)
+        for asset in assets:
+            asset.mark_clean()
+
+        return [LazyAsset(asset, raw) for asset, raw in zip(assets, deferred)]
+
+    def _get_rows(
+        self, items: Iterable[dict], interner: Optional[Interner]
+    ) -> list[dict[str, Any]]:
+        rows = [self._route(item["fields"]) for item in items]
+        if interner is not None:
+            rows = [interner.intern_fields(self._asset_class, row) for row in rows]
+
+        return rows
+
+    def _route(self, fields: dict[str, Any]) -> dict[str, Any]:
+        row: dict[str, Any] = {}
+        for key, value in fields.items():
+            if (route := self._routes.get(key)) is None:
+                route = self._routes[key] = _get_route(key)
+
+            name, sub_key = route
+            if sub_key is None:
+                row[name] = value
+            else:
+                row.setdefault(name, {})[sub_key] = value
+
+        return row
+
+
+@functools.lru_cache(maxsize=None)
+def _get_decoder(
+    decoder_class: Type[AssetDecoder], asset_class: Type[AssetT]
+) -> AssetDecoder[AssetT]:
+    return decoder_class(asset_class)
+
+
+def _get_nested_fields(asset_class: Type[AssetT]) -> tuple[str, ...]:
+    return tuple(
+        name
+        for name, field in asset_class.model_fields.items()
+        if _has_model(field.annotation)
+    )
+
+
+def _has_model(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+
+    return any(_has_model(arg) for arg in typing.get_args(annotation))
+
+
+def _get_route(key: str) -> Route:
+    if len(parts := key.split(".", 1)) > 1:
+        return parts[0], parts[1]
+
+    return key, None
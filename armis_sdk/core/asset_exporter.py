@@ -0,0 +1,343 @@
+import abc
+import asyncio
+import datetime
+import itertools
+import json
+import pathlib
+from typing import Any
+from typing import AsyncIterable
+from typing import Iterable
+from typing import Optional
+from typing import Union
+
+import pyarrow
+import pyarrow.parquet
+
+from armis_sdk.core import async_utils
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.core.arrow_decoder import ArrowDecoder
+from armis_sdk.core.lazy_asset import LazyAsset
+from armis_sdk.entities.asset import TRACKED_PROPERTIES
+from armis_sdk.entities.asset import Asset
+
+EXPORT_MAX_FILE_SIZE = 256 * 1024 * 1024
+EXPORT_ROW_GROUP_SIZE = 100_000
+EXPORT_CHUNK_SIZE = 10_000
+COMPRESSION_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+ExportItem = Union[Asset, LazyAsset, pyarrow.RecordBatch]
+
+
+class AssetExporter(abc.ABC):  # pylint: disable=too-few-public-methods
+    # pylint: disable=line-too-long
+    """
+    A base class for exporting a stream of assets into a rolling set of files.
+
+    The stream can be any [AssetsClient][armis_sdk.clients.assets_client.AssetsClient] listing,
+    either of assets (e.g. [list_by_last_seen][armis_sdk.clients.assets_client.AssetsClient.list_by_last_seen])
+    or of record batches (e.g. [list_batches_by_last_seen][armis_sdk.clients.assets_client.AssetsClient.list_batches_by_last_seen]).
+    Items are written in chunks as they arrive, so memory usage doesn't depend on the size of the stream.
+    A new file is started whenever the current one reaches `max_file_size` bytes.
+    Files are named `{prefix}-00000{extension}`, `{prefix}-00001{extension}` and so on.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, pathlib.Path],
+        prefix: str = "assets",
+        max_file_size: int = EXPORT_MAX_FILE_SIZE,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ):
+        self._directory = pathlib.Path(directory)
+        self._prefix = prefix
+        self._max_file_size = max_file_size
+        self._chunk_size = chunk_size
+
+    async def export(
+        self, items: Union[Iterable[ExportItem], AsyncIterable[ExportItem]]
+    ) -> list[pathlib.Path]:
+        """Export all the items of an (async) stream.
+
+        Args:
+            items: Assets or record batches, such as the result of an `AssetsClient` listing.
+                [LazyAsset][armis_sdk.core.lazy_asset.LazyAsset]s are loaded first.
+
+        Returns:
+            The paths of the written files, in order.
+        """
+        await asyncio.to_thread(self._directory.mkdir, parents=True, exist_ok=True)
+        paths: list[pathlib.Path] = []
+        writer: Optional[_FileWriter] = None
+        chunk: list[ExportItem] = []
+        rows = 0
+        try:
+            async for item in async_utils.to_async_iterator(items):
+                chunk.append(item.load() if isinstance(item, LazyAsset) else item)
+                rows += item.num_rows if isinstance(item, pyarrow.RecordBatch) else 1
+                if rows >= self._chunk_size:
+                    writer = await asyncio.to_thread(self._write, writer, chunk, paths)
+                    chunk, rows = [], 0
+
+            if chunk:
+                writer = await asyncio.to_thread(self._write, writer, chunk, paths)
+        finally:
+            if writer is not None:
+                await asyncio.to_thread(writer.close)
+
+        return paths
+
+    def _write(
+        self,
+        writer: Optional["_FileWriter"],
+        chunk: list[ExportItem],
+        paths: list[pathlib.Path],
+    ) -> Optional["_FileWriter"]:
+        if writer is None:
+            path = self._directory / f"{self._prefix}-{len(paths):05d}{self._extension}"
+            writer = self._open(path)
+            paths.append(path)
+
+        writer.write(chunk)
+        if writer.size() >= self._max_file_size:
+            writer.close()
+            return None
+
+        return writer
+
+    @property
+    @abc.abstractmethod
+    def _extension(self) -> str:
+        """The extension of the file names."""
+
+    @abc.abstractmethod
+    def _open(self, path: pathlib.Path) -> "_FileWriter":
+        """Start writing a new file."""
+
+
+class ParquetExporter(AssetExporter):  # pylint: disable=too-few-public-methods
+    # pylint: disable=line-too-long
+    """
+    Exports a stream of assets into a rolling set of Parquet files.
+
+    Record batches are written as they are. Assets are converted into the same columns that
+    [list_batches_by_last_seen][armis_sdk.clients.assets_client.AssetsClient.list_batches_by_last_seen]
+    returns (see [ArrowDecoder][armis_sdk.core.arrow_decoder.ArrowDecoder]) for the given `fields`.
+    Rows are buffered until at least `row_group_size` rows are available, and each buffer is written as a single row group.
+
+    Example:
+        ```python linenums="1" hl_lines="11-12"
+        import asyncio
+        import datetime
+
+        from armis_sdk.clients.assets_client import AssetsClient
+        from armis_sdk.core.asset_exporter import ParquetExporter
+        from armis_sdk.entities.device import Device
+
+
+        async def main():
+            assets_client = AssetsClient()
+            exporter = ParquetExporter("/tmp/devices", row_group_size=50_000)
+            paths = await exporter.export(assets_client.list_batches_by_last_seen(Device, datetime.timedelta(days=1)))
+            print(paths)
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, pathlib.Path],
+        prefix: str = "assets",
+        max_file_size: int = EXPORT_MAX_FILE_SIZE,
+        row_group_size: int = EXPORT_ROW_GROUP_SIZE,
+        compression: Optional[str] = "zstd",
+        fields: Optional[list[str]] = None,
+    ):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Args:
+            directory: The directory to write the files into. Created if it doesn't exist.
+            prefix: The prefix of the file names.
+            max_file_size: The size in bytes after which a new file is started.
+            row_group_size: The number of rows in each row group.
+            compression: The Parquet compression codec, or `None` for no compression.
+            fields: The fields to export when exporting assets. If None, all non-custom fields are exported.
+        """
+        super().__init__(directory, prefix, max_file_size, row_group_size)
+        self._compression = compression or "none"
+        self._fields = fields
+
+    @property
+    def _extension(self) -> str:
+        return ".parquet"
+
+    def _open(self, path: pathlib.Path) -> "_FileWriter":
+        return _ParquetFileWriter(path, self._compression, self._fields)
+
+
+class NdjsonExporter(AssetExporter):  # pylint: disable=too-few-public-methods
+    # pylint: disable=line-too-long
+    """
+    Exports a stream of assets into a rolling set of newline-delimited JSON files.
+
+    Each line holds a single asset, as returned by `model_dump_json()`,
+    or a single row of a record batch. With compression, `max_file_size` applies to the compressed size.
+
+    Example:
+        ```python linenums="1" hl_lines="11-12"
+        import asyncio
+        import datetime
+
+        from armis_sdk.clients.assets_client import AssetsClient
+        from armis_sdk.core.asset_exporter import NdjsonExporter
+        from armis_sdk.entities.device import Device
+
+
+        async def main():
+            assets_client = AssetsClient()
+            exporter = NdjsonExporter("/tmp/devices", compression="zstd")
+            paths = await exporter.export(assets_client.list_by_last_seen(Device, datetime.timedelta(days=1)))
+            print(paths)
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, pathlib.Path],
+        prefix: str = "assets",
+        max_file_size: int = EXPORT_MAX_FILE_SIZE,
+        compression: Optional[str] = None,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Args:
+            directory: The directory to write the files into. Created if it doesn't exist.
+            prefix: The prefix of the file names.
+            max_file_size: The size in bytes after which a new file is started.
+            compression: Either `"zstd"`, `"gzip"` or `None` for no compression.
+            chunk_size: The number of rows that are buffered before they're written.
+
+        Raises:
+            ArmisError: If the compression isn't supported.
+        """
+        if compression is not None and compression not in COMPRESSION_EXTENSIONS:
+            raise ArmisError(f"Unsupported compression {compression!r}")
+
+        super().__init__(directory, prefix, max_file_size, chunk_size)
+        self._compression = compression
+
+    @property
+    def _extension(self) -> str:
+        return ".ndjson" + COMPRESSION_EXTENSIONS.get(self._compression or "", "")
+
+    def _open(self, path: pathlib.Path) -> "_FileWriter":
+        return _NdjsonFileWriter(path, self._compression)
+
+
+class _FileWriter(abc.ABC):
+    @abc.abstractmethod
+    def write(self, chunk: list[ExportItem]):
+        """Write a chunk of items."""
+
+    @abc.abstractmethod
+    def size(self) -> int:
+        """The number of bytes written to the file so far."""
+
+    @abc.abstractmethod
+    def close(self):
+        """Finish writing the file."""
+
+
+class _ParquetFileWriter(_FileWriter):
+    def __init__(
+        self, path: pathlib.Path, compression: str, fields: Optional[list[str]]
+    ):
+        self._path = path
+        self._compression = compression
+        self._fields = fields
+        self._file = pyarrow.OSFile(str(path), "wb")
+        self._writer: Optional[pyarrow.parquet.ParquetWriter] = None
+
+    def write(self, chunk: list[ExportItem]):
+        table = self._to_table(chunk)
+        if self._writer is None:
+            self._writer = pyarrow.parquet.ParquetWriter(
+                self._file, table.schema, compression=self._compression
+            )
+
+        self._writer.write_table(table, row_group_size=table.num_rows)
+
+    def size(self) -> int:
+        return self._file.tell()
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._file.close()
+
+    def _to_table(self, chunk: list[ExportItem]) -> pyarrow.Table:
+        batches = []
+        for is_asset, group in itertools.groupby(
+            chunk, key=lambda item: isinstance(item, Asset)
+        ):
+            if is_asset:
+                batches.append(self._to_batch(list(group)))  # type: ignore[arg-type]
+            else:
+                batches.extend(group)
+
+        return pyarrow.Table.from_batches(batches)
+
+    def _to_batch(self, assets: list[Asset]) -> pyarrow.RecordBatch:
+        asset_class = type(assets[0])
+        fields = self._fields or sorted(asset_class.all_fields())
+        decoder = ArrowDecoder.for_fields(asset_class, fields)
+        return decoder.decode_page([{"fields": _flatten(asset)} for asset in assets])
+
+
+class _NdjsonFileWriter(_FileWriter):
+    def __init__(self, path: pathlib.Path, compression: Optional[str]):
+        self._file = pyarrow.OSFile(str(path), "wb")
+        self._stream = (
+            pyarrow.CompressedOutputStream(self._file, compression)
+            if compression
+            else self._file
+        )
+
+    def write(self, chunk: list[ExportItem]):
+        lines = []
+        for item in chunk:
+            if isinstance(item, pyarrow.RecordBatch):
+                lines.extend(
+                    json.dumps(row, default=_json_default) for row in item.to_pylist()
+                )
+            else:
+                lines.append(item.model_dump_json())
+
+        self._stream.write("".join(f"{line}\n" for line in lines).encode())
+
+    def size(self) -> int:
+        return self._file.tell()
+
+    def close(self):
+        self._stream.close()
+        if not self._file.closed:
+            self._file.close()
+
+
+def _flatten(asset: Asset) -> dict[str, Any]:
+    fields = asset.model_dump(exclude=set(TRACKED_PROPERTIES))
+    for name in TRACKED_PROPERTIES:
+        for key, value in getattr(asset, name).items():
+            fields[f"{name}.{key}"] = value
+
+    return fields
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
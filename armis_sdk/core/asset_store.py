@@ -0,0 +1,468 @@
+import asyncio
+import itertools
+import json
+import sqlite3
+import threading
+from typing import Any
+from typing import AsyncIterable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+from armis_sdk.core import async_utils
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.core.device_index import ADDRESS_ATTRIBUTES
+from armis_sdk.entities.device import Device
+from armis_sdk.entities.network_interface import NetworkInterface
+from armis_sdk.types.asset_id_source import AssetIdSource
+
+STORE_BATCH_SIZE = 10_000
+DEVICE_COLUMNS = [
+    "device_id",
+    "brand",
+    "category",
+    "display",
+    "first_seen",
+    "last_seen",
+    "model",
+    "os_name",
+    "os_version",
+    "purdue_level",
+    "risk_level",
+    "type",
+    "visibility",
+]
+NETWORK_INTERFACE_COLUMNS = list(NetworkInterface.model_fields)
+# The list fields that are stored as rows of other tables.
+DEVICE_LIST_FIELDS = [
+    *ADDRESS_ATTRIBUTES.values(),
+    "names",
+    "tags",
+    "network_interfaces",
+    "boundaries",
+]
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS devices (
+    {", ".join(DEVICE_COLUMNS)},
+    site_id INTEGER,
+    empty_lists TEXT,
+    PRIMARY KEY (device_id)
+);
+CREATE INDEX IF NOT EXISTS devices_last_seen ON devices (last_seen);
+CREATE INDEX IF NOT EXISTS devices_site_id ON devices (site_id);
+
+CREATE TABLE IF NOT EXISTS device_identifiers (
+    device_id INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS device_identifiers_device_id
+    ON device_identifiers (device_id);
+CREATE INDEX IF NOT EXISTS device_identifiers_value
+    ON device_identifiers (source, value COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS device_names (
+    device_id INTEGER NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS device_names_device_id ON device_names (device_id);
+
+CREATE TABLE IF NOT EXISTS device_tags (
+    device_id INTEGER NOT NULL,
+    tag TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS device_tags_device_id ON device_tags (device_id);
+CREATE INDEX IF NOT EXISTS device_tags_tag ON device_tags (tag);
+
+CREATE TABLE IF NOT EXISTS device_properties (
+    device_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (device_id, kind, key)
+);
+CREATE INDEX IF NOT EXISTS device_properties_key ON device_properties (kind, key);
+
+CREATE TABLE IF NOT EXISTS network_interfaces (
+    device_id INTEGER NOT NULL,
+    {", ".join(NETWORK_INTERFACE_COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS network_interfaces_device_id
+    ON network_interfaces (device_id);
+
+CREATE TABLE IF NOT EXISTS boundaries (
+    id INTEGER PRIMARY KEY,
+    name TEXT
+);
+
+CREATE TABLE IF NOT EXISTS device_boundaries (
+    device_id INTEGER NOT NULL,
+    boundary_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS device_boundaries_device_id
+    ON device_boundaries (device_id);
+CREATE INDEX IF NOT EXISTS device_boundaries_boundary_id
+    ON device_boundaries (boundary_id);
+
+CREATE TABLE IF NOT EXISTS sites (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    location TEXT,
+    parent_id INTEGER,
+    tier TEXT,
+    data TEXT NOT NULL
+);
+"""
+DEVICE_TABLES = [
+    "device_identifiers",
+    "device_names",
+    "device_tags",
+    "device_properties",
+    "network_interfaces",
+    "device_boundaries",
+]
+# SQLite limits the number of parameters of a single statement.
+MAX_QUERY_PARAMETERS = 500
+
+
+class SqliteAssetStore:
+    # pylint: disable=line-too-long
+    """
+    A local, persistent store of [Device][armis_sdk.entities.device.Device]s, backed by SQLite.
+
+    Devices are written in large transactions into a normalized schema:
+
+    - `devices`: the scalar fields of each device, keyed by `device_id`, and which of its
+      lists are empty (so they're read back as `[]` rather than `None`).
+    - `device_identifiers`: the addresses and serial numbers by their
+      [AssetIdSource][armis_sdk.types.asset_id_source.AssetIdSource] (indexed, case-insensitive).
+    - `device_names`, `device_tags`: the names and tags of each device.
+    - `device_properties`: the `custom` and `integration` properties as JSON values.
+    - `network_interfaces`, `device_boundaries`, `boundaries` and `sites`: the nested objects.
+
+    Writing a device that already exists replaces it. The tables can also be queried
+    directly with [query][armis_sdk.core.asset_store.SqliteAssetStore.query].
+
+    Example:
+        ```python linenums="1" hl_lines="11 12 14"
+        import asyncio
+        import datetime
+
+        from armis_sdk.clients.assets_client import AssetsClient
+        from armis_sdk.core.asset_store import SqliteAssetStore
+        from armis_sdk.entities.device import Device
+
+
+        async def main():
+            assets_client = AssetsClient()
+            with SqliteAssetStore("/tmp/devices.db") as store:
+                await store.ingest(assets_client.list_by_last_seen(Device, datetime.timedelta(days=30)))
+                print(store.find("1.2.3.4", "IPV4_ADDRESS"))
+                print(store.query("SELECT COUNT(*) FROM devices WHERE os_name = ?", ["Windows"]))
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        # The connection is shared with the worker threads of `ingest`, so it's guarded by a lock.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "SqliteAssetStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iter__(self) -> Iterator[Device]:
+        with self._lock:
+            cursor = self._connection.execute("SELECT device_id FROM devices")
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(MAX_QUERY_PARAMETERS)
+            if not rows:
+                break
+
+            yield from self._load([device_id for (device_id,) in rows])
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM devices"
+            ).fetchone()
+        return count
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def find(
+        self,
+        asset_id: Union[int, str],
+        asset_id_source: AssetIdSource = "ASSET_ID",
+    ) -> list[Device]:
+        """Find devices by any of their identifiers.
+
+        Args:
+            asset_id: The identifier to look for.
+            asset_id_source: The type of the identifier.
+
+        Returns:
+            The matching devices, ordered by `device_id`.
+        """
+        if asset_id_source == "ASSET_ID":
+            try:
+                device = self.get(int(asset_id))
+            except ValueError:
+                return []
+
+            return [device] if device is not None else []
+
+        if asset_id_source not in ADDRESS_ATTRIBUTES:
+            raise ArmisError(f"Can't find devices by {asset_id_source!r}")
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT DISTINCT device_id FROM device_identifiers "
+                "WHERE source = ? AND value = ? COLLATE NOCASE ORDER BY device_id",
+                [asset_id_source, asset_id],
+            ).fetchall()
+        return self._load([device_id for (device_id,) in rows])
+
+    def get(self, device_id: int) -> Optional[Device]:
+        """Get a device by its `device_id`, or `None` if it's not in the store."""
+        devices = self._load([device_id])
+        return devices[0] if devices else None
+
+    async def ingest(
+        self,
+        devices: Union[Iterable[Device], AsyncIterable[Device]],
+        batch_size: int = STORE_BATCH_SIZE,
+    ) -> int:
+        """Write all the devices of an (async) stream, such as an `AssetsClient` listing.
+
+        Each batch is written in a single transaction in a worker thread,
+        so the event loop isn't blocked while writing.
+
+        Returns:
+            The number of written devices.
+        """
+        count = 0
+        async for batch in async_utils.batched(devices, batch_size):
+            count += await asyncio.to_thread(self.write, batch, batch_size)
+
+        return count
+
+    def query(self, sql: str, parameters: Iterable[Any] = ()) -> list[tuple]:
+        """Run an SQL query against the store.
+
+        Args:
+            sql: The query, e.g. `SELECT device_id FROM devices WHERE os_name = ?`.
+            parameters: The values of the query placeholders.
+
+        Returns:
+            The resulting rows.
+        """
+        with self._lock:
+            return self._connection.execute(sql, list(parameters)).fetchall()
+
+    def write(
+        self, devices: Iterable[Device], batch_size: int = STORE_BATCH_SIZE
+    ) -> int:
+        """Write devices, replacing existing devices with the same `device_id`.
+
+        Args:
+            devices: The devices to write. Each device must have a `device_id`.
+            batch_size: The number of devices written in each transaction.
+
+        Returns:
+            The number of written devices.
+        """
+        count = 0
+        iterator = iter(devices)
+        while batch := list(itertools.islice(iterator, batch_size)):
+            with self._lock, self._connection:
+                self._write_batch(batch)
+            count += len(batch)
+
+        return count
+
+    def _load(self, device_ids: list[int]) -> list[Device]:
+        return [
+            device
+            for start in range(0, len(device_ids), MAX_QUERY_PARAMETERS)
+            for device in self._load_chunk(
+                device_ids[start : start + MAX_QUERY_PARAMETERS]
+            )
+        ]
+
+    def _load_chunk(self, device_ids: list[int]) -> list[Device]:
+        with self._lock:
+            return self._load_chunk_locked(device_ids)
+
+    def _load_chunk_locked(self, device_ids: list[int]) -> list[Device]:
+        placeholders = ", ".join("?" * len(device_ids))
+        devices: dict[int, dict[str, Any]] = {}
+        for row in self._connection.execute(
+            f"SELECT {', '.join(DEVICE_COLUMNS)}, empty_lists, sites.data FROM devices "
+            f"LEFT JOIN sites ON sites.id = devices.site_id "
+            f"WHERE device_id IN ({placeholders})",
+            device_ids,
+        ):
+            device = dict(zip(DEVICE_COLUMNS, row))
+            if row[-2] is not None:
+                device.update((name, []) for name in json.loads(row[-2]))
+            if row[-1] is not None:
+                device["site"] = json.loads(row[-1])
+            devices[device["device_id"]] = device
+
+        for device_id, source, value in self._select(
+            "device_id, source, value", "device_identifiers", device_ids
+        ):
+            devices[device_id].setdefault(ADDRESS_ATTRIBUTES[source], []).append(value)
+
+        for device_id, name in self._select(
+            "device_id, name", "device_names", device_ids
+        ):
+            devices[device_id].setdefault("names", []).append(name)
+
+        for device_id, tag in self._select("device_id, tag", "device_tags", device_ids):
+            devices[device_id].setdefault("tags", []).append(tag)
+
+        for device_id, kind, key, value in self._select(
+            "device_id, kind, key, value", "device_properties", device_ids
+        ):
+            devices[device_id].setdefault(kind, {})[key] = json.loads(value)
+
+        for row in self._select(
+            f"device_id, {', '.join(NETWORK_INTERFACE_COLUMNS)}",
+            "network_interfaces",
+            device_ids,
+        ):
+            interface = dict(zip(NETWORK_INTERFACE_COLUMNS, row[1:]))
+            interface["channels"] = json.loads(interface["channels"])
+            if interface["hidden_broadcast_ssid"] is not None:
+                interface["hidden_broadcast_ssid"] = bool(
+                    interface["hidden_broadcast_ssid"]
+                )
+            devices[row[0]].setdefault("network_interfaces", []).append(interface)
+
+        for device_id, boundary_id, name in self._select(
+            "device_id, boundary_id, name",
+            "device_boundaries JOIN boundaries ON boundaries.id = boundary_id",
+            device_ids,
+        ):
+            devices[device_id].setdefault("boundaries", []).append(
+                {"id": boundary_id, "name": name}
+            )
+
+        return [
+            Device.model_validate(devices[device_id])
+            for device_id in device_ids
+            if device_id in devices
+        ]
+
+    def _select(self, columns: str, table: str, device_ids: list[int]):
+        placeholders = ", ".join("?" * len(device_ids))
+        return self._connection.execute(
+            f"SELECT {columns} FROM {table} "
+            f"WHERE device_id IN ({placeholders}) ORDER BY {table.split()[0]}.rowid",
+            device_ids,
+        )
+
+    def _write_batch(self, devices: list[Device]):
+        # pylint: disable=too-many-locals
+        rows: dict[str, list[tuple]] = {table: [] for table in DEVICE_TABLES}
+        device_rows = []
+        sites = {}
+        boundaries = {}
+        if any(device.device_id is None for device in devices):
+            raise ArmisError("Can't store a device without a device id")
+
+        # A device written twice in a batch is stored once, as its last occurrence.
+        unique_devices = {device.device_id: device for device in devices}
+        for device in unique_devices.values():
+            values = device.model_dump(include=set(DEVICE_COLUMNS), mode="json")
+            site_id = device.site.id if device.site is not None else None
+            # Empty lists have no rows, so they're recorded to tell them apart from None.
+            empty_lists = [
+                name for name in DEVICE_LIST_FIELDS if getattr(device, name) == []
+            ]
+            device_rows.append(
+                (
+                    *(values[column] for column in DEVICE_COLUMNS),
+                    site_id,
+                    json.dumps(empty_lists) if empty_lists else None,
+                )
+            )
+            if site_id is not None:
+                sites[site_id] = device.site
+
+            for source, attribute in ADDRESS_ATTRIBUTES.items():
+                rows["device_identifiers"].extend(
+                    (device.device_id, source, value)
+                    for value in getattr(device, attribute) or []
+                )
+
+            rows["device_names"].extend(
+                (device.device_id, name) for name in device.names or []
+            )
+            rows["device_tags"].extend(
+                (device.device_id, tag) for tag in device.tags or []
+            )
+            for kind in ("custom", "integration"):
+                rows["device_properties"].extend(
+                    (device.device_id, kind, key, json.dumps(value, default=str))
+                    for key, value in getattr(device, kind).items()
+                )
+
+            for interface in device.network_interfaces or []:
+                values = interface.model_dump()
+                values["channels"] = json.dumps(values["channels"])
+                rows["network_interfaces"].append(
+                    (
+                        device.device_id,
+                        *(values[column] for column in NETWORK_INTERFACE_COLUMNS),
+                    )
+                )
+
+            for boundary in device.boundaries or []:
+                boundaries[boundary.id] = boundary.name
+                rows["device_boundaries"].append((device.device_id, boundary.id))
+
+        device_ids = [(row[0],) for row in device_rows]
+        for table in DEVICE_TABLES:
+            self._connection.executemany(
+                f"DELETE FROM {table} WHERE device_id = ?", device_ids
+            )
+            if rows[table]:
+                placeholders = ", ".join("?" * len(rows[table][0]))
+                self._connection.executemany(
+                    f"INSERT INTO {table} VALUES ({placeholders})", rows[table]
+                )
+
+        self._connection.executemany(
+            f"INSERT OR REPLACE INTO devices VALUES ({', '.join('?' * (len(DEVICE_COLUMNS) + 2))})",
+            device_rows,
+        )
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO boundaries VALUES (?, ?)", boundaries.items()
+        )
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO sites VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    site_id,
+                    site.name,
+                    site.location,
+                    site.parent_id,
+                    site.tier,
+                    site.model_dump_json(exclude={"children"}, exclude_none=True),
+                )
+                for site_id, site in sites.items()
+            ],
+        )
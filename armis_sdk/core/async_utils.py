@@ -0,0 +1,74 @@
+import asyncio
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Iterable
+from typing import TypeVar
+from typing import Union
+
+ItemT = TypeVar("ItemT")
+
+
+async def to_async_iterator(
+    iterable: Union[Iterable[ItemT], AsyncIterable[ItemT]],
+) -> AsyncIterator[ItemT]:
+    if isinstance(iterable, AsyncIterable):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
+
+
+async def batched(
+    iterable: Union[Iterable[ItemT], AsyncIterable[ItemT]],
+    size: int,
+) -> AsyncIterator[list[ItemT]]:
+    if size < 1:
+        raise ValueError("Batch size must be at least 1")
+
+    batch: list[ItemT] = []
+    async for item in to_async_iterator(iterable):
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+async def merge(
+    iterators: list[AsyncIterator[ItemT]],
+    buffer_size: int = 0,
+) -> AsyncIterator[ItemT]:
+    """Consume several async iterators concurrently and yield their items as they arrive.
+
+    If any of the iterators raises, the others are cancelled and the error is propagated.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+    done = object()
+
+    async def drain(iterator: AsyncIterator[ItemT]):
+        try:
+            async for item in iterator:
+                await queue.put((item, None))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            await queue.put((done, error))
+        else:
+            await queue.put((done, None))
+
+    tasks = [asyncio.create_task(drain(iterator)) for iterator in iterators]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            item, error = await queue.get()
+            if error is not None:
+                raise error
+            if item is done:
+                remaining -= 1
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
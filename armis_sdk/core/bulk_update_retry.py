@@ -0,0 +1,37 @@
+import dataclasses
+
+import httpx
+
+
+@dataclasses.dataclass
+class BulkUpdateRetry:
+    """
+    A policy for retrying the failed items of a bulk update.
+
+    Only the items that failed with a retryable status are sent again, so a large
+    bulk update doesn't redo the items that were already updated successfully.
+    """
+
+    total: int = 3
+    """How many times to resend the failed items. `0` disables retrying."""
+
+    backoff_factor: float = 0.5
+    """The delay before the n-th retry is `backoff_factor * 2 ** (n - 1)` seconds."""
+
+    backoff_max: float = 30.0
+    """The maximal delay between retries, in seconds."""
+
+    def get_backoff_time(self, attempt: int) -> float:
+        """The number of seconds to wait before the given (1-based) retry attempt."""
+        return min(self.backoff_max, self.backoff_factor * 2 ** (attempt - 1))
+
+    @classmethod
+    def is_retryable(cls, status: int) -> bool:
+        """Whether an item that failed with the given status may succeed if resent.
+
+        Rate limiting (`429`) and server errors (`5xx`) are retryable,
+        other client errors (`4xx`) are not.
+        """
+        return status == httpx.codes.TOO_MANY_REQUESTS or httpx.codes.is_server_error(
+            status
+        )
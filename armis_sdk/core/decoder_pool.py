@@ -0,0 +1,140 @@
+import asyncio
+import collections
+import concurrent.futures
+import json
+import os
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Optional
+from typing import Type
+from typing import Union
+
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.core.asset_decoder import AssetDecoder
+from armis_sdk.core.records import Record
+from armis_sdk.entities.asset import AssetT
+
+
+class DecoderPool:
+    # pylint: disable=line-too-long
+    """
+    Decodes pages of search results in a pool of processes, so decoding scales with the number of cores.
+
+    Decoding JSON and validating the assets is CPU-bound, so a single listing is limited by one core
+    even when the responses arrive faster. A decoder pool sends the raw (JSON) bodies of the pages
+    to worker processes, which parse them, decode them with an
+    [AssetDecoder][armis_sdk.core.asset_decoder.AssetDecoder] and send back the validated assets
+    (or their compact [records][armis_sdk.core.records.Record], which are cheaper to send).
+    Pages are yielded in the order they were fetched.
+
+    The pool has `max_workers` processes (the number of CPUs by default), and decodes at most
+    `max_pending` pages at once (twice the number of workers by default), so a slow consumer
+    doesn't make it buffer the whole listing.
+
+    The asset class must be importable by the workers, so it should be defined at the top level
+    of a module (like [Device][armis_sdk.entities.device.Device]).
+    The processes are started on first use, and stopped by `close()` (or when used as a context manager).
+
+    Example:
+        Pass a pool to [AssetsClient][armis_sdk.clients.assets_client.AssetsClient] to decode all of its listings in it:
+        ```python linenums="1" hl_lines="10 11"
+        import asyncio
+
+        from armis_sdk.clients.assets_client import AssetsClient
+        from armis_sdk.core.decoder_pool import DecoderPool
+        from armis_sdk.entities.device import Device
+
+
+        async def main():
+            with DecoderPool(max_workers=4) as decoder_pool:
+                assets_client = AssetsClient(decoder_pool=decoder_pool)
+                async for device in assets_client.list_by_last_seen(Device, last_seen):
+                    print(device)
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+    ):
+        if max_pending is not None and max_pending < 1:
+            raise ArmisError("max_pending must be at least 1")
+
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._max_pending = max_pending or 2 * self._max_workers
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "DecoderPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Stop the worker processes, cancelling any pages that weren't decoded yet."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def decode_pages(
+        self,
+        asset_class: Type[AssetT],
+        contents: AsyncIterable[bytes],
+        records: bool = False,
+    ) -> AsyncIterator[Union[list[AssetT], list[Record]]]:
+        """Decode pages of search results in the worker processes.
+
+        Args:
+            asset_class: The asset class to decode. Must inherit from [Asset][armis_sdk.entities.asset.Asset].
+            contents: The raw bodies of the pages, each a JSON object with an `"items"` list
+                (see [list_page_contents][armis_sdk.core.armis_client.ArmisClient.list_page_contents]).
+            records: Whether to convert the assets into [records][armis_sdk.core.records.Record].
+
+        Yields:
+            The decoded assets (or records) of each page, in the order of the pages.
+
+        Raises:
+            pydantic.ValidationError: If any of the items is invalid.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        pending: collections.deque[asyncio.Future] = collections.deque()
+        try:
+            async for content in contents:
+                pending.append(
+                    loop.run_in_executor(
+                        executor, _decode_content, asset_class, content, records
+                    )
+                )
+                # Yield the pages that are ready, and wait for the oldest one when too many are pending.
+                while pending and (
+                    pending[0].done() or len(pending) >= self._max_pending
+                ):
+                    yield await pending.popleft()
+
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(self._max_workers)
+
+        return self._executor
+
+
+def _decode_content(
+    asset_class: Type[AssetT], content: bytes, records: bool
+) -> Union[list[AssetT], list[Record]]:
+    items = json.loads(content)["items"]
+    assets = AssetDecoder.for_class(asset_class).decode_page(items)
+    if not records:
+        return assets
+
+    record_class = Record.for_model(asset_class)
+    return [record_class.from_model(asset) for asset in assets]
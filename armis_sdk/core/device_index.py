@@ -0,0 +1,212 @@
+import sys
+from typing import AsyncIterable
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+from pydantic import BaseModel
+
+from armis_sdk.core import async_utils
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.entities.device import Device
+from armis_sdk.types.asset_id_source import AssetIdSource
+
+ADDRESS_ATTRIBUTES: dict[AssetIdSource, str] = {
+    "IPV4_ADDRESS": "ipv4_addresses",
+    "IPV6_ADDRESS": "ipv6_addresses",
+    "MAC_ADDRESS": "mac_addresses",
+    "SERIAL_NUMBER": "serial_numbers",
+}
+SITE = "SITE"
+TAG = "TAG"
+
+
+class DeviceIndex:
+    # pylint: disable=line-too-long
+    """
+    An in-memory collection of [Device][armis_sdk.entities.device.Device]s, indexed by
+    all the identifiers of [AssetIdSource][armis_sdk.types.asset_id_source.AssetIdSource],
+    site id and tags, so each lookup is a single hash lookup instead of a scan.
+
+    Devices are keyed by their `device_id`. Upserting a device with an existing id
+    replaces the previous one, including its index entries.
+    MAC addresses are matched case-insensitively.
+
+    Example:
+        ```python linenums="1" hl_lines="11 13"
+        import asyncio
+        import datetime
+
+        from armis_sdk.clients.assets_client import AssetsClient
+        from armis_sdk.core.device_index import DeviceIndex
+        from armis_sdk.entities.device import Device
+
+
+        async def main():
+            assets_client = AssetsClient()
+            index = DeviceIndex()
+            await index.ingest(assets_client.list_by_last_seen(Device, datetime.timedelta(days=1)))
+            print(index.find("1.2.3.4", "IPV4_ADDRESS"))
+            print(index.by_site(1))
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(self, devices: Iterable[Device] = ()):
+        self._devices: dict[int, Device] = {}
+        self._indexes: dict[str, dict[Hashable, set[int]]] = {
+            name: {} for name in [*ADDRESS_ATTRIBUTES, SITE, TAG]
+        }
+        self.upsert_many(devices)
+
+    def __contains__(self, device_id: object) -> bool:
+        return device_id in self._devices
+
+    def __iter__(self) -> Iterator[Device]:
+        return iter(self._devices.values())
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    def by_site(self, site_id: int) -> list[Device]:
+        """The devices that were last seen in the site with the given id."""
+        return self._lookup(SITE, site_id)
+
+    def by_tag(self, tag: str) -> list[Device]:
+        """The devices that have the given tag."""
+        return self._lookup(TAG, tag)
+
+    def find(
+        self,
+        asset_id: Union[int, str],
+        asset_id_source: AssetIdSource = "ASSET_ID",
+    ) -> list[Device]:
+        """Find devices by any of their identifiers.
+
+        Args:
+            asset_id: The identifier to look for.
+            asset_id_source: The type of the identifier.
+
+        Returns:
+            The matching devices, ordered by `device_id`. Addresses may be shared by
+            several devices, so there can be more than one.
+        """
+        if asset_id_source == "ASSET_ID":
+            try:
+                device = self.get(int(asset_id))
+            except ValueError:
+                return []
+
+            return [device] if device is not None else []
+
+        if asset_id_source not in ADDRESS_ATTRIBUTES:
+            raise ArmisError(f"Can't find devices by {asset_id_source!r}")
+
+        return self._lookup(asset_id_source, self._normalize(asset_id_source, asset_id))
+
+    def get(self, device_id: int) -> Optional[Device]:
+        """Get a device by its `device_id`, or `None` if it's not in the index."""
+        return self._devices.get(device_id)
+
+    async def ingest(
+        self, devices: Union[Iterable[Device], AsyncIterable[Device]]
+    ) -> int:
+        """Upsert all the devices of an (async) stream, such as an `AssetsClient` listing.
+
+        Returns:
+            The number of ingested devices.
+        """
+        count = 0
+        async for device in async_utils.to_async_iterator(devices):
+            self.upsert(device)
+            count += 1
+
+        return count
+
+    def memory_usage(self, deep: bool = False) -> int:
+        """Estimate the memory used by the index, in bytes.
+
+        Args:
+            deep: Whether to include the devices themselves, and not only the index structures.
+        """
+        size = sys.getsizeof(self._devices)
+        for index in self._indexes.values():
+            size += sys.getsizeof(index)
+            for key, device_ids in index.items():
+                size += sys.getsizeof(key) + sys.getsizeof(device_ids)
+
+        if deep:
+            size += sum(_sizeof(device) for device in self._devices.values())
+
+        return size
+
+    def remove(self, device_id: int) -> Optional[Device]:
+        """Remove a device from the index.
+
+        Returns:
+            The removed device, or `None` if it wasn't in the index.
+        """
+        device = self._devices.pop(device_id, None)
+        if device is not None:
+            for name, key in self._keys(device):
+                # The same key may appear twice, e.g. a MAC address in different cases.
+                if (device_ids := self._indexes[name].get(key)) is None:
+                    continue
+                device_ids.discard(device_id)
+                if not device_ids:
+                    del self._indexes[name][key]
+
+        return device
+
+    def upsert(self, device: Device):
+        """Insert a device, or replace the device with the same `device_id`."""
+        if device.device_id is None:
+            raise ArmisError("Can't index a device without a device id")
+
+        self.remove(device.device_id)
+        self._devices[device.device_id] = device
+        for name, key in self._keys(device):
+            self._indexes[name].setdefault(key, set()).add(device.device_id)
+
+    def upsert_many(self, devices: Iterable[Device]):
+        """Upsert all the given devices."""
+        for device in devices:
+            self.upsert(device)
+
+    @classmethod
+    def _keys(cls, device: Device) -> Iterator[tuple[str, Hashable]]:
+        for source, attribute in ADDRESS_ATTRIBUTES.items():
+            for value in getattr(device, attribute) or []:
+                yield source, cls._normalize(source, value)
+
+        if device.site is not None and device.site.id is not None:
+            yield SITE, device.site.id
+
+        for tag in device.tags or []:
+            yield TAG, tag
+
+    def _lookup(self, name: str, key: Hashable) -> list[Device]:
+        device_ids = self._indexes[name].get(key, ())
+        return [self._devices[device_id] for device_id in sorted(device_ids)]
+
+    @classmethod
+    def _normalize(cls, source: str, value: Union[int, str]) -> Hashable:
+        if source == "MAC_ADDRESS" and isinstance(value, str):
+            return value.lower()
+
+        return value
+
+
+def _sizeof(value: object) -> int:
+    size = sys.getsizeof(value)
+    if isinstance(value, BaseModel):
+        size += _sizeof(value.__dict__)
+    elif isinstance(value, dict):
+        size += sum(_sizeof(key) + _sizeof(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(_sizeof(item) for item in value)
+
+    return size
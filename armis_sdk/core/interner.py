@@ -0,0 +1,213 @@
+import functools
+import sys
+import typing
+from typing import Any
+from typing import Optional
+from typing import Type
+from typing import Union
+
+from pydantic import BaseModel
+
+INTERNER_MAX_SIZE = 100_000
+NoneType = type(None)
+
+ModelPlan = tuple[Type[BaseModel], bool]
+
+
+class Interner:
+    # pylint: disable=line-too-long
+    """
+    Shares identical values between decoded assets, instead of holding a copy per asset.
+
+    Devices of a tenant usually share a handful of sites and boundaries, and strings such as
+    `category`, `type`, `brand` or `os_name` repeat across millions of them. While decoding:
+
+    1. Nested entities (such as [Site][armis_sdk.entities.site.Site] or
+       [Boundary][armis_sdk.entities.boundary.Boundary]) with the same content are validated once,
+       and the same instance is used by all the assets. These instances are frozen, including
+       their lists (such as `Site.children`) and the entities nested in them, so assigning to
+       their fields or modifying their lists raises an error. Use `model_copy()` and `list()`
+       to get modifiable copies.
+    2. Strings, including the items of lists and the values of custom and integration properties,
+       are interned with [sys.intern](https://docs.python.org/3/library/sys.html#sys.intern).
+
+    At most `max_size` distinct nested entities are shared, later ones are decoded as usual.
+    Use the same interner for a whole listing (or several), so all of its assets share the values.
+
+    Example:
+        ```python linenums="1" hl_lines="6 7"
+        from armis_sdk.core.asset_decoder import AssetDecoder
+        from armis_sdk.core.interner import Interner
+        from armis_sdk.entities.device import Device
+
+        decoder = AssetDecoder.for_class(Device)
+        interner = Interner()
+        devices = decoder.decode_page(items, interner=interner)
+        assert devices[0].site is devices[1].site
+        ```
+    """
+
+    def __init__(self, max_size: int = INTERNER_MAX_SIZE):
+        self._max_size = max_size
+        self._models: dict[tuple[Type[BaseModel], str], BaseModel] = {}
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def intern_fields(
+        self, model_class: Type[BaseModel], fields: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Intern the values of a single (routed) search result.
+
+        Args:
+            model_class: The class the fields are decoded into, such as [Device][armis_sdk.entities.device.Device].
+            fields: The fields by name, with the custom and integration properties as nested dictionaries.
+
+        Returns:
+            The same fields, with shared nested entities and interned strings.
+        """
+        plans = _get_plans(model_class)
+        result = {}
+        for name, value in fields.items():
+            if (plan := plans.get(name)) is None:
+                result[name] = _intern_value(value)
+                continue
+
+            model, is_list = plan
+            if is_list and isinstance(value, list):
+                result[name] = [self.intern_model(model, item) for item in value]
+            elif not is_list:
+                result[name] = self.intern_model(model, value)
+            else:
+                result[name] = value
+
+        return result
+
+    def intern_model(self, model_class: Type[BaseModel], data: Any) -> Any:
+        """Get the shared, frozen instance of a nested entity.
+
+        Args:
+            model_class: The class of the entity, such as [Site][armis_sdk.entities.site.Site].
+            data: The raw entity. Values other than dictionaries are returned as they are.
+        """
+        if not isinstance(data, dict):
+            return data
+
+        # Items of a listing have the same key order, so the cheaper repr() is enough.
+        key = (model_class, repr(data))
+        if (model := self._models.get(key)) is None:
+            model = _get_frozen_class(model_class).model_validate(data)
+            _freeze_fields(model)
+            if len(self._models) < self._max_size:
+                self._models[key] = model
+
+        return model
+
+
+class _FrozenList(list):
+    """A list that can't be modified, which is still serialized and compared as a list."""
+
+    def _raise(self, *args, **kwargs):
+        raise TypeError("Lists of shared entities can't be modified, copy them first")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _raise
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _raise
+
+    def __reduce__(self):
+        return _FrozenList, (list(self),)
+
+
+def _freeze_fields(model: BaseModel):
+    for name, value in model.__dict__.items():
+        model.__dict__[name] = _freeze(value)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+
+    if isinstance(value, BaseModel):
+        # Entities nested in a shared one are shared as well, so they're frozen too.
+        frozen = _get_frozen_class(type(value)).model_construct(
+            value.model_fields_set, **value.__dict__
+        )
+        _freeze_fields(frozen)
+        return frozen
+
+    return value
+
+
+def _intern_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return sys.intern(value)
+
+    if isinstance(value, list):
+        return [sys.intern(item) if isinstance(item, str) else item for item in value]
+
+    if isinstance(value, dict):
+        return {
+            sys.intern(key): sys.intern(item) if isinstance(item, str) else item
+            for key, item in value.items()
+        }
+
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _get_plans(model_class: Type[BaseModel]) -> dict[str, ModelPlan]:
+    plans = {}
+    for name, field in model_class.model_fields.items():
+        if (plan := _get_plan(field.annotation)) is not None:
+            plans[name] = plan
+            if field.alias:
+                plans[field.alias] = plan
+
+    return plans
+
+
+def _get_plan(annotation: Any) -> Optional[ModelPlan]:
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is Union:
+        args = tuple(arg for arg in args if arg is not NoneType)
+        return _get_plan(args[0]) if len(args) == 1 else None
+
+    if origin in (list, typing.List):
+        if (model := _get_model(args[0])) is not None:
+            return model, True
+        return None
+
+    if (model := _get_model(annotation)) is not None:
+        return model, False
+
+    return None
+
+
+def _get_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_frozen_class(model_class: Type[BaseModel]) -> Type[BaseModel]:
+    def __eq__(self, other: Any) -> bool:  # pylint: disable=invalid-name
+        # Frozen instances are equal to unfrozen ones with the same content.
+        if type(other) in (model_class, type(self)):
+            return self.__dict__ == other.__dict__
+
+        return NotImplemented
+
+    # Named like the original class, so frozen instances look the same when printed.
+    return type(
+        model_class.__name__,
+        (model_class,),
+        {
+            "__module__": model_class.__module__,
+            "__qualname__": model_class.__qualname__,
+            "__eq__": __eq__,
+            "__hash__": None,
+            "model_config": {**model_class.model_config, "frozen": True},
+        },
+    )
@@ -0,0 +1,132 @@
+import functools
+from typing import Annotated
+from typing import Any
+from typing import Generic
+from typing import Type
+
+from pydantic import ConfigDict
+from pydantic import TypeAdapter
+
+from armis_sdk.entities.asset import Asset
+from armis_sdk.entities.asset import AssetT
+
+
+class LazyAsset(Generic[AssetT]):
+    # pylint: disable=line-too-long
+    """
+    An asset whose nested entities are validated only when they're first accessed.
+
+    Created by [decode_page_lazy][armis_sdk.core.asset_decoder.AssetDecoder.decode_page_lazy],
+    which validates the top-level fields of an asset and keeps the raw values of its nested
+    entities (such as the `site`, `boundaries` and `network_interfaces` of a
+    [Device][armis_sdk.entities.device.Device]). Reading one of these fields validates it
+    and caches the result, so consumers that only read top-level fields skip most of the
+    validation. Validation errors of these fields are raised on access.
+
+    Reading any other attribute, such as calling a method of the asset, first validates all
+    the remaining fields, as does [load][armis_sdk.core.lazy_asset.LazyAsset.load].
+    A lazy asset isn't an [Asset][armis_sdk.entities.asset.Asset] itself, so pass the result
+    of `load()` to anything that expects one (e.g. a `TypeAdapter` or another entity).
+
+    Example:
+        ```python linenums="1" hl_lines="5 6 7"
+        from armis_sdk.core.asset_decoder import AssetDecoder
+        from armis_sdk.entities.device import Device
+
+        decoder = AssetDecoder.for_class(Device)
+        (lazy_device,) = decoder.decode_page_lazy([{"fields": {"device_id": 1, "site": {"id": 2}}}])
+        print(lazy_device.device_id, lazy_device.site)
+        device = lazy_device.load()
+        ```
+    """
+
+    __slots__ = ("_asset", "_raw")
+
+    def __init__(self, asset: AssetT, raw: dict[str, Any]):
+        """
+        Args:
+            asset: The asset, validated without the raw fields.
+            raw: The raw values of the remaining fields by name, e.g. `{"site": {"id": 1}}`.
+        """
+        self._asset = asset
+        self._raw = raw
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyAsset):
+            other = other.load()
+
+        return self.load() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __getattr__(self, name: str) -> Any:
+        # Slots that aren't set yet (e.g. while unpickling) and special names aren't proxied.
+        if name in LazyAsset.__slots__ or name.startswith("__"):
+            raise AttributeError(name)
+
+        if name in self._raw:
+            return self._load_field(name)
+
+        if name not in type(self._asset).model_fields:
+            self.load()
+
+        return getattr(self._asset, name)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.load()!r})"
+
+    def __setattr__(self, name: str, value: Any):
+        if name in LazyAsset.__slots__:
+            object.__setattr__(self, name, value)
+            return
+
+        # The assigned value replaces the raw one.
+        self._raw.pop(name, None)
+        setattr(self._asset, name, value)
+
+    @property
+    def asset_type(self) -> str:
+        """The `asset_type` of the asset, without loading it."""
+        return self._asset.asset_type
+
+    @property
+    def lazy_fields(self) -> list[str]:
+        """The names of the fields that weren't validated yet."""
+        return list(self._raw)
+
+    def load(self) -> AssetT:
+        """Validate all the remaining fields.
+
+        Returns:
+            The asset, which is the same object on every call.
+
+        Raises:
+            pydantic.ValidationError: If any of the remaining fields is invalid.
+        """
+        for name in list(self._raw):
+            self._load_field(name)
+
+        return self._asset
+
+    def _load_field(self, name: str) -> Any:
+        adapter = _get_field_adapter(type(self._asset), name)
+        value = adapter.validate_python(self._raw[name])
+        del self._raw[name]
+        # The field already has its default, so setting it keeps the order of the fields.
+        self._asset.__dict__[name] = value
+        self._asset.__pydantic_fields_set__.add(name)
+        return value
+
+
+@functools.lru_cache(maxsize=None)
+def _get_field_adapter(asset_class: Type[Asset], name: str) -> TypeAdapter:
+    field = asset_class.model_fields[name]
+    annotation = field.annotation
+    if field.metadata:
+        # The metadata holds the constraints and validators of the field, without its aliases.
+        annotation = Annotated[(annotation, *field.metadata)]
+
+    return TypeAdapter(
+        annotation,
+        config=ConfigDict(strict=asset_class.model_config.get("strict", False)),
+    )
@@ -0,0 +1,229 @@
+import functools
+import typing
+from typing import Any
+from typing import ClassVar
+from typing import Optional
+from typing import Type
+from typing import TypeVar
+from typing import Union
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from armis_sdk.core.lazy_asset import LazyAsset
+from armis_sdk.entities.boundary import Boundary
+from armis_sdk.entities.device import Device
+from armis_sdk.entities.network_interface import NetworkInterface
+
+RecordT = TypeVar("RecordT", bound="Record")
+NoneType = type(None)
+
+VALUE = 0
+LIST = 1
+MODEL = 2
+MODEL_LIST = 3
+
+FieldPlan = tuple[str, int, Optional[Type[BaseModel]]]
+
+
+class Record:
+    # pylint: disable=line-too-long
+    """
+    A base class for compact, slotted versions of entities, for holding many of them in memory.
+
+    A record class is generated from the fields of an entity with
+    [for_model][armis_sdk.core.records.Record.for_model], and has an attribute per field.
+    Unlike the entity, a record has no `__dict__`, no validation and no change tracking, so it takes a
+    fraction of the memory. Nested entities are converted into records as well, and lists into tuples.
+    Converting an entity into a record and back returns an equal entity.
+
+    Records of [Device][armis_sdk.entities.device.Device],
+    [NetworkInterface][armis_sdk.entities.network_interface.NetworkInterface] and
+    [Boundary][armis_sdk.entities.boundary.Boundary] are available as `DeviceRecord`,
+    `NetworkInterfaceRecord` and `BoundaryRecord`.
+
+    Example:
+        ```python linenums="1" hl_lines="4 6"
+        from armis_sdk.core.records import DeviceRecord
+        from armis_sdk.entities.device import Device
+
+        record = DeviceRecord.from_model(Device(device_id=1, tags=["Critical"]))
+        print(record.device_id, record.tags)  # 1 ('Critical',)
+        device = record.to_model()
+        ```
+    """
+
+    __slots__ = ()
+
+    model_class: ClassVar[Type[BaseModel]]
+    """The entity class that this record class was generated from."""
+
+    _plans: ClassVar[tuple[FieldPlan, ...]] = ()
+    _defaults: ClassVar[dict[str, Any]] = {}
+
+    def __init__(self, **values: Any):
+        for name, _, _ in self._plans:
+            if name in values:
+                value = values.pop(name)
+            elif name in self._defaults:
+                value = self._defaults[name]()
+            else:
+                raise TypeError(f"{type(self).__name__} is missing the field {name!r}")
+            setattr(self, name, value)
+
+        if values:
+            names_str = ", ".join(map(repr, values))
+            raise TypeError(f"{type(self).__name__} has no fields {names_str}")
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return all(
+            getattr(self, name) == getattr(other, name) for name, _, _ in self._plans
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self):
+        # Generated record classes can't be imported by name, so they're created again.
+        values = tuple(getattr(self, name) for name, _, _ in self._plans)
+        return _restore_record, (self.model_class, values)
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name, _, _ in self._plans
+        )
+        return f"{type(self).__name__}({values})"
+
+    @classmethod
+    def for_model(cls, model_class: Type[BaseModel]) -> Type["Record"]:
+        """Get the (cached) record class of an entity class.
+
+        Args:
+            model_class: The entity class, such as [Device][armis_sdk.entities.device.Device].
+
+        Returns:
+            A class named `"{ClassName}Record"` that inherits from [Record][armis_sdk.core.records.Record].
+        """
+        return _create_record_class(model_class)
+
+    @classmethod
+    def from_model(cls: Type[RecordT], model: Union[BaseModel, LazyAsset]) -> RecordT:
+        """Create a record from an entity of the record's `model_class` (or a lazy asset, which is loaded)."""
+        record = cls.__new__(cls)
+        if isinstance(model, LazyAsset):
+            model = model.load()
+        values = model.__dict__
+        for name, kind, nested in cls._plans:
+            value = values.get(name)
+            if value is not None:
+                if kind == LIST:
+                    value = tuple(value)
+                elif kind == MODEL:
+                    value = _to_record(nested, value)
+                elif kind == MODEL_LIST:
+                    value = tuple(_to_record(nested, item) for item in value)
+            setattr(record, name, value)
+
+        return record
+
+    def to_model(self) -> BaseModel:
+        """Create an entity from the record, without validating it again.
+
+        For assets, all the custom and integration properties are considered changed
+        (see [changed_fields][armis_sdk.entities.asset.Asset.changed_fields]).
+        """
+        values = {}
+        for name, kind, _ in self._plans:
+            value = getattr(self, name)
+            if value is not None:
+                if kind == LIST:
+                    value = list(value)
+                elif kind == MODEL:
+                    value = value.to_model() if isinstance(value, Record) else value
+                elif kind == MODEL_LIST:
+                    value = [
+                        item.to_model() if isinstance(item, Record) else item
+                        for item in value
+                    ]
+            values[name] = value
+
+        return self.model_class.model_construct(**values)
+
+
+def _restore_record(model_class: Type[BaseModel], values: tuple) -> Record:
+    record_class = _create_record_class(model_class)
+    record = record_class.__new__(record_class)
+    for name, value in zip(record_class.__slots__, values):
+        setattr(record, name, value)
+
+    return record
+
+
+def _to_record(model_class: Optional[Type[BaseModel]], value: Any) -> Any:
+    if model_class is None or not isinstance(value, model_class):
+        return value
+
+    return _create_record_class(model_class).from_model(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _create_record_class(model_class: Type[BaseModel]) -> Type[Record]:
+    plans = []
+    defaults = {}
+    for name, field in model_class.model_fields.items():
+        kind, nested = _get_plan(field.annotation)
+        plans.append((name, kind, nested))
+        if field.default_factory is not None:
+            factory = field.default_factory
+            if kind in (LIST, MODEL_LIST):
+                # Lists are stored as tuples, so are their defaults.
+                defaults[name] = lambda factory=factory: tuple(factory())
+            else:
+                defaults[name] = factory
+        elif field.default is not PydanticUndefined:
+            defaults[name] = lambda value=field.default: value
+
+    return type(
+        f"{model_class.__name__}Record",
+        (Record,),
+        {
+            "__slots__": tuple(name for name, _, _ in plans),
+            "__module__": __name__,
+            "__doc__": f"A compact record of `{model_class.__name__}`.",
+            "model_class": model_class,
+            "_plans": tuple(plans),
+            "_defaults": defaults,
+        },
+    )
+
+
+def _get_plan(annotation: Any) -> tuple[int, Optional[Type[BaseModel]]]:
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is Union:
+        args = tuple(arg for arg in args if arg is not NoneType)
+        return _get_plan(args[0]) if len(args) == 1 else (VALUE, None)
+
+    if origin in (list, typing.List):
+        if (model := _get_model(args[0])) is not None:
+            return MODEL_LIST, model
+        return LIST, None
+
+    if (model := _get_model(annotation)) is not None:
+        return MODEL, model
+
+    return VALUE, None
+
+
+def _get_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    return None
+
+
+DeviceRecord = _create_record_class(Device)
+NetworkInterfaceRecord = _create_record_class(NetworkInterface)
+BoundaryRecord = _create_record_class(Boundary)
@@ -0,0 +1,204 @@
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.entities.site import Site
+
+
+class SiteTree:
+    # pylint: disable=line-too-long
+    """
+    An in-memory index of the hierarchy of [Site][armis_sdk.entities.site.Site]s, for answering
+    parent, children, depth, ancestor and descendant queries without walking the sites.
+
+    Sites are keyed by their `id`, and linked to their parents by `parent_id`. Sites whose parent
+    isn't in the tree are roots, like in [hierarchy][armis_sdk.clients.sites_client.SitesClient.hierarchy].
+    Unlike it, the sites' `children` aren't modified; use `children()` instead.
+
+    The sites are numbered in depth-first order, so the descendants of a site are a contiguous
+    range of that order: listing them takes O(k) for k descendants and checking whether a site
+    is a descendant of another takes O(1). Upserting and removing sites updates the parent-child
+    links immediately, and the order is recomputed (in O(n)) on the next query that needs it.
+
+    Usually obtained from [tree][armis_sdk.clients.sites_client.SitesClient.tree], which caches it
+    and keeps it up to date with the sites created, updated and deleted by the client.
+
+    Example:
+        ```python linenums="1" hl_lines="8 9 10"
+        import asyncio
+
+        from armis_sdk.clients.sites_client import SitesClient
+
+
+        async def main():
+            sites_client = SitesClient()
+            tree = await sites_client.tree()
+            print(tree.descendants(1))
+            print(tree.ancestors(5))
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(self, sites: Iterable[Site] = ()):
+        self._sites: dict[int, Site] = {}
+        self._children: dict[Optional[int], dict[int, None]] = {}
+        self._order: list[int] = []
+        self._starts: dict[int, int] = {}
+        self._ends: dict[int, int] = {}
+        self._depths: dict[int, int] = {}
+        self._dirty = False
+        self.upsert_many(sites)
+
+    def __contains__(self, site_id: object) -> bool:
+        return site_id in self._sites
+
+    def __iter__(self) -> Iterator[Site]:
+        return iter(self._sites.values())
+
+    def __len__(self) -> int:
+        return len(self._sites)
+
+    @property
+    def roots(self) -> list[Site]:
+        """The sites whose parent isn't in the tree."""
+        self._ensure_order()
+        return [
+            self._sites[site_id]
+            for site_id in self._order
+            if self._depths[site_id] == 0
+        ]
+
+    def ancestors(self, site_id: int) -> list[Site]:
+        """The ancestors of a site, from its parent up to its root."""
+        ancestors = []
+        while (parent := self.parent(site_id)) is not None:
+            ancestors.append(parent)
+            site_id = parent.id  # type: ignore[assignment]
+
+        return ancestors
+
+    def children(self, site_id: int) -> list[Site]:
+        """The sites directly under a site."""
+        self._get(site_id)
+        return [self._sites[child] for child in self._children.get(site_id, ())]
+
+    def depth(self, site_id: int) -> int:
+        """The number of ancestors of a site, which is `0` for roots."""
+        self._get(site_id)
+        self._ensure_order()
+        return self._depths[site_id]
+
+    def descendants(self, site_id: int) -> list[Site]:
+        """All the sites under a site, in depth-first order."""
+        self._get(site_id)
+        self._ensure_order()
+        order = self._order[self._starts[site_id] + 1 : self._ends[site_id]]
+        return [self._sites[descendant] for descendant in order]
+
+    def get(self, site_id: int) -> Optional[Site]:
+        """Get a site by its id, or `None` if it isn't in the tree."""
+        return self._sites.get(site_id)
+
+    def is_ancestor(self, ancestor_id: int, site_id: int) -> bool:
+        """Whether a site is under another one (at any depth)."""
+        self._get(ancestor_id)
+        self._get(site_id)
+        self._ensure_order()
+        start = self._starts[site_id]
+        return self._starts[ancestor_id] < start < self._ends[ancestor_id]
+
+    def parent(self, site_id: int) -> Optional[Site]:
+        """The parent of a site, or `None` for roots."""
+        site = self._get(site_id)
+        self._ensure_order()
+        if self._depths[site_id] == 0:
+            return None
+
+        return self._sites[site.parent_id]  # type: ignore[index]
+
+    def remove(self, site_id: int) -> Optional[Site]:
+        """Remove a site, making its children roots.
+
+        Returns:
+            The removed site, or `None` if it isn't in the tree.
+        """
+        if (site := self._sites.pop(site_id, None)) is None:
+            return None
+
+        self._unlink(site)
+        self._dirty = True
+        return site
+
+    def upsert(self, site: Site):
+        """Insert a site, or replace the site with the same id (possibly moving it)."""
+        if site.id is None:
+            raise ArmisError("Can't add a site without an id to the tree.")
+
+        if (previous := self._sites.get(site.id)) is not None:
+            self._unlink(previous)
+
+        self._sites[site.id] = site
+        self._children.setdefault(site.parent_id, {})[site.id] = None
+        self._dirty = True
+
+    def upsert_many(self, sites: Iterable[Site]):
+        """Upsert several sites."""
+        for site in sites:
+            self.upsert(site)
+
+    def _ensure_order(self):
+        if not self._dirty:
+            return
+
+        self._order = []
+        self._starts = {}
+        self._ends = {}
+        self._depths = {}
+        roots = [
+            site_id
+            for site_id, site in self._sites.items()
+            if site.parent_id not in self._sites
+        ]
+        self._visit(roots)
+        # Sites in a cycle of parents have no root, so one of each cycle is treated as one.
+        for site_id in self._sites:
+            if site_id not in self._starts:
+                self._visit([site_id])
+
+        self._dirty = False
+
+    def _get(self, site_id: int) -> Site:
+        if (site := self._sites.get(site_id)) is None:
+            raise ArmisError(f"Site {site_id} isn't in the tree.")
+
+        return site
+
+    def _unlink(self, site: Site):
+        siblings = self._children.get(site.parent_id)
+        if siblings is not None:
+            siblings.pop(site.id, None)  # type: ignore[arg-type]
+            if not siblings:
+                del self._children[site.parent_id]
+
+    def _visit(self, roots: list[int]):
+        # An iterative depth-first traversal, so deep hierarchies don't hit the recursion limit.
+        stack: list[tuple[int, int, bool]] = [
+            (site_id, 0, False) for site_id in reversed(roots)
+        ]
+        while stack:
+            site_id, depth, is_exit = stack.pop()
+            if is_exit:
+                self._ends[site_id] = len(self._order)
+                continue
+
+            if site_id in self._starts:
+                continue
+
+            self._starts[site_id] = len(self._order)
+            self._depths[site_id] = depth
+            self._order.append(site_id)
+            stack.append((site_id, depth, True))
+            children = self._children.get(site_id, ())
+            stack.extend((child, depth + 1, False) for child in reversed(children))
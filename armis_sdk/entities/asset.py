@@ -1,16 +1,26 @@
 import collections
+import copy
+import functools
 from typing import Any
 from typing import ClassVar
 from typing import DefaultDict
 from typing import Literal
+from typing import Optional
 from typing import Type
 from typing import TypeVar
 
 from pydantic import Field
+from pydantic import PrivateAttr
+from pydantic import create_model
 
+from armis_sdk.core.armis_error import ArmisError
 from armis_sdk.core.base_entity import BaseEntity
+from armis_sdk.core.interner import Interner
 
 AssetT = TypeVar("AssetT", bound="Asset")
+TRACKED_PROPERTIES = ("custom", "integration")
+IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+_MISSING = object()
 
 
 class Asset(BaseEntity):
@@ -25,8 +35,61 @@ class Asset(BaseEntity):
     integration: dict[str, Any] = Field(default_factory=dict)
     """Integration properties of the asset. Values can by anything."""
 
+    _snapshot: Optional[dict[str, dict[str, Any]]] = PrivateAttr(default=None)
+
+    def __eq__(self, other: Any) -> bool:
+        # The snapshot used for tracking changes isn't part of the asset's data.
+        if isinstance(other, Asset):
+            return type(self) is type(other) and self.__dict__ == other.__dict__
+
+        return NotImplemented
+
+    def changed_fields(self) -> list[str]:
+        """The custom and integration properties that changed since the asset was fetched.
+
+        Assets returned by [AssetsClient][armis_sdk.clients.assets_client.AssetsClient]
+        remember the values of their `custom` and `integration` properties,
+        so any property that was set, modified or removed since is reported.
+        For assets that were created locally, all the properties are reported.
+
+        Returns:
+            A sorted list of fields, e.g. `["custom.MyField", "integration.MyField"]`.
+        """
+        changed = []
+        for name in TRACKED_PROPERTIES:
+            current = getattr(self, name)
+            previous = self._snapshot[name] if self._snapshot is not None else {}
+            for key in current.keys() | previous.keys():
+                if current.get(key, _MISSING) != previous.get(key, _MISSING):
+                    changed.append(f"{name}.{key}")
+
+        return sorted(changed)
+
+    def mark_clean(self):
+        """Remember the current custom and integration properties as unchanged."""
+        self._snapshot = {
+            name: {
+                key: (
+                    value
+                    if isinstance(value, IMMUTABLE_TYPES)
+                    else copy.deepcopy(value)
+                )
+                for key, value in getattr(self, name).items()
+            }
+            for name in TRACKED_PROPERTIES
+        }
+
     @classmethod
-    def from_search_result(cls: Type[AssetT], data: dict) -> AssetT:
+    def from_search_result(
+        cls: Type[AssetT], data: dict, interner: Optional[Interner] = None
+    ) -> AssetT:
+        """Create an asset from a single search result.
+
+        Args:
+            data: The search result, with a `"fields"` dictionary.
+            interner: An optional [Interner][armis_sdk.core.interner.Interner] that shares
+                identical nested entities and strings between assets.
+        """
         fields: DefaultDict[str, Any] = collections.defaultdict(dict)
         for key, value in data["fields"].items():
             if len(parts := key.split(".", 1)) > 1:
@@ -35,7 +98,65 @@ class Asset(BaseEntity):
             else:
                 fields[key] = value
 
-        return cls(**fields)
+        if interner is not None:
+            asset = cls(**interner.intern_fields(cls, fields))
+        else:
+            asset = cls(**fields)
+        asset.mark_clean()
+        return asset
+
+    @classmethod
+    def projection(
+        cls: Type[AssetT], *fields: str, name: Optional[str] = None
+    ) -> Type["Asset"]:
+        # pylint: disable=line-too-long
+        """Create a slim asset class that has only some of the fields of this class.
+
+        Listing a projection with [AssetsClient][armis_sdk.clients.assets_client.AssetsClient]
+        requests only its fields (when no explicit `fields` are given),
+        which makes both the responses and their decoding cheaper.
+        The fields keep their types and defaults, and the `custom` and `integration`
+        properties are always included. Projections are cached, so projecting the
+        same fields twice returns the same class.
+
+        Args:
+            *fields: The names of the fields to keep.
+            name: The name of the created class. Defaults to `"{ClassName}Projection"`.
+
+        Returns:
+            A new class that inherits from [Asset][armis_sdk.entities.asset.Asset].
+
+        Raises:
+            ArmisError: If any of the fields doesn't exist.
+
+        Example:
+            ```python linenums="1" hl_lines="8"
+            import asyncio
+            import datetime
+
+            from armis_sdk.clients.assets_client import AssetsClient
+            from armis_sdk.entities.device import Device
+
+
+            class DeviceSummary(Device.projection("device_id", "last_seen")):
+                pass
+
+
+            async def main():
+                assets_client = AssetsClient()
+                async for device in assets_client.list_by_last_seen(DeviceSummary, datetime.timedelta(days=1)):
+                    print(device.device_id, device.last_seen)
+
+            asyncio.run(main())
+            ```
+        """
+        if invalid_fields := sorted(set(fields) - cls.all_fields()):
+            fields_str = ", ".join(map(repr, invalid_fields))
+            raise ArmisError(
+                f"The following fields don't exist on {cls.__name__!r}: {fields_str}"
+            )
+
+        return _create_projection(cls, tuple(sorted(set(fields))), name)
 
     @classmethod
     def all_fields(cls) -> set[str]:
@@ -45,3 +166,24 @@ class Asset(BaseEntity):
             "custom",
             "integration",
         }  # pylint: disable=no-member
+
+
+@functools.lru_cache(maxsize=None)
+def _create_projection(
+    asset_class: Type[Asset], fields: tuple[str, ...], name: Optional[str]
+) -> Type[Asset]:
+    definitions: dict[str, Any] = {
+        field: (
+            asset_class.model_fields[field].annotation,
+            copy.copy(asset_class.model_fields[field]),
+        )
+        for field in fields
+    }
+    projection = create_model(  # type: ignore[call-overload]
+        name or f"{asset_class.__name__}Projection",
+        __base__=Asset,
+        __module__=asset_class.__module__,
+        **definitions,
+    )
+    projection.asset_type = asset_class.asset_type
+    return projection
@@ -116,3 +116,20 @@ class Device(Asset):
 
     visibility: Optional[Literal["Full", "Limited"]] = None
     """Whether the device is fully visibly or limited."""
+
+
+LIGHT_DEVICE_FIELDS = sorted(
+    Device.all_fields() - {"boundaries", "network_interfaces", "site"}
+)
+
+
+class LightDevice(Device.projection(*LIGHT_DEVICE_FIELDS)):  # type: ignore[misc]
+    # pylint: disable=line-too-long,too-few-public-methods
+    """
+    A light profile of [Device][armis_sdk.entities.device.Device], that has all of its fields except the
+    heavy nested `boundaries`, `network_interfaces` and `site`.
+
+    Use it instead of [Device][armis_sdk.entities.device.Device] when listing many devices
+    and only their top-level fields are needed. See [projection][armis_sdk.entities.asset.Asset.projection]
+    for creating other projections.
+    """
@@ -0,0 +1,111 @@
+"""
+Measures how fast search results are decoded into devices.
+
+Usage:
+    python -m benchmarks.decode_benchmark [--items 20000] [--page-size 1000] [--repeat 5]
+"""
+
+import argparse
+import timeit
+from typing import Callable
+
+from armis_sdk.core.asset_decoder import AssetDecoder
+from armis_sdk.entities.device import Device
+
+
+def make_item(index: int) -> dict:
+    return {
+        "asset_id": index,
+        "fields": {
+            "boundaries": [{"id": 1, "name": "Corporate"}],
+            "brand": "VMware",
+            "category": "Computers",
+            "custom.Owner": f"owner-{index % 100}",
+            "custom.Team": "IT",
+            "device_id": index,
+            "display": f"device-{index}",
+            "first_seen": "2025-05-14T08:34:10",
+            "integration.Source": "CMDB",
+            "ipv4_addresses": [f"10.0.{index // 256 % 256}.{index % 256}"],
+            "ipv6_addresses": [],
+            "last_seen": "2025-12-03T13:52:45",
+            "mac_addresses": [
+                f"43:87:a2:05:{index // 256 % 256:02x}:{index % 256:02x}"
+            ],
+            "model": "VMware",
+            "names": [f"device-{index}"],
+            "network_interfaces": [
+                {
+                    "alias": None,
+                    "brand": None,
+                    "broadcast_ssid": None,
+                    "channels": [],
+                    "description": None,
+                    "hidden_broadcast_ssid": None,
+                    "ipv4_address": None,
+                    "ipv6_address": None,
+                    "last_connected_ssid": None,
+                    "mac_address": "43:87:a2:05:bc:56",
+                    "name": None,
+                    "type": None,
+                    "vlan": 1,
+                }
+            ],
+            "os_name": "Windows",
+            "os_version": "Server 2016",
+            "purdue_level": 4.0,
+            "risk_level": 80,
+            "serial_numbers": None,
+            "site": {"id": 1, "location": "Geneva", "name": "Geneva", "tier": None},
+            "tags": ["Critical Vulnerabilities", "Misconfigurations"],
+            "type": "Virtual Machines",
+            "visibility": "Full",
+        },
+    }
+
+
+def measure(
+    name: str,
+    pages: list[list[dict]],
+    decode: Callable[[list[dict]], list],
+    repeat: int,
+):
+    count = sum(map(len, pages))
+    elapsed = min(
+        timeit.repeat(lambda: [decode(page) for page in pages], number=1, repeat=repeat)
+    )
+    print(f"{name:<32} {count / elapsed:>12,.0f} items/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    items = [make_item(index) for index in range(args.items)]
+    pages = [
+        items[start : start + args.page_size]
+        for start in range(0, len(items), args.page_size)
+    ]
+
+    decoder = AssetDecoder.for_class(Device)
+    measure(
+        "Device.from_search_result",
+        pages,
+        lambda page: [Device.from_search_result(item) for item in page],
+        args.repeat,
+    )
+    measure("AssetDecoder", pages, decoder.decode_page, args.repeat)
+    measure("AssetDecoder (lazy)", pages, decoder.decode_page_lazy, args.repeat)
+    measure(
+        "AssetDecoder (lazy, loaded)",
+        pages,
+        lambda page: [device.load() for device in decoder.decode_page_lazy(page)],
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
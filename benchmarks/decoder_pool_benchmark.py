@@ -0,0 +1,89 @@
+"""
+Measures how fast raw pages of search results are decoded in process and in a decoder pool.
+
+Usage:
+    python -m benchmarks.decoder_pool_benchmark [--items 50000] [--page-size 1000] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import AsyncIterator
+from typing import Callable
+
+from armis_sdk.core.asset_decoder import AssetDecoder
+from armis_sdk.core.decoder_pool import DecoderPool
+from armis_sdk.entities.device import Device
+from benchmarks.decode_benchmark import make_item
+
+
+async def iterate(contents: list[bytes]) -> AsyncIterator[bytes]:
+    for content in contents:
+        yield content
+
+
+async def measure(
+    name: str,
+    contents: list[bytes],
+    decode: Callable[[AsyncIterator[bytes]], AsyncIterator[list]],
+):
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    count = 0
+    async for page in decode(iterate(contents)):
+        count += len(page)
+    elapsed = time.perf_counter() - started
+    # With enough cores for the workers, the CPU time of this process bounds the throughput.
+    cpu_elapsed = time.process_time() - cpu_started
+    print(
+        f"{name:<40} {count / elapsed:>10,.0f} items/sec "
+        f"{count / cpu_elapsed:>10,.0f} items/sec of event loop CPU"
+    )
+
+
+async def decode_in_process(contents: AsyncIterator[bytes]) -> AsyncIterator[list]:
+    decoder = AssetDecoder.for_class(Device)
+    async for content in contents:
+        yield decoder.decode_page(json.loads(content)["items"])
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    contents = [
+        json.dumps(
+            {
+                "items": [
+                    make_item(index)
+                    for index in range(start, min(start + args.page_size, args.items))
+                ]
+            }
+        ).encode()
+        for start in range(0, args.items, args.page_size)
+    ]
+
+    await measure("In process", contents, decode_in_process)
+    with DecoderPool(max_workers=args.workers) as decoder_pool:
+        # Start the workers before measuring.
+        await measure(
+            "(warm-up)", contents[:1], lambda c: decoder_pool.decode_pages(Device, c)
+        )
+        await measure(
+            f"DecoderPool ({args.workers} workers)",
+            contents,
+            lambda c: decoder_pool.decode_pages(Device, c),
+        )
+        await measure(
+            f"DecoderPool ({args.workers} workers, records)",
+            contents,
+            lambda c: decoder_pool.decode_pages(Device, c, records=True),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
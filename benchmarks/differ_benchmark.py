@@ -0,0 +1,57 @@
+"""
+Measures how fast devices are digested by the AssetDiffer, compared with decoding them.
+
+Usage:
+    python -m benchmarks.differ_benchmark [--items 20000] [--repeat 5]
+"""
+
+import argparse
+import timeit
+from typing import Callable
+
+from armis_sdk.core.asset_decoder import AssetDecoder
+from armis_sdk.core.asset_differ import AssetDiffer
+from armis_sdk.entities.device import Device
+from benchmarks.decode_benchmark import make_item
+
+
+def measure(name: str, count: int, run: Callable[[], list], repeat: int):
+    elapsed = min(timeit.repeat(run, number=1, repeat=repeat))
+    print(f"{name:<32} {count / elapsed:>12,.0f} items/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    items = [make_item(index) for index in range(args.items)]
+    decoder = AssetDecoder.for_class(Device)
+    devices = decoder.decode_page(items)
+
+    measure("AssetDecoder", len(items), lambda: decoder.decode_page(items), args.repeat)
+    measure(
+        "Device.model_dump (JSON)",
+        len(devices),
+        lambda: [device.model_dump(mode="json") for device in devices],
+        args.repeat,
+    )
+    differ = AssetDiffer()
+    measure(
+        "AssetDiffer (all fields)",
+        len(devices),
+        lambda: [differ.digest(device) for device in devices],
+        args.repeat,
+    )
+    differ = AssetDiffer(fields=["ipv4_addresses", "tags", "custom.Owner"])
+    measure(
+        "AssetDiffer (3 fields)",
+        len(devices),
+        lambda: [differ.digest(device) for device in devices],
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
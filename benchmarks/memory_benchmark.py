@@ -0,0 +1,69 @@
+"""
+Measures how much memory a listing of devices holds, with and without interning.
+
+Usage:
+    python -m benchmarks.memory_benchmark [--items 1000000] [--page-size 1000] [--sites 50]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Optional
+
+from armis_sdk.core.asset_decoder import AssetDecoder
+from armis_sdk.core.interner import Interner
+from armis_sdk.entities.device import Device
+from benchmarks.decode_benchmark import make_item
+
+
+def make_page(start: int, size: int, sites: int) -> list[dict]:
+    items = [make_item(index) for index in range(start, start + size)]
+    for item in items:
+        # Each item carries its own copy of the strings and nested objects, like a real response.
+        fields = item["fields"]
+        site_id = fields["device_id"] % sites
+        fields["site"] = {
+            "id": site_id,
+            "name": f"site-{site_id}",
+            "tier": "".join(["Tier ", "1"]),
+        }
+        fields["category"] = "".join(["Compu", "ters"])
+        fields["os_name"] = "".join(["Win", "dows"])
+    return items
+
+
+def measure(name: str, args: argparse.Namespace, interner: Optional[Interner]):
+    decoder = AssetDecoder.for_class(Device)
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    devices = []
+    for start in range(0, args.items, args.page_size):
+        page = make_page(start, min(args.page_size, args.items - start), args.sites)
+        devices.extend(decoder.decode_page(page, interner=interner))
+        del page
+
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<16} {current / 2**20:>10,.0f} MiB "
+        f"{current / len(devices):>8,.0f} bytes/device {elapsed:>8.1f} sec"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--sites", type=int, default=50)
+    args = parser.parse_args()
+
+    measure("Plain", args, None)
+    measure("Interned", args, Interner())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Measures the memory and construction speed of devices as pydantic models and as records.
+
+Usage:
+    python -m benchmarks.records_benchmark [--items 100000] [--page-size 1000]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable
+
+from armis_sdk.core.asset_decoder import AssetDecoder
+from armis_sdk.core.records import DeviceRecord
+from armis_sdk.entities.device import Device
+from benchmarks.decode_benchmark import make_item
+
+
+def measure(name: str, pages: list[list[dict]], decode: Callable[[list[dict]], list]):
+    count = sum(map(len, pages))
+    gc.collect()
+    started = time.perf_counter()
+    results = [decode(page) for page in pages]
+    elapsed = time.perf_counter() - started
+    del results
+
+    gc.collect()
+    tracemalloc.start()
+    results = [decode(page) for page in pages]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    print(
+        f"{name:<16} {count / elapsed:>10,.0f} items/sec "
+        f"{current / 2**20:>8,.0f} MiB {current / count:>8,.0f} bytes/item"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    items = [make_item(index) for index in range(args.items)]
+    pages = [
+        items[start : start + args.page_size]
+        for start in range(0, len(items), args.page_size)
+    ]
+
+    decoder = AssetDecoder.for_class(Device)
+    measure("Device", pages, decoder.decode_page)
+    measure(
+        "DeviceRecord",
+        pages,
+        lambda page: [
+            DeviceRecord.from_model(device) for device in decoder.decode_page(page)
+        ],
+    )
+
+    records = [
+        DeviceRecord.from_model(device)
+        for page in pages
+        for device in decoder.decode_page(page)
+    ]
+    started = time.perf_counter()
+    for record in records:
+        record.to_model()
+    elapsed = time.perf_counter() - started
+    print(f"{'to_model':<16} {len(records) / elapsed:>10,.0f} items/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+import pytest
+import pytest_httpx
+
+from armis_sdk.clients import asset_field_schema
+from armis_sdk.clients.asset_field_schema import AssetFieldSchema
+from armis_sdk.clients.asset_field_schema import FieldSpec
+from armis_sdk.clients.assets_client import AssetsClient
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.entities.asset_field_description import AssetFieldDescription
+from armis_sdk.entities.device import Device
+from armis_sdk.entities.device_custom_property import DeviceCustomProperty
+
+pytest_plugins = ["tests.plugins.auto_setup_plugin"]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class Server:
+    def __init__(self):
+        self.fields = [
+            AssetFieldDescription(name="device_id", type="integer"),
+            AssetFieldDescription(name="custom.Tags", type="string", is_list=True),
+            AssetFieldDescription(name="integration.qualys_id", type="string"),
+        ]
+        self.properties = [
+            DeviceCustomProperty(name="Size", type="enum", allowed_values=["s", "m"]),
+            DeviceCustomProperty(name="Count", type="integer"),
+            DeviceCustomProperty(name="Active", type="boolean"),
+            DeviceCustomProperty(name="Seen", type="timestamp"),
+            DeviceCustomProperty(name="Tags", type="string"),
+        ]
+        self.loads = 0
+
+    async def list_fields(self, asset_class):
+        assert asset_class is Device
+        self.loads += 1
+        for field in self.fields:
+            yield field
+
+    async def list_properties(self):
+        for property_ in self.properties:
+            yield property_
+
+
+@pytest.fixture(name="clock")
+def clock_fixture(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(asset_field_schema, "time", clock)
+    return clock
+
+
+@pytest.fixture(name="server")
+def server_fixture() -> Server:
+    return Server()
+
+
+@pytest.fixture(name="schema")
+def schema_fixture(server: Server, clock: Clock) -> AssetFieldSchema:
+    # pylint: disable=unused-argument
+    return AssetFieldSchema(server.list_fields, server.list_properties, ttl=60)
+
+
+async def test_get_fields(schema: AssetFieldSchema):
+    fields = await schema.get_fields(Device)
+
+    assert fields == {
+        "device_id": FieldSpec("integer"),
+        "custom.Tags": FieldSpec("string", is_list=True),
+        "integration.qualys_id": FieldSpec("string"),
+        "custom.Size": FieldSpec("enum", allowed_values=frozenset({"s", "m"})),
+        "custom.Count": FieldSpec("integer"),
+        "custom.Active": FieldSpec("boolean"),
+        "custom.Seen": FieldSpec("timestamp"),
+    }
+
+
+async def test_get_fields_is_cached(
+    schema: AssetFieldSchema, server: Server, clock: Clock
+):
+    await schema.get_fields(Device)
+    clock.now += 59
+    await schema.get_fields(Device)
+    assert server.loads == 1
+
+    clock.now += 1
+    await schema.get_fields(Device)
+    assert server.loads == 2
+
+    schema.invalidate()
+    await schema.get_fields(Device)
+    assert server.loads == 3
+
+
+async def test_validate_fields(schema: AssetFieldSchema, server: Server):
+    await schema.validate_fields(
+        Device, ["device_id", "names", "custom.Size", "integration.qualys_id"]
+    )
+
+    with pytest.raises(
+        ArmisError,
+        match="The following fields don't exist: 'custom.Sise', 'integration.x'",
+    ):
+        await schema.validate_fields(
+            Device, ["device_id", "custom.Sise", "integration.x"]
+        )
+
+    # The second validation found unknown fields, so the schema was reloaded once.
+    assert server.loads == 2
+
+
+async def test_validate_fields_without_dynamic_fields(
+    schema: AssetFieldSchema, server: Server
+):
+    await schema.validate_fields(Device, ["device_id", "names"])
+
+    assert server.loads == 0
+
+
+async def test_validate_fields_refreshes_on_mismatch(
+    schema: AssetFieldSchema, server: Server
+):
+    await schema.validate_fields(Device, ["custom.Size"])
+    server.properties.append(DeviceCustomProperty(name="Color", type="string"))
+
+    await schema.validate_fields(Device, ["custom.Color"])
+
+    assert server.loads == 2
+
+
+@pytest.mark.parametrize(
+    ["field", "value"],
+    [
+        ("custom.Size", "s"),
+        ("custom.Size", None),
+        ("custom.Count", 3),
+        ("custom.Active", False),
+        ("custom.Seen", "2025-12-03T13:52:45+00:00"),
+        ("custom.Tags", ["a", "b"]),
+        ("integration.qualys_id", "abc"),
+    ],
+)
+async def test_validate_updates(schema: AssetFieldSchema, field, value):
+    await schema.validate_updates(Device, [(field, value)])
+
+
+@pytest.mark.parametrize(
+    ["field", "value", "expected_error"],
+    [
+        (
+            "custom.Size",
+            "xl",
+            "Item at index 5: 'custom.Size' must be one of 'm', 's', got 'xl'",
+        ),
+        (
+            "custom.Count",
+            True,
+            "Item at index 5: 'custom.Count' must be an integer, got True",
+        ),
+        (
+            "custom.Active",
+            "yes",
+            "Item at index 5: 'custom.Active' must be a boolean, got 'yes'",
+        ),
+        (
+            "custom.Seen",
+            "yesterday",
+            "Item at index 5: 'custom.Seen' must be an ISO 8601 timestamp, got 'yesterday'",
+        ),
+        (
+            "custom.Tags",
+            "a",
+            "Item at index 5: 'custom.Tags' must be a list, got 'a'",
+        ),
+        (
+            "custom.Tags",
+            ["a", 1],
+            "Item at index 5: 'custom.Tags' must be a string, got 1",
+        ),
+        (
+            "custom.Missing",
+            "a",
+            "Item at index 5: the field 'custom.Missing' doesn't exist",
+        ),
+    ],
+)
+async def test_validate_updates_with_errors(
+    schema: AssetFieldSchema, server: Server, field, value, expected_error
+):
+    with pytest.raises(ArmisError, match=f"^{expected_error}$"):
+        await schema.validate_updates(Device, [(field, value)], offset=5)
+
+    assert server.loads == 1
+
+
+async def test_validate_updates_refreshes_on_mismatch(
+    schema: AssetFieldSchema, server: Server
+):
+    await schema.validate_updates(Device, [("custom.Size", "s")])
+    server.properties[0] = DeviceCustomProperty(
+        name="Size", type="enum", allowed_values=["s", "m", "l"]
+    )
+
+    await schema.validate_updates(Device, [("custom.Size", "l")])
+
+    assert server.loads == 2
+
+
+async def test_validate_updates_limits_errors(schema: AssetFieldSchema):
+    updates = [("custom.Count", "many")] * 25
+
+    with pytest.raises(ArmisError) as error:
+        await schema.validate_updates(Device, updates)
+
+    lines = str(error.value).splitlines()
+    assert len(lines) == 21
+    assert lines[-1] == "... and 5 more"
+
+
+async def test_assets_client_update_with_field_schema(
+    httpx_mock: pytest_httpx.HTTPXMock,
+):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search/fields?asset_type=DEVICE",
+        method="GET",
+        json={"items": [{"name": "custom.Size", "type": "enum", "is_list": False}]},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/device-custom-properties",
+        method="GET",
+        json={
+            "items": [
+                {"id": 1, "name": "Size", "type": "enum", "allowed_values": ["s", "m"]}
+            ]
+        },
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [
+                {"asset_id": 1, "key": "custom.Size", "operation": "SET", "value": "m"}
+            ],
+            "asset_type": "DEVICE",
+            "asset_id_source": "ASSET_ID",
+        },
+        json={"items": [{"status": 202}]},
+    )
+
+    assets_client = AssetsClient(field_schema_ttl=60)
+    await assets_client.update(
+        [Device(device_id=1, custom={"Size": "m"})], ["custom.Size"]
+    )
+
+
+async def test_assets_client_update_with_invalid_value(
+    httpx_mock: pytest_httpx.HTTPXMock,
+):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search/fields?asset_type=DEVICE",
+        method="GET",
+        json={"items": [{"name": "custom.Size", "type": "enum", "is_list": False}]},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/device-custom-properties",
+        method="GET",
+        json={
+            "items": [
+                {"id": 1, "name": "Size", "type": "enum", "allowed_values": ["s", "m"]}
+            ]
+        },
+    )
+
+    assets_client = AssetsClient(field_schema_ttl=60)
+    device = Device(device_id=1, custom={"Size": "xl"})
+
+    with pytest.raises(ArmisError, match="'custom.Size' must be one of 'm', 's'"):
+        await assets_client.update([device], ["custom.Size"])
+
+    assert not httpx_mock.get_requests(url="https://api.armis.com/v3/assets/_bulk")
+
+
+async def test_assets_client_list_with_unknown_field(
+    httpx_mock: pytest_httpx.HTTPXMock,
+):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search/fields?asset_type=DEVICE",
+        method="GET",
+        json={"items": []},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/device-custom-properties",
+        method="GET",
+        json={"items": []},
+    )
+
+    assets_client = AssetsClient(field_schema_ttl=60)
+
+    with pytest.raises(ArmisError, match="The following fields don't exist"):
+        async for _ in assets_client.list_by_asset_id(
+            Device, [1], fields=["device_id", "custom.Typo"]
+        ):
+            pass
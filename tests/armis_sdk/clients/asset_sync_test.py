@@ -0,0 +1,91 @@
+import datetime
+
+import pytest_httpx
+
+from armis_sdk.clients.asset_sync import AssetSink
+from armis_sdk.clients.asset_sync import AssetSyncEngine
+from armis_sdk.clients.asset_sync import FileSyncStateStore
+from armis_sdk.clients.asset_sync import SyncState
+from armis_sdk.clients.assets_client import AssetsClient
+from armis_sdk.entities.device import Device
+
+pytest_plugins = ["tests.plugins.auto_setup_plugin"]
+
+
+class ListSink(AssetSink[Device]):
+    def __init__(self):
+        self.batches: list[list[Device]] = []
+
+    async def upsert(self, assets: list[Device]):
+        self.batches.append(assets)
+
+
+def search_response(*devices: tuple[int, str]) -> dict:
+    return {
+        "items": [
+            {
+                "asset_id": device_id,
+                "fields": {"device_id": device_id, "last_seen": last_seen},
+            }
+            for device_id, last_seen in devices
+        ]
+    }
+
+
+async def test_sync(httpx_mock: pytest_httpx.HTTPXMock, tmp_path):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        match_json={
+            "limit": 100,
+            "asset_type": "DEVICE",
+            "fields": ["device_id", "last_seen"],
+            "filter": {"filter_criteria": "LAST_SEEN", "last_seen_seconds": 86400},
+        },
+        json=search_response((1, "2025-12-03T10:00:00"), (2, "2025-12-03T12:00:00")),
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        match_json={
+            "limit": 100,
+            "asset_type": "DEVICE",
+            "fields": ["device_id", "last_seen"],
+            "filter": {
+                "filter_criteria": "LAST_SEEN",
+                "last_seen_ge": "2025-12-03T11:55:00",
+            },
+        },
+        json=search_response(
+            (2, "2025-12-03T12:00:00"),
+            (1, "2025-12-03T12:01:00"),
+            (3, "2025-12-03T12:02:00"),
+        ),
+    )
+
+    sink = ListSink()
+    state_store = FileSyncStateStore(tmp_path / "state.json")
+    engine = AssetSyncEngine(
+        AssetsClient(),
+        Device,
+        sink,
+        state_store=state_store,
+        fields=["device_id", "last_seen"],
+        batch_size=2,
+    )
+
+    assert await engine.sync() == 2
+    assert await engine.sync() == 2
+
+    assert [[device.device_id for device in batch] for batch in sink.batches] == [
+        [1, 2],
+        [1, 3],
+    ]
+    assert await state_store.load() == SyncState(
+        high_water_mark=datetime.datetime(2025, 12, 3, 12, 2),
+        delivered={
+            1: datetime.datetime(2025, 12, 3, 12, 1),
+            2: datetime.datetime(2025, 12, 3, 12, 0),
+            3: datetime.datetime(2025, 12, 3, 12, 2),
+        },
+    )
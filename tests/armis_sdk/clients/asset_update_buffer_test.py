@@ -0,0 +1,222 @@
+import asyncio
+
+import httpx
+import pytest
+import pytest_httpx
+
+from armis_sdk.clients.asset_update_buffer import AssetUpdateBuffer
+from armis_sdk.clients.assets_client import AssetsClient
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.core.armis_error import BulkUpdateError
+from armis_sdk.core.bulk_update_retry import BulkUpdateRetry
+from armis_sdk.entities.device import Device
+
+pytest_plugins = ["tests.plugins.auto_setup_plugin"]
+
+
+async def test_coalesce(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [
+                {
+                    "asset_id": 1,
+                    "key": "custom.MyField1",
+                    "operation": "SET",
+                    "value": "value3",
+                },
+                {"asset_id": 1, "key": "custom.MyField2", "operation": "UNSET"},
+                {
+                    "asset_id": 2,
+                    "key": "custom.MyField1",
+                    "operation": "SET",
+                    "value": "value4",
+                },
+            ],
+            "asset_type": "DEVICE",
+            "asset_id_source": "ASSET_ID",
+        },
+        json={"items": [{"status": 202}] * 3},
+    )
+
+    async with AssetUpdateBuffer(AssetsClient(), Device, flush_interval=None) as buffer:
+        await buffer.set(1, "custom.MyField1", "value1")
+        await buffer.set(1, "custom.MyField2", "value2")
+        await buffer.set(1, "custom.MyField1", "value3")
+        await buffer.unset(1, "custom.MyField2")
+        await buffer.add(
+            Device(device_id=2, custom={"MyField1": "value4"}), ["custom.MyField1"]
+        )
+        assert len(buffer) == 3
+
+
+async def test_flush_when_full(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [
+                {
+                    "asset_id": 1,
+                    "key": "custom.MyField",
+                    "operation": "SET",
+                    "value": 1,
+                },
+                {
+                    "asset_id": 2,
+                    "key": "custom.MyField",
+                    "operation": "SET",
+                    "value": 2,
+                },
+            ],
+            "asset_type": "DEVICE",
+            "asset_id_source": "ASSET_ID",
+        },
+        json={"items": [{"status": 202}] * 2},
+    )
+
+    buffer = AssetUpdateBuffer(
+        AssetsClient(), Device, max_batch_size=2, flush_interval=None
+    )
+    await buffer.set(1, "custom.MyField", 1)
+    assert len(buffer) == 1
+    await buffer.set(2, "custom.MyField", 2)
+    assert len(buffer) == 0
+
+
+async def test_flush_periodically(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        json={"items": [{"status": 400, "error": "Bad Request"}]},
+        is_reusable=True,
+    )
+
+    buffer = AssetUpdateBuffer(AssetsClient(), Device, flush_interval=0.01)
+    await buffer.set(1, "custom.MyField", 1)
+    await asyncio.sleep(0.1)
+
+    # Permanent failures are dropped, and reported once.
+    assert len(buffer) == 0
+    assert len(httpx_mock.get_requests(method="POST")) == 2
+    with pytest.raises(BulkUpdateError):
+        await buffer.close()
+
+
+async def test_flush_keeps_retryable_failures(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        json={
+            "items": [
+                {"status": 202},
+                {"status": 400, "error": "Bad Request"},
+                {"status": 503, "error": "Service Unavailable"},
+            ]
+        },
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [
+                {
+                    "asset_id": 3,
+                    "key": "custom.MyField",
+                    "operation": "SET",
+                    "value": 3,
+                }
+            ],
+            "asset_type": "DEVICE",
+            "asset_id_source": "ASSET_ID",
+        },
+        json={"items": [{"status": 202}]},
+    )
+
+    buffer = AssetUpdateBuffer(
+        AssetsClient(), Device, flush_interval=None, retry=BulkUpdateRetry(total=0)
+    )
+    for asset_id in [1, 2, 3]:
+        await buffer.set(asset_id, "custom.MyField", asset_id)
+
+    with pytest.raises(BulkUpdateError) as error_info:
+        await buffer.flush()
+
+    assert [item.index for item in error_info.value.items] == [1, 2]
+    assert len(buffer) == 1
+    await buffer.close()
+    assert len(buffer) == 0
+
+
+async def test_flush_periodically_after_error(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        json={"items": [{"status": 503, "error": "Service Unavailable"}]},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        json={"items": [{"status": 202}]},
+    )
+
+    buffer = AssetUpdateBuffer(
+        AssetsClient(), Device, flush_interval=0.01, retry=BulkUpdateRetry(total=0)
+    )
+    await buffer.set(1, "custom.MyField", 1)
+    for _ in range(100):
+        if not buffer:
+            break
+        await asyncio.sleep(0.01)
+
+    assert len(buffer) == 0
+    with pytest.raises(BulkUpdateError):
+        await buffer.flush()
+    await buffer.close()
+
+
+async def test_close_waits_for_periodic_flush(httpx_mock: pytest_httpx.HTTPXMock):
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        started.set()
+        await release.wait()
+        return httpx.Response(200, json={"items": [{"status": 202}]})
+
+    httpx_mock.add_callback(
+        respond, url="https://api.armis.com/v3/assets/_bulk", method="POST"
+    )
+
+    buffer = AssetUpdateBuffer(AssetsClient(), Device, flush_interval=0.01)
+    await buffer.set(1, "custom.MyField", 1)
+    await started.wait()
+    close = asyncio.create_task(buffer.close())
+    await asyncio.sleep(0.01)
+    release.set()
+    await close
+
+    assert len(buffer) == 0
+    assert len(httpx_mock.get_requests(method="POST")) == 2
+
+
+async def test_set_after_close(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.reset()
+
+    buffer = AssetUpdateBuffer(AssetsClient(), Device)
+    await buffer.close()
+
+    with pytest.raises(ArmisError, match="Can't update a closed buffer."):
+        await buffer.set(1, "custom.MyField", 1)
+
+
+async def test_set_unsupported_field(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.reset()
+
+    buffer = AssetUpdateBuffer(AssetsClient(), Device, flush_interval=None)
+
+    with pytest.raises(
+        ArmisError, match="Updating the field 'brand' is currently not supported"
+    ):
+        await buffer.set(1, "brand", "Apple")
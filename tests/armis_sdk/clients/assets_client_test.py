@@ -1,14 +1,25 @@
 import datetime
+import json
 
+import httpx
+import pandas
+import pyarrow
 import pytest
 import pytest_httpx
 
 from armis_sdk.clients.assets_client import AssetsClient
 from armis_sdk.core.armis_error import ArmisError
 from armis_sdk.core.armis_error import BulkUpdateError
+from armis_sdk.core.asset_decoder import AssetDecoder
+from armis_sdk.core.bulk_update_retry import BulkUpdateRetry
+from armis_sdk.core.decoder_pool import DecoderPool
+from armis_sdk.core.interner import Interner
+from armis_sdk.core.records import DeviceRecord
 from armis_sdk.entities.asset import Asset
 from armis_sdk.entities.asset_field_description import AssetFieldDescription
+from armis_sdk.entities.device import LIGHT_DEVICE_FIELDS
 from armis_sdk.entities.device import Device
+from armis_sdk.entities.device import LightDevice
 from tests.armis_sdk.clients import assets_test_data
 
 pytest_plugins = ["tests.plugins.auto_setup_plugin"]
@@ -47,6 +58,261 @@ async def test_list_by_last_seen_datetime(httpx_mock: pytest_httpx.HTTPXMock):
     assert devices == [assets_test_data.MOCK_DEVICE_FULL]
 
 
+async def test_list_batches_by_last_seen(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        match_json={
+            "limit": 100,
+            "asset_type": "DEVICE",
+            "fields": ["device_id", "type"],
+            "filter": {
+                "filter_criteria": "LAST_SEEN",
+                "last_seen_seconds": 3600,
+            },
+        },
+        json={
+            "next": 2,
+            "items": [
+                {"asset_id": 1, "fields": {"device_id": 1, "type": "Laptops"}},
+                {"asset_id": 2, "fields": {"device_id": 2, "type": None}},
+            ],
+        },
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        match_json={
+            "limit": 100,
+            "asset_type": "DEVICE",
+            "fields": ["device_id", "type"],
+            "filter": {
+                "filter_criteria": "LAST_SEEN",
+                "last_seen_seconds": 3600,
+            },
+            "after": 2,
+        },
+        json={
+            "items": [
+                {"asset_id": 3, "fields": {"device_id": 3, "type": "Laptops"}},
+            ],
+        },
+    )
+
+    assets_client = AssetsClient()
+    batches = [
+        batch
+        async for batch in assets_client.list_batches_by_last_seen(
+            Device, datetime.timedelta(hours=1), ["device_id", "type"]
+        )
+    ]
+
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    table = pyarrow.Table.from_batches(batches)
+    assert table.to_pydict() == {
+        "device_id": [1, 2, 3],
+        "type": ["Laptops", None, "Laptops"],
+    }
+
+
+async def test_list_batches_by_asset_id(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        match_json={
+            "limit": 100,
+            "asset_type": "DEVICE",
+            "fields": assets_test_data.ALL_DEVICE_FIELDS,
+            "filter": {
+                "filter_criteria": "ASSET_ID",
+                "asset_ids": ["10.246.212.12"],
+                "asset_id_source": "IPV4_ADDRESS",
+            },
+        },
+        json={
+            "items": [
+                {"asset_id": 1, "fields": assets_test_data.MOCK_DEVICE_FULL_RAW_DATA}
+            ]
+        },
+    )
+
+    assets_client = AssetsClient()
+    batches = [
+        batch
+        async for batch in assets_client.list_batches_by_asset_id(
+            Device, ["10.246.212.12"], "IPV4_ADDRESS"
+        )
+    ]
+
+    table = pyarrow.Table.from_batches(batches)
+    assert table.column_names == assets_test_data.ALL_DEVICE_FIELDS
+    assert table.column("device_id").to_pylist() == [1]
+
+
+async def test_list_by_last_seen_projection(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        match_json={
+            "limit": 100,
+            "asset_type": "DEVICE",
+            "fields": sorted(LIGHT_DEVICE_FIELDS),
+            "filter": {
+                "filter_criteria": "LAST_SEEN",
+                "last_seen_seconds": 3600,
+            },
+        },
+        json={
+            "items": [
+                {"asset_id": 1, "fields": {"device_id": 1, "type": "Laptops"}},
+            ],
+        },
+    )
+
+    assets_client = AssetsClient()
+    devices = [
+        device
+        async for device in assets_client.list_by_last_seen(
+            LightDevice, datetime.timedelta(hours=1)
+        )
+    ]
+
+    assert devices == [LightDevice(device_id=1, type="Laptops")]
+
+
+async def test_list_many_by_last_seen(httpx_mock: pytest_httpx.HTTPXMock):
+    for fields, items in [
+        (["device_id", "type"], [{"device_id": 1, "type": "a"}]),
+        (
+            sorted(LIGHT_DEVICE_FIELDS),
+            [{"device_id": 2, "type": "Laptops"}, {"device_id": 3}],
+        ),
+    ]:
+        httpx_mock.add_response(
+            url="https://api.armis.com/v3/assets/_search",
+            method="POST",
+            match_json={
+                "limit": 100,
+                "asset_type": "DEVICE",
+                "fields": fields,
+                "filter": {"filter_criteria": "LAST_SEEN", "last_seen_seconds": 3600},
+            },
+            json={
+                "items": [
+                    {"asset_id": item["device_id"], "fields": item} for item in items
+                ]
+            },
+        )
+
+    assets_client = AssetsClient()
+    results = [
+        result
+        async for result in assets_client.list_many_by_last_seen(
+            [Device, LightDevice, Device],
+            datetime.timedelta(hours=1),
+            fields={Device: ["device_id", "type"]},
+        )
+    ]
+
+    assert sorted(results, key=lambda result: result[1].device_id) == [
+        (Device, Device(device_id=1, type="a")),
+        (LightDevice, LightDevice(device_id=2, type="Laptops")),
+        (LightDevice, LightDevice(device_id=3)),
+    ]
+
+
+async def test_list_many_by_last_seen_with_invalid_last_seen():
+    assets_client = AssetsClient()
+
+    with pytest.raises(ArmisError, match="Invalid 'last_seen' type"):
+        async for _ in assets_client.list_many_by_last_seen([Device], 3600):
+            pass
+
+
+async def test_list_records_by_last_seen(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        match_json={
+            "limit": 100,
+            "asset_type": "DEVICE",
+            "fields": ["device_id", "tags"],
+            "filter": {"filter_criteria": "LAST_SEEN", "last_seen_seconds": 3600},
+        },
+        json={
+            "items": [
+                {"asset_id": 1, "fields": {"device_id": 1, "tags": ["Critical"]}},
+            ],
+        },
+    )
+
+    assets_client = AssetsClient()
+    records = [
+        record
+        async for record in assets_client.list_records_by_last_seen(
+            Device, datetime.timedelta(hours=1), ["device_id", "tags"]
+        )
+    ]
+
+    assert records == [DeviceRecord(device_id=1, tags=("Critical",))]
+
+
+async def test_list_records_by_asset_id(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        match_json={
+            "limit": 100,
+            "asset_type": "DEVICE",
+            "fields": ["device_id"],
+            "filter": {
+                "filter_criteria": "ASSET_ID",
+                "asset_ids": [1],
+                "asset_id_source": "ASSET_ID",
+            },
+        },
+        json={"items": [{"asset_id": 1, "fields": {"device_id": 1}}]},
+    )
+
+    assets_client = AssetsClient()
+    records = [
+        record
+        async for record in assets_client.list_records_by_asset_id(
+            Device, [1], fields=["device_id"]
+        )
+    ]
+
+    assert [record.to_model() for record in records] == [Device(device_id=1)]
+
+
+async def test_update_projection(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [
+                {
+                    "asset_id": "1.1.1.1",
+                    "key": "custom.Owner",
+                    "operation": "SET",
+                    "value": "Jane",
+                }
+            ],
+            "asset_type": "DEVICE",
+            "asset_id_source": "IPV4_ADDRESS",
+        },
+        json={"items": [{"status": 202}]},
+    )
+
+    projection = Device.projection("ipv4_addresses")
+    assets_client = AssetsClient()
+    await assets_client.update(
+        [projection(ipv4_addresses=["1.1.1.1"], custom={"Owner": "Jane"})],
+        ["custom.Owner"],
+        asset_id_source="IPV4_ADDRESS",
+    )
+
+
 async def test_list_by_last_seen_datetime_explicit_fields(
     httpx_mock: pytest_httpx.HTTPXMock,
 ):
@@ -190,6 +456,77 @@ async def test_list_by_asset_id(httpx_mock: pytest_httpx.HTTPXMock):
     assert devices == [assets_test_data.MOCK_DEVICE_FULL]
 
 
+async def test_list_by_asset_id_with_lazy_nested_fields(
+    httpx_mock: pytest_httpx.HTTPXMock,
+):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        json={
+            "items": [
+                {"asset_id": 1, "fields": assets_test_data.MOCK_DEVICE_FULL_RAW_DATA}
+            ]
+        },
+    )
+
+    assets_client = AssetsClient(lazy_nested_fields=True)
+    devices = [device async for device in assets_client.list_by_asset_id(Device, [1])]
+
+    assert "network_interfaces" in devices[0].lazy_fields
+    assert (
+        devices[0].network_interfaces
+        == assets_test_data.MOCK_DEVICE_FULL.network_interfaces
+    )
+    assert devices == [assets_test_data.MOCK_DEVICE_FULL]
+
+
+async def test_list_by_asset_id_with_interner(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        json={
+            "items": [
+                {"asset_id": 1, "fields": assets_test_data.MOCK_DEVICE_FULL_RAW_DATA},
+                {"asset_id": 1, "fields": assets_test_data.MOCK_DEVICE_FULL_RAW_DATA},
+            ]
+        },
+    )
+
+    interner = Interner()
+    assets_client = AssetsClient(interner=interner)
+    devices = [device async for device in assets_client.list_by_asset_id(Device, [1])]
+
+    assert devices == [assets_test_data.MOCK_DEVICE_FULL] * 2
+    assert devices[0].site is devices[1].site
+    assert len(interner) > 0
+
+
+async def test_list_by_asset_id_with_decoder_pool(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        json={
+            "items": [
+                {"asset_id": 1, "fields": assets_test_data.MOCK_DEVICE_FULL_RAW_DATA}
+            ]
+        },
+        is_reusable=True,
+    )
+
+    with DecoderPool(max_workers=1) as decoder_pool:
+        assets_client = AssetsClient(decoder_pool=decoder_pool)
+        devices = [
+            device async for device in assets_client.list_by_asset_id(Device, [1])
+        ]
+        records = [
+            record
+            async for record in assets_client.list_records_by_asset_id(Device, [1])
+        ]
+
+    assert devices == [assets_test_data.MOCK_DEVICE_FULL]
+    assert records == [DeviceRecord.from_model(assets_test_data.MOCK_DEVICE_FULL)]
+
+
 async def test_list_by_asset_id_explicit_fields(httpx_mock: pytest_httpx.HTTPXMock):
     httpx_mock.add_response(
         url="https://api.armis.com/v3/assets/_search",
@@ -406,6 +743,26 @@ async def test_update_with_validation_errors(assets, fields, expected_error):
         await assets_client.update(assets, fields)
 
 
+@pytest.mark.parametrize(
+    ["asset_id_source", "expected"],
+    [("ASSET_ID", 1), ("MAC_ADDRESS", "00:11:22:33:44:55")],
+)
+def test_get_asset_id(asset_id_source, expected):
+    device = Device(device_id=1, mac_addresses=["00:11:22:33:44:55"])
+
+    assert AssetsClient.get_asset_id(device, asset_id_source) == expected
+
+
+def test_get_asset_id_missing():
+    with pytest.raises(ArmisError, match="Device at index 3 doesn't have a device id"):
+        AssetsClient.get_asset_id(Device(), index=3)
+
+
+def test_get_updates_of_unsupported_asset():
+    with pytest.raises(ArmisError, match="Can't get ASSET_ID of asset"):
+        AssetsClient.get_updates({"device_id": 1}, ["custom.MyField"])
+
+
 async def test_list_fields(httpx_mock: pytest_httpx.HTTPXMock):
     httpx_mock.add_response(
         url="https://api.armis.com/v3/assets/_search/fields?asset_type=DEVICE",
@@ -435,3 +792,472 @@ async def test_list_fields(httpx_mock: pytest_httpx.HTTPXMock):
             name="integration.qualys_agent_id", type="string", is_list=False
         ),
     ]
+
+
+async def test_update_stream(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [
+                {
+                    "asset_id": 1,
+                    "key": "custom.MyField1",
+                    "operation": "SET",
+                    "value": "value1",
+                },
+                {"asset_id": 1, "key": "custom.MyField2", "operation": "UNSET"},
+                {
+                    "asset_id": 2,
+                    "key": "custom.MyField1",
+                    "operation": "SET",
+                    "value": "value2",
+                },
+            ],
+            "asset_type": "DEVICE",
+            "asset_id_source": "ASSET_ID",
+        },
+        json={"items": [{"status": 202}] * 3},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [{"asset_id": 2, "key": "custom.MyField2", "operation": "UNSET"}],
+            "asset_type": "DEVICE",
+            "asset_id_source": "ASSET_ID",
+        },
+        json={"items": [{"status": 202}]},
+    )
+
+    async def devices():
+        yield Device(device_id=1, custom={"MyField1": "value1"})
+        yield Device(device_id=2, custom={"MyField1": "value2"})
+
+    assets_client = AssetsClient()
+    fields = ["custom.MyField1", "custom.MyField2"]
+    await assets_client.update_stream(Device, devices(), fields, batch_size=3)
+
+
+async def test_update_stream_lazy_assets(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [
+                {
+                    "asset_id": 1,
+                    "key": "custom.MyField1",
+                    "operation": "SET",
+                    "value": "value1",
+                },
+            ],
+            "asset_type": "DEVICE",
+            "asset_id_source": "ASSET_ID",
+        },
+        json={"items": [{"status": 202}]},
+    )
+    lazy_devices = AssetDecoder.for_class(Device).decode_page_lazy(
+        [
+            {
+                "fields": {
+                    "device_id": 1,
+                    "custom": {"MyField1": "value1"},
+                    "site": {"id": 2},
+                }
+            }
+        ]
+    )
+
+    assets_client = AssetsClient()
+    await assets_client.update_stream(Device, lazy_devices, ["custom.MyField1"])
+
+
+async def test_update_stream_tuples(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [
+                {
+                    "asset_id": "1.1.1.1",
+                    "key": "custom.MyField1",
+                    "operation": "SET",
+                    "value": "value1",
+                },
+                {"asset_id": "2.2.2.2", "key": "custom.MyField1", "operation": "UNSET"},
+            ],
+            "asset_type": "DEVICE",
+            "asset_id_source": "IPV4_ADDRESS",
+        },
+        json={"items": [{"status": 202}] * 2},
+    )
+
+    assets_client = AssetsClient()
+    updates = [
+        ("1.1.1.1", "custom.MyField1", "value1"),
+        ("2.2.2.2", "custom.MyField1", None),
+    ]
+    await assets_client.update_stream(Device, updates, asset_id_source="IPV4_ADDRESS")
+
+
+async def test_update_stream_with_failed_requests(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        json={"items": [{"status": 202}, {"status": 202}]},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        json={"items": [{"status": 400, "error": "Bad Request"}]},
+    )
+
+    assets_client = AssetsClient()
+    updates = [
+        (1, "custom.MyField1", "value1"),
+        (2, "custom.MyField1", "value2"),
+        (3, "custom.MyField1", "value3"),
+    ]
+
+    with pytest.raises(BulkUpdateError) as error:
+        await assets_client.update_stream(Device, updates, batch_size=2)
+
+    assert [item.index for item in error.value.items] == [2]
+
+
+@pytest.mark.parametrize(
+    ["updates", "fields", "expected_error"],
+    [
+        (
+            [Device(device_id=1), NotDevice()],
+            ["custom.MyField"],
+            "Item at index 1 is neither a 'Device' nor an "
+            r"\(asset_id, field, value\) tuple",
+        ),
+        (
+            [Device(device_id=1)],
+            [],
+            "Updating assets requires a list of fields",
+        ),
+        (
+            [(1, "purdue_level", 1)],
+            [],
+            "Updating the field 'purdue_level' is currently not supported",
+        ),
+    ],
+)
+async def test_update_stream_with_validation_errors(updates, fields, expected_error):
+    assets_client = AssetsClient()
+
+    with pytest.raises(ArmisError, match=expected_error):
+        await assets_client.update_stream(Device, updates, fields)
+
+
+async def test_update_retries_failed_items(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [
+                {
+                    "asset_id": 1,
+                    "key": "custom.MyField",
+                    "operation": "SET",
+                    "value": 1,
+                },
+                {
+                    "asset_id": 2,
+                    "key": "custom.MyField",
+                    "operation": "SET",
+                    "value": 2,
+                },
+                {
+                    "asset_id": 3,
+                    "key": "custom.MyField",
+                    "operation": "SET",
+                    "value": 3,
+                },
+                {
+                    "asset_id": 4,
+                    "key": "custom.MyField",
+                    "operation": "SET",
+                    "value": 4,
+                },
+            ],
+            "asset_type": "DEVICE",
+            "asset_id_source": "ASSET_ID",
+        },
+        json={
+            "items": [
+                {"status": 202},
+                {"status": 503, "error": "Service Unavailable"},
+                {"status": 400, "error": "Bad Request"},
+                {"status": 429, "error": "Too Many Requests"},
+            ]
+        },
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [
+                {
+                    "asset_id": 2,
+                    "key": "custom.MyField",
+                    "operation": "SET",
+                    "value": 2,
+                },
+                {
+                    "asset_id": 4,
+                    "key": "custom.MyField",
+                    "operation": "SET",
+                    "value": 4,
+                },
+            ],
+            "asset_type": "DEVICE",
+            "asset_id_source": "ASSET_ID",
+        },
+        json={"items": [{"status": 202}, {"status": 503, "error": "Unavailable"}]},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [
+                {
+                    "asset_id": 4,
+                    "key": "custom.MyField",
+                    "operation": "SET",
+                    "value": 4,
+                },
+            ],
+            "asset_type": "DEVICE",
+            "asset_id_source": "ASSET_ID",
+        },
+        json={"items": [{"status": 202}]},
+    )
+
+    assets_client = AssetsClient()
+    assets = [Device(device_id=i, custom={"MyField": i}) for i in range(1, 5)]
+    retry = BulkUpdateRetry(total=2, backoff_factor=0)
+
+    with pytest.raises(BulkUpdateError) as error:
+        await assets_client.update(assets, ["custom.MyField"], retry=retry)
+
+    assert [item.index for item in error.value.items] == [2]
+
+
+async def test_update_retries_exhausted(httpx_mock: pytest_httpx.HTTPXMock):
+    for _ in range(2):
+        httpx_mock.add_response(
+            url="https://api.armis.com/v3/assets/_bulk",
+            method="POST",
+            json={"items": [{"status": 500, "error": "Internal Server Error"}]},
+        )
+
+    assets_client = AssetsClient()
+    updates = [(1, "custom.MyField", "value")]
+    retry = BulkUpdateRetry(total=1, backoff_factor=0)
+
+    with pytest.raises(BulkUpdateError) as error:
+        await assets_client.update_stream(Device, updates, retry=retry)
+
+    assert error.value.items[0].response == {
+        "status": 500,
+        "error": "Internal Server Error",
+    }
+
+
+@pytest.mark.parametrize(
+    ["attempt", "expected"],
+    [(1, 0.5), (2, 1.0), (3, 2.0), (10, 30.0)],
+)
+def test_bulk_update_retry_backoff(attempt, expected):
+    assert BulkUpdateRetry().get_backoff_time(attempt) == expected
+
+
+async def test_update_changed(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        json={
+            "items": [
+                {
+                    "asset_id": 1,
+                    "fields": {
+                        "device_id": 1,
+                        "custom.MyField1": "foo",
+                        "custom.MyField2": "bar",
+                    },
+                },
+                {"asset_id": 2, "fields": {"device_id": 2, "custom.MyField1": "baz"}},
+            ]
+        },
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [
+                {
+                    "asset_id": 1,
+                    "key": "custom.MyField1",
+                    "operation": "SET",
+                    "value": "new",
+                },
+                {"asset_id": 1, "key": "custom.MyField2", "operation": "UNSET"},
+            ],
+            "asset_type": "DEVICE",
+            "asset_id_source": "ASSET_ID",
+        },
+        json={"items": [{"status": 202}] * 2},
+    )
+
+    assets_client = AssetsClient()
+    fields = ["device_id", "custom.MyField1", "custom.MyField2"]
+    devices = [
+        device
+        async for device in assets_client.list_by_asset_id(
+            Device, [1, 2], fields=fields
+        )
+    ]
+    devices[0].custom["MyField1"] = "new"
+    del devices[0].custom["MyField2"]
+    devices[1].custom["MyField1"] = "baz"
+
+    assert devices[0].changed_fields() == ["custom.MyField1", "custom.MyField2"]
+    assert devices[1].changed_fields() == []
+
+    await assets_client.update_changed(devices)
+
+    assert devices[0].changed_fields() == []
+    await assets_client.update_changed(devices)
+
+
+def test_changed_fields_of_local_asset():
+    device = Device(device_id=1, custom={"MyField": 1}, integration={"Other": 2})
+
+    assert device.changed_fields() == ["custom.MyField", "integration.Other"]
+
+    device.mark_clean()
+    device.integration["Other"] = 3
+
+    assert device.changed_fields() == ["integration.Other"]
+    assert device == Device(
+        device_id=1, custom={"MyField": 1}, integration={"Other": 3}
+    )
+
+
+@pytest.mark.parametrize(
+    "columns",
+    [
+        pytest.param(
+            {"custom.Owner": {1: "Jane", 2: None}, "custom.Size": {1: 3, 2: 0}},
+            id="Mapping",
+        ),
+        pytest.param(
+            pandas.DataFrame(
+                {
+                    "asset_id": [1, 2],
+                    "custom.Owner": ["Jane", None],
+                    "custom.Size": [3, 0],
+                }
+            ),
+            id="DataFrame",
+        ),
+        pytest.param(
+            pyarrow.table(
+                {
+                    "asset_id": [1, 2],
+                    "custom.Owner": ["Jane", ""],
+                    "custom.Size": [3, None],
+                }
+            ),
+            id="Table",
+        ),
+    ],
+)
+async def test_update_columns(columns, httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [
+                {
+                    "asset_id": 1,
+                    "key": "custom.Owner",
+                    "operation": "SET",
+                    "value": "Jane",
+                },
+                {"asset_id": 2, "key": "custom.Owner", "operation": "UNSET"},
+                {"asset_id": 1, "key": "custom.Size", "operation": "SET", "value": 3},
+            ],
+            "asset_type": "DEVICE",
+            "asset_id_source": "ASSET_ID",
+        },
+        json={"items": [{"status": 202}] * 3},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        match_json={
+            "items": [{"asset_id": 2, "key": "custom.Size", "operation": "UNSET"}],
+            "asset_type": "DEVICE",
+            "asset_id_source": "ASSET_ID",
+        },
+        json={"items": [{"status": 202}]},
+    )
+
+    assets_client = AssetsClient()
+    await assets_client.update_columns(Device, columns, batch_size=3)
+
+
+async def test_update_columns_with_failed_requests(
+    httpx_mock: pytest_httpx.HTTPXMock,
+):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_bulk",
+        method="POST",
+        json={"items": [{"status": 202}, {"status": 400, "error": "Bad Request"}]},
+    )
+
+    assets_client = AssetsClient()
+    table = pyarrow.table({"ip": ["1.1.1.1", "2.2.2.2"], "custom.Owner": ["a", "b"]})
+
+    with pytest.raises(BulkUpdateError) as error:
+        await assets_client.update_columns(
+            Device, table, asset_id_source="IPV4_ADDRESS", id_column="ip"
+        )
+
+    assert [item.index for item in error.value.items] == [1]
+    assert error.value.items[0].request == {
+        "asset_id": "2.2.2.2",
+        "key": "custom.Owner",
+        "operation": "SET",
+        "value": "b",
+    }
+
+
+@pytest.mark.parametrize(
+    ["columns", "expected_error"],
+    [
+        (
+            {"device_id": {1: 2}},
+            "The following fields are not supported with this operation: 'device_id'",
+        ),
+        (
+            {"integration.MyField": {1: "a"}},
+            "Updating the field 'integration.MyField' is currently not supported",
+        ),
+        (
+            pyarrow.table({"id": [1], "custom.Owner": ["a"]}),
+            "The table doesn't have an 'asset_id' column",
+        ),
+    ],
+)
+async def test_update_columns_with_validation_errors(columns, expected_error):
+    assets_client = AssetsClient()
+
+    with pytest.raises(ArmisError, match=expected_error):
+        await assets_client.update_columns(Device, columns)
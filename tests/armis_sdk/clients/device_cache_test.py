@@ -0,0 +1,190 @@
+import asyncio
+
+import pytest
+import pytest_httpx
+
+from armis_sdk.clients import device_cache
+from armis_sdk.clients.assets_client import AssetsClient
+from armis_sdk.clients.device_cache import CacheStats
+from armis_sdk.clients.device_cache import DeviceCache
+from armis_sdk.entities.device import Device
+
+pytest_plugins = ["tests.plugins.auto_setup_plugin"]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture(name="clock")
+def clock_fixture(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(device_cache, "time", clock)
+    return clock
+
+
+def add_search_response(
+    httpx_mock: pytest_httpx.HTTPXMock,
+    asset_ids: list,
+    asset_id_source: str,
+    items: list[dict],
+):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        match_json={
+            "limit": 100,
+            "asset_type": "DEVICE",
+            "fields": ["device_id", "ipv4_addresses"],
+            "filter": {
+                "filter_criteria": "ASSET_ID",
+                "asset_ids": asset_ids,
+                "asset_id_source": asset_id_source,
+            },
+        },
+        json={
+            "items": [{"asset_id": item["device_id"], "fields": item} for item in items]
+        },
+    )
+
+
+FIELDS = ["device_id", "ipv4_addresses"]
+DEVICE1 = Device(device_id=1, ipv4_addresses=["1.1.1.1"])
+DEVICE2 = Device(device_id=2, ipv4_addresses=["2.2.2.2"])
+
+
+async def test_get_many(httpx_mock: pytest_httpx.HTTPXMock, clock: Clock):
+    add_search_response(
+        httpx_mock,
+        [1, 2, 3],
+        "ASSET_ID",
+        [
+            {"device_id": 1, "ipv4_addresses": ["1.1.1.1"]},
+            {"device_id": 2, "ipv4_addresses": ["2.2.2.2"]},
+        ],
+    )
+    add_search_response(
+        httpx_mock,
+        ["2.2.2.2"],
+        "IPV4_ADDRESS",
+        [{"device_id": 2, "ipv4_addresses": ["2.2.2.2"]}],
+    )
+
+    cache = DeviceCache(AssetsClient())
+    assert await cache.get_many([1, 2, 1, 3], fields=FIELDS) == [
+        DEVICE1,
+        DEVICE2,
+        DEVICE1,
+        None,
+    ]
+    assert await cache.get("2.2.2.2", "IPV4_ADDRESS", fields=FIELDS) == DEVICE2
+
+    # Cached, including the device that wasn't found.
+    clock.now += 10
+    assert await cache.get_many([3, 2], fields=FIELDS) == [None, DEVICE2]
+    assert cache.stats == CacheStats(hits=2, misses=4)
+    assert len(cache) == 4
+
+
+async def test_get_shares_concurrent_misses(
+    httpx_mock: pytest_httpx.HTTPXMock,
+    clock: Clock,  # pylint: disable=unused-argument
+):
+    add_search_response(
+        httpx_mock,
+        [1],
+        "ASSET_ID",
+        [{"device_id": 1, "ipv4_addresses": ["1.1.1.1"]}],
+    )
+
+    cache = DeviceCache(AssetsClient())
+    results = await asyncio.gather(
+        cache.get(1, fields=FIELDS),
+        cache.get(1, fields=FIELDS),
+    )
+
+    assert results == [DEVICE1, DEVICE1]
+    assert cache.stats == CacheStats(misses=2)
+
+
+async def test_get_stale_while_revalidate(
+    httpx_mock: pytest_httpx.HTTPXMock, clock: Clock
+):
+    add_search_response(
+        httpx_mock,
+        [1],
+        "ASSET_ID",
+        [{"device_id": 1, "ipv4_addresses": ["1.1.1.1"]}],
+    )
+    add_search_response(
+        httpx_mock,
+        [1],
+        "ASSET_ID",
+        [{"device_id": 1, "ipv4_addresses": ["3.3.3.3"]}],
+    )
+
+    cache = DeviceCache(AssetsClient(), ttl=60, stale_ttl=60)
+    assert await cache.get(1, fields=FIELDS) == DEVICE1
+
+    # Stale, the cached device is returned and refreshed in the background.
+    clock.now += 90
+    assert await cache.get(1, fields=FIELDS) == DEVICE1
+    assert await cache.get(1, fields=FIELDS) == DEVICE1
+    await asyncio.sleep(0.01)
+
+    refreshed = Device(device_id=1, ipv4_addresses=["3.3.3.3"])
+    assert await cache.get(1, fields=FIELDS) == refreshed
+    assert cache.stats == CacheStats(hits=1, stale_hits=2, misses=1, refreshes=1)
+
+
+async def test_get_expired(httpx_mock: pytest_httpx.HTTPXMock, clock: Clock):
+    add_search_response(httpx_mock, [3], "ASSET_ID", [])
+    add_search_response(
+        httpx_mock,
+        [3],
+        "ASSET_ID",
+        [{"device_id": 3, "ipv4_addresses": []}],
+    )
+
+    cache = DeviceCache(AssetsClient(), negative_ttl=10, stale_ttl=0)
+    assert await cache.get(3, fields=FIELDS) is None
+
+    clock.now += 20
+    assert await cache.get(3, fields=FIELDS) == Device(device_id=3, ipv4_addresses=[])
+    assert cache.stats == CacheStats(misses=2)
+
+
+async def test_get_evicts_least_recently_used(
+    httpx_mock: pytest_httpx.HTTPXMock,
+    clock: Clock,  # pylint: disable=unused-argument
+):
+    add_search_response(
+        httpx_mock,
+        [1, 2],
+        "ASSET_ID",
+        [
+            {"device_id": 1, "ipv4_addresses": ["1.1.1.1"]},
+            {"device_id": 2, "ipv4_addresses": ["2.2.2.2"]},
+        ],
+    )
+    add_search_response(httpx_mock, [3], "ASSET_ID", [])
+    add_search_response(
+        httpx_mock,
+        [2],
+        "ASSET_ID",
+        [{"device_id": 2, "ipv4_addresses": ["2.2.2.2"]}],
+    )
+
+    cache = DeviceCache(AssetsClient(), max_size=2)
+    await cache.get_many([1, 2], fields=FIELDS)
+    await cache.get(1, fields=FIELDS)
+    await cache.get(3, fields=FIELDS)
+
+    assert len(cache) == 2
+    assert await cache.get(1, fields=FIELDS) == DEVICE1
+    assert await cache.get(2, fields=FIELDS) == DEVICE2
+    assert cache.stats == CacheStats(hits=2, misses=4, evictions=2)
@@ -0,0 +1,110 @@
+import asyncio
+
+import httpx
+import pytest
+import pytest_httpx
+
+from armis_sdk.clients.assets_client import AssetsClient
+from armis_sdk.clients.device_loader import DeviceLoader
+from armis_sdk.core.armis_error import ResponseError
+from armis_sdk.entities.device import Device
+
+pytest_plugins = ["tests.plugins.auto_setup_plugin"]
+
+
+def add_search_response(
+    httpx_mock: pytest_httpx.HTTPXMock,
+    asset_ids: list,
+    asset_id_source: str,
+    items: list[dict],
+):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        match_json={
+            "limit": 100,
+            "asset_type": "DEVICE",
+            "fields": ["device_id", "ipv4_addresses"],
+            "filter": {
+                "filter_criteria": "ASSET_ID",
+                "asset_ids": asset_ids,
+                "asset_id_source": asset_id_source,
+            },
+        },
+        json={
+            "items": [{"asset_id": item["device_id"], "fields": item} for item in items]
+        },
+    )
+
+
+async def test_load(httpx_mock: pytest_httpx.HTTPXMock):
+    add_search_response(
+        httpx_mock,
+        [1, 2, 3],
+        "ASSET_ID",
+        [
+            {"device_id": 1, "ipv4_addresses": ["1.1.1.1"]},
+            {"device_id": 2, "ipv4_addresses": ["2.2.2.2"]},
+        ],
+    )
+    add_search_response(
+        httpx_mock,
+        ["2.2.2.2"],
+        "IPV4_ADDRESS",
+        [{"device_id": 2, "ipv4_addresses": ["2.2.2.2"]}],
+    )
+
+    loader = DeviceLoader(AssetsClient(), fields=["device_id", "ipv4_addresses"])
+    results = await asyncio.gather(
+        loader.load(1),
+        loader.load(2),
+        loader.load(1),
+        loader.load(3),
+        loader.load("2.2.2.2", "IPV4_ADDRESS"),
+    )
+
+    device1 = Device(device_id=1, ipv4_addresses=["1.1.1.1"])
+    device2 = Device(device_id=2, ipv4_addresses=["2.2.2.2"])
+    assert results == [device1, device2, device1, None, device2]
+
+    # Memoized, no additional requests
+    assert await loader.load_many([2, 1]) == [device2, device1]
+
+
+async def test_load_with_batch_window(httpx_mock: pytest_httpx.HTTPXMock):
+    add_search_response(
+        httpx_mock,
+        [1, 2],
+        "ASSET_ID",
+        [{"device_id": 1}, {"device_id": 2}],
+    )
+
+    loader = DeviceLoader(
+        AssetsClient(), fields=["device_id", "ipv4_addresses"], batch_window=0.05
+    )
+
+    async def delayed_load():
+        await asyncio.sleep(0.01)
+        return await loader.load(2)
+
+    assert await asyncio.gather(loader.load(1), delayed_load()) == [
+        Device(device_id=1),
+        Device(device_id=2),
+    ]
+
+
+async def test_load_failure_is_not_memoized(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        status_code=httpx.codes.BAD_REQUEST,
+        json={"detail": "Bad request"},
+    )
+    add_search_response(httpx_mock, [1], "ASSET_ID", [{"device_id": 1}])
+
+    loader = DeviceLoader(AssetsClient(), fields=["device_id", "ipv4_addresses"])
+
+    with pytest.raises(ResponseError, match="Bad request"):
+        await loader.load(1)
+
+    assert await loader.load(1) == Device(device_id=1)
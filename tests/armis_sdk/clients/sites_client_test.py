@@ -1,14 +1,35 @@
+import json
+
+import httpx
 import pytest
 import pytest_httpx
 
+from armis_sdk.clients import sites_client as sites_client_module
+from armis_sdk.clients.sites_client import SitePlan
 from armis_sdk.clients.sites_client import SitesClient
 from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.core.armis_error import BulkSiteError
 from armis_sdk.entities.asq_rule import AsqRule
 from armis_sdk.entities.site import Site
 
 pytest_plugins = ["tests.plugins.auto_setup_plugin"]
 
 
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture(name="clock")
+def clock_fixture(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(sites_client_module, "time", clock)
+    return clock
+
+
 async def test_create(httpx_mock: pytest_httpx.HTTPXMock):
     httpx_mock.add_response(
         url="https://api.armis.com/v3/settings/sites",
@@ -325,3 +346,367 @@ async def test_update_without_id(httpx_mock: pytest_httpx.HTTPXMock):
         match=r"Can't update a site without an id. Did you mean to call `\.create\(site\)`?",
     ):
         await sites_client.update(site)
+
+
+async def test_tree_is_cached(clock: Clock, httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/sites?limit=100",
+        method="GET",
+        json={"items": [{"id": "1"}, {"id": "2", "parent_id": "1"}]},
+        is_reusable=True,
+    )
+    sites_client = SitesClient(tree_ttl=60)
+
+    tree = await sites_client.tree()
+    clock.now += 59
+    assert await sites_client.tree() is tree
+    assert [site.id for site in tree.descendants(1)] == [2]
+    assert len(httpx_mock.get_requests(method="GET")) == 1
+
+    clock.now += 1
+    assert await sites_client.tree() is not tree
+    assert await sites_client.tree(refresh=True) is not tree
+    assert len(httpx_mock.get_requests(method="GET")) == 3
+
+
+async def test_tree_is_patched(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/sites?limit=100",
+        method="GET",
+        json={"items": [{"id": "1"}, {"id": "2", "parent_id": "1"}]},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/sites",
+        method="POST",
+        json={"id": "3", "name": "new", "parent_id": "2"},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/sites/2",
+        method="PATCH",
+        json={"id": "2", "name": "moved"},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/sites/1",
+        method="DELETE",
+    )
+    sites_client = SitesClient()
+    tree = await sites_client.tree()
+
+    await sites_client.create(Site(name="new", parent_id=2))
+    assert [site.id for site in tree.descendants(1)] == [2, 3]
+
+    await sites_client.update(Site(id=2, name="moved"))
+    assert [site.id for site in tree.roots] == [1, 2]
+    assert tree.depth(3) == 1
+
+    await sites_client.delete(Site(id=1))
+    assert 1 not in tree
+    assert await sites_client.tree() is tree
+
+
+async def test_create_many(httpx_mock: pytest_httpx.HTTPXMock):
+    ids = {"EMEA": 10, "Geneva": 11, "Paris": 12, "US": 20}
+
+    def create(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        return httpx.Response(200, json={**payload, "id": ids[payload["name"]]})
+
+    httpx_mock.add_callback(
+        create,
+        url="https://api.armis.com/v3/settings/sites",
+        method="POST",
+        is_reusable=True,
+    )
+    sites = [
+        Site(name="EMEA", children=[Site(name="Geneva"), Site(name="Paris")]),
+        Site(name="US", parent_id=1),
+    ]
+
+    created = await SitesClient().create_many(sites, concurrency=2)
+
+    assert created == [
+        Site(id=10, name="EMEA"),
+        Site(id=11, name="Geneva", parent_id=10),
+        Site(id=12, name="Paris", parent_id=10),
+        Site(id=20, name="US", parent_id=1),
+    ]
+    names = [
+        json.loads(request.content)["name"]
+        for request in httpx_mock.get_requests(method="POST")
+        if request.url.path == "/v3/settings/sites"
+    ]
+    assert names.index("EMEA") < names.index("Geneva")
+
+
+async def test_create_many_with_failures(httpx_mock: pytest_httpx.HTTPXMock):
+    def create(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        if payload["name"] == "EMEA":
+            return httpx.Response(400, json={"detail": "Invalid location"})
+        return httpx.Response(200, json={**payload, "id": 20})
+
+    httpx_mock.add_callback(
+        create,
+        url="https://api.armis.com/v3/settings/sites",
+        method="POST",
+        is_reusable=True,
+    )
+    sites = [Site(name="EMEA", children=[Site(name="Geneva")]), Site(name="US")]
+
+    with pytest.raises(BulkSiteError) as error_info:
+        await SitesClient().create_many(sites)
+
+    error = error_info.value
+    assert [(item.index, item.detail) for item in error.items] == [
+        (0, "Invalid location"),
+        (1, "Skipped because the site at index 0 failed."),
+    ]
+    assert error.results == [None, None, Site(id=20, name="US")]
+    assert 'Failed to create site at index 0. Site: {"name": "EMEA"}' in str(error)
+
+
+async def test_create_many_with_invalid_response(httpx_mock: pytest_httpx.HTTPXMock):
+    def create(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        site_id = "invalid" if payload["name"] == "EMEA" else 20
+        return httpx.Response(200, json={**payload, "id": site_id})
+
+    httpx_mock.add_callback(
+        create,
+        url="https://api.armis.com/v3/settings/sites",
+        method="POST",
+        is_reusable=True,
+    )
+    sites = [Site(name="EMEA"), Site(name="US")]
+
+    with pytest.raises(BulkSiteError) as error_info:
+        await SitesClient().create_many(sites)
+
+    error = error_info.value
+    assert [item.index for item in error.items] == [0]
+    assert "validation error" in error.items[0].detail
+    assert error.results == [None, Site(id=20, name="US")]
+
+
+async def test_delete_many(httpx_mock: pytest_httpx.HTTPXMock):
+    for site_id in [1, 2, 3]:
+        httpx_mock.add_response(
+            url=f"https://api.armis.com/v3/settings/sites/{site_id}",
+            method="DELETE",
+        )
+
+    sites = [Site(id=1), Site(id=2, parent_id=1), Site(id=3, parent_id=2)]
+    await SitesClient().delete_many(sites)
+
+    paths = [request.url.path for request in httpx_mock.get_requests(method="DELETE")]
+    assert paths == [
+        "/v3/settings/sites/3",
+        "/v3/settings/sites/2",
+        "/v3/settings/sites/1",
+    ]
+
+
+async def test_delete_many_with_cycle():
+    sites = [Site(id=1, parent_id=2), Site(id=2, parent_id=1)]
+
+    with pytest.raises(ArmisError, match="is its own ancestor"):
+        await SitesClient().delete_many(sites)
+
+
+async def test_update_many(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/sites/1",
+        method="PATCH",
+        match_json={"tier": "Gold"},
+        status_code=404,
+        json={"detail": "Site not found"},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/sites/2",
+        method="PATCH",
+        match_json={"tier": "Silver", "parent_id": 1},
+        json={"id": 2, "tier": "Silver", "parent_id": 1},
+    )
+    sites = [Site(id=1, tier="Gold"), Site(id=2, tier="Silver", parent_id=1)]
+
+    with pytest.raises(BulkSiteError) as error_info:
+        await SitesClient().update_many(sites)
+
+    assert [item.index for item in error_info.value.items] == [0]
+    assert error_info.value.results == [
+        None,
+        Site(id=2, tier="Silver", parent_id=1),
+    ]
+
+
+async def test_bulk_with_invalid_concurrency():
+    with pytest.raises(ArmisError, match="concurrency must be at least 1"):
+        await SitesClient().update_many([Site(id=1)], concurrency=0)
+
+
+def add_current_sites(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/sites?limit=100",
+        method="GET",
+        json={
+            "items": [
+                {"id": "1", "name": "EMEA", "tier": "Gold"},
+                {"id": "2", "name": "Geneva", "parent_id": "1", "location": "CH"},
+                {"id": "3", "name": "Paris", "parent_id": "1"},
+                {"id": "4", "name": "US"},
+            ],
+        },
+    )
+
+
+async def test_plan(httpx_mock: pytest_httpx.HTTPXMock):
+    add_current_sites(httpx_mock)
+    desired = [
+        Site(
+            name="EMEA",
+            tier="Gold",
+            children=[
+                Site(name="Geneva", location="CH"),
+                Site(name="London", children=[Site(name="Paris", tier="Silver")]),
+            ],
+        ),
+        Site(name="APAC", children=[Site(name="Tokyo")]),
+    ]
+
+    plan = await SitesClient().plan(desired)
+
+    assert plan.creates == [
+        Site(name="London", parent_id=1),
+        Site(name="APAC", children=[Site(name="Tokyo")]),
+    ]
+    assert plan.updates == [Site(id=3, tier="Silver")]
+    assert plan.reparents == {3: 0}
+    assert plan.deletes == [Site(id=4, name="US")]
+
+
+@pytest.mark.parametrize(
+    ["desired", "expected_deletes"],
+    [
+        pytest.param(
+            [Site(name="Geneva")],
+            [Site(id=3, name="Paris", parent_id=1), Site(id=4, name="US")],
+            id="Kept child",
+        ),
+        pytest.param(
+            [Site(name="US", children=[Site(name="Geneva")])],
+            [
+                Site(id=1, name="EMEA", tier="Gold"),
+                Site(id=3, name="Paris", parent_id=1),
+            ],
+            id="Moved child",
+        ),
+        pytest.param(
+            [Site(name="Lyon", parent_id=1)],
+            [
+                Site(id=2, name="Geneva", parent_id=1, location="CH"),
+                Site(id=3, name="Paris", parent_id=1),
+                Site(id=4, name="US"),
+            ],
+            id="Created child",
+        ),
+    ],
+)
+async def test_plan_keeps_ancestors(
+    desired, expected_deletes, httpx_mock: pytest_httpx.HTTPXMock
+):
+    add_current_sites(httpx_mock)
+
+    plan = await SitesClient().plan(desired)
+
+    assert plan.deletes == expected_deletes
+
+
+async def test_plan_without_changes(httpx_mock: pytest_httpx.HTTPXMock):
+    add_current_sites(httpx_mock)
+    desired = [
+        Site(id=1, tier="Gold"),
+        Site(id=2, parent_id=1),
+        Site(id=3, name="Paris"),
+        Site(id=4),
+    ]
+
+    plan = await SitesClient().plan(desired, key="id")
+
+    assert not plan
+
+
+@pytest.mark.parametrize(
+    ["asq_rule", "expected_updates"],
+    [
+        pytest.param(AsqRule(and_=["x"]), [], id="Unchanged"),
+        pytest.param(
+            AsqRule(and_=["y"]),
+            [Site(id=1, asq_rule=AsqRule(and_=["y"]))],
+            id="Changed",
+        ),
+    ],
+)
+async def test_plan_asq_rule(
+    asq_rule, expected_updates, httpx_mock: pytest_httpx.HTTPXMock
+):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/sites?limit=100",
+        method="GET",
+        json={"items": [{"id": "1", "name": "EMEA", "ruleAql": '{"and": ["x"]}'}]},
+    )
+
+    plan = await SitesClient().plan([Site(name="EMEA", asq_rule=asq_rule)])
+
+    assert plan.updates == expected_updates
+
+
+@pytest.mark.parametrize(
+    ["desired", "key", "expected_error"],
+    [
+        (
+            [Site(name="EMEA"), Site(name="EMEA")],
+            "name",
+            "More than one desired site has the name 'EMEA'.",
+        ),
+        ([Site(id=9)], "id", "Site 9 doesn't exist, so it can't be updated."),
+    ],
+)
+async def test_plan_errors(
+    desired, key, expected_error, httpx_mock: pytest_httpx.HTTPXMock
+):
+    add_current_sites(httpx_mock)
+
+    with pytest.raises(ArmisError, match=expected_error):
+        await SitesClient().plan(desired, key=key)
+
+
+async def test_apply(httpx_mock: pytest_httpx.HTTPXMock):
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/sites",
+        method="POST",
+        match_json={"name": "London", "parent_id": 1},
+        json={"id": 5, "name": "London", "parent_id": 1},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/sites/3",
+        method="PATCH",
+        json={"id": 3, "name": "Paris", "tier": "Silver", "parent_id": 5},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/settings/sites/4",
+        method="DELETE",
+    )
+    plan = SitePlan(
+        creates=[Site(name="London", parent_id=1)],
+        updates=[Site(id=3, tier="Silver")],
+        deletes=[Site(id=4, name="US")],
+        reparents={3: 0},
+    )
+
+    await SitesClient().apply(plan)
+
+    methods = [request.method for request in httpx_mock.get_requests()]
+    assert methods[-3:] == ["POST", "PATCH", "DELETE"]
+    # Paris is moved under the created London, by the id it got when created.
+    (patch,) = httpx_mock.get_requests(method="PATCH")
+    assert json.loads(patch.content) == {"tier": "Silver", "parent_id": 5}
@@ -1,4 +1,5 @@
 import importlib.metadata
+import json
 import platform
 
 import httpx
@@ -145,6 +146,61 @@ async def test_list_with_multiple_pages(
     ]
 
 
+async def test_list_pages(monkeypatch, httpx_mock: pytest_httpx.HTTPXMock):
+    monkeypatch.setenv("ARMIS_PAGE_SIZE", "2")
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        match_json={"limit": 2, "asset_type": "DEVICE"},
+        json={"next": 2, "items": [{"id": 1}, {"id": 2}]},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        match_json={"limit": 2, "asset_type": "DEVICE", "after": 2},
+        json={"next": None, "items": [{"id": 3}]},
+    )
+
+    armis_client = ArmisClient()
+    pages = [
+        page
+        async for page in armis_client.list_pages(
+            "/v3/assets/_search", body={"asset_type": "DEVICE"}
+        )
+    ]
+
+    assert pages == [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+
+
+async def test_list_page_contents(monkeypatch, httpx_mock: pytest_httpx.HTTPXMock):
+    monkeypatch.setenv("ARMIS_PAGE_SIZE", "2")
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        match_json={"limit": 2, "asset_type": "DEVICE"},
+        json={"next": 2, "items": [{"id": 1}, {"id": 2}]},
+    )
+    httpx_mock.add_response(
+        url="https://api.armis.com/v3/assets/_search",
+        method="POST",
+        match_json={"limit": 2, "asset_type": "DEVICE", "after": 2},
+        json={"next": None, "items": [{"id": 3}]},
+    )
+
+    armis_client = ArmisClient()
+    contents = [
+        content
+        async for content in armis_client.list_page_contents(
+            "/v3/assets/_search", body={"asset_type": "DEVICE"}
+        )
+    ]
+
+    assert [json.loads(content)["items"] for content in contents] == [
+        [{"id": 1}, {"id": 2}],
+        [{"id": 3}],
+    ]
+
+
 @pytest.mark.parametrize(
     ["env_var", "proxy_url", "expected_proxy"],
     [
@@ -0,0 +1,80 @@
+import datetime
+
+import pyarrow
+
+from armis_sdk.core.arrow_decoder import ArrowDecoder
+from armis_sdk.entities.device import Device
+from tests.armis_sdk.clients.assets_test_data import ALL_DEVICE_FIELDS
+from tests.armis_sdk.clients.assets_test_data import MOCK_DEVICE_FULL_RAW_DATA
+
+
+def test_schema():
+    decoder = ArrowDecoder.for_fields(
+        Device, ["device_id", "last_seen", "tags", "site", "custom.Owner"]
+    )
+
+    assert decoder.schema.field("device_id").type == pyarrow.int64()
+    assert decoder.schema.field("last_seen").type == pyarrow.timestamp("us", tz="UTC")
+    assert decoder.schema.field("tags").type == pyarrow.list_(pyarrow.string())
+    assert decoder.schema.field("site").type.field("parent_id").type == pyarrow.int64()
+    assert decoder.schema.field("custom.Owner").type == pyarrow.string()
+
+
+def test_decode_page():
+    decoder = ArrowDecoder.for_fields(Device, [*ALL_DEVICE_FIELDS, "custom.Size"])
+    items = [
+        {"fields": MOCK_DEVICE_FULL_RAW_DATA},
+        {"fields": {"device_id": 2, "last_seen": "2025-12-03T13:52:45Z"}},
+        {"fields": {"device_id": 3, "custom.Size": 3}},
+    ]
+
+    batch = decoder.decode_page(items)
+
+    assert batch.schema == decoder.schema
+    assert batch.num_rows == 3
+    rows = batch.to_pylist()
+    utc = datetime.timezone.utc
+    assert rows[0]["device_id"] == 1
+    assert rows[0]["last_seen"] == datetime.datetime(
+        2025, 12, 3, 13, 52, 45, tzinfo=utc
+    )
+    assert rows[0]["boundaries"] == [{"id": 1, "name": "Corporate"}]
+    assert rows[0]["network_interfaces"][0]["vlan"] == 1
+    assert rows[0]["site"]["name"] == "Geneva Enterprise"
+    assert rows[0]["tags"] == MOCK_DEVICE_FULL_RAW_DATA["tags"]
+    assert rows[1]["last_seen"] == datetime.datetime(
+        2025, 12, 3, 13, 52, 45, tzinfo=utc
+    )
+    assert rows[1]["site"] is None
+    assert [row["custom.Size"] for row in rows] == [None, None, "3"]
+
+
+def test_decode_empty_page():
+    decoder = ArrowDecoder.for_fields(Device, ["device_id"])
+
+    batch = decoder.decode_page([])
+
+    assert batch.num_rows == 0
+    assert batch.schema == decoder.schema
+
+
+def test_decode_page_coerces_like_entities():
+    decoder = ArrowDecoder.for_fields(Device, ["device_id", "site"])
+    site = {
+        "id": "1",
+        "name": "Geneva",
+        "parentId": "2",
+        "integrationIds": ["3", 4],
+        "networkEquipmentDeviceIds": "invalid",
+        "ruleAql": '{"or": ["rule1"]}',
+    }
+
+    batch = decoder.decode_page([{"fields": {"device_id": 1, "site": site}}])
+
+    site_row = batch.to_pylist()[0]["site"]
+    assert site_row["id"] == 1
+    assert site_row["parent_id"] == 2
+    assert site_row["integration_ids"] == [3, 4]
+    assert site_row["network_equipment_device_ids"] is None
+    assert site_row["asq_rule"]["or_"] == ["rule1"]
+    assert Device.model_validate({"device_id": 1, "site": site}).site.id == 1
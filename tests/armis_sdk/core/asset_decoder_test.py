@@ -0,0 +1,72 @@
+import pydantic
+import pytest
+
+from armis_sdk.core.asset_decoder import AssetDecoder
+from armis_sdk.entities.device import Device
+from armis_sdk.entities.site import Site
+from tests.armis_sdk.clients.assets_test_data import MOCK_DEVICE_FULL
+from tests.armis_sdk.clients.assets_test_data import MOCK_DEVICE_FULL_RAW_DATA
+from tests.armis_sdk.clients.assets_test_data import MOCK_DEVICE_PARTIAL
+from tests.armis_sdk.clients.assets_test_data import MOCK_DEVICE_PARTIAL_RAW_DATA
+
+
+def test_decode_page():
+    decoder = AssetDecoder.for_class(Device)
+    items = [
+        {"fields": MOCK_DEVICE_FULL_RAW_DATA},
+        {"fields": MOCK_DEVICE_PARTIAL_RAW_DATA},
+    ]
+
+    devices = decoder.decode_page(items)
+
+    assert devices == [MOCK_DEVICE_FULL, MOCK_DEVICE_PARTIAL]
+    assert devices == [Device.from_search_result(item) for item in items]
+    assert all(device.changed_fields() == [] for device in devices)
+    assert isinstance(devices[0].site, Site)
+
+
+def test_decode_page_invalid():
+    decoder = AssetDecoder.for_class(Device)
+
+    with pytest.raises(pydantic.ValidationError):
+        decoder.decode({"fields": {"device_id": "not a number"}})
+
+
+def test_decode_tracks_mutable_values():
+    decoder = AssetDecoder.for_class(Device)
+    device = decoder.decode(
+        {"fields": {"custom.Owners": ["Jane"], "custom.Team": "IT"}}
+    )
+
+    device.custom["Owners"].append("John")
+
+    assert device.changed_fields() == ["custom.Owners"]
+
+
+def test_for_class_is_cached():
+    assert AssetDecoder.for_class(Device) is AssetDecoder.for_class(Device)
+
+
+def test_decode_page_lazy():
+    decoder = AssetDecoder.for_class(Device)
+    items = [
+        {"fields": MOCK_DEVICE_FULL_RAW_DATA},
+        {"fields": MOCK_DEVICE_PARTIAL_RAW_DATA},
+    ]
+
+    devices = decoder.decode_page_lazy(items)
+
+    assert devices[0].lazy_fields == ["boundaries", "network_interfaces", "site"]
+    assert devices[0].device_id == MOCK_DEVICE_FULL.device_id
+    assert devices[0].changed_fields() == []
+    assert [device.load() for device in devices] == [
+        MOCK_DEVICE_FULL,
+        MOCK_DEVICE_PARTIAL,
+    ]
+
+
+def test_decode_page_lazy_invalid():
+    decoder = AssetDecoder.for_class(Device)
+
+    with pytest.raises(pydantic.ValidationError):
+        decoder.decode_page_lazy([{"fields": {"device_id": "not a number"}}])
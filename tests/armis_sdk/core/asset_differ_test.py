@@ -0,0 +1,91 @@
+import datetime
+
+import pytest
+
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.core.asset_differ import AssetChange
+from armis_sdk.core.asset_differ import AssetDiffer
+from armis_sdk.entities.device import Device
+from armis_sdk.entities.site import Site
+
+DEVICE_1 = Device(
+    device_id=1,
+    ipv4_addresses=["1.1.1.1", "10.0.0.1"],
+    last_seen=datetime.datetime(2025, 12, 3, tzinfo=datetime.timezone.utc),
+    site=Site(id=10),
+    tags=["Critical", "Managed"],
+    custom={"Owner": "Jane"},
+)
+DEVICE_2 = Device(device_id=2, tags=["Critical"])
+
+
+def test_content_hash_is_stable():
+    differ = AssetDiffer()
+    same = DEVICE_1.model_copy(
+        update={
+            "ipv4_addresses": ["10.0.0.1", "1.1.1.1"],
+            "tags": ["Managed", "Critical"],
+            "custom": {"Owner": "Jane", "Empty": None},
+        }
+    )
+
+    assert differ.content_hash(DEVICE_1) == differ.content_hash(same)
+    assert differ.content_hash(DEVICE_1) != differ.content_hash(DEVICE_2)
+    assert len(differ.content_hash(DEVICE_1)) == 32
+
+
+def test_content_hash_with_fields():
+    differ = AssetDiffer(fields=["tags", "custom.Owner"])
+
+    assert differ.content_hash(DEVICE_1) == differ.content_hash(
+        DEVICE_1.model_copy(update={"ipv4_addresses": ["2.2.2.2"]})
+    )
+    assert differ.content_hash(DEVICE_1) != differ.content_hash(
+        DEVICE_1.model_copy(update={"custom": {"Owner": "John"}})
+    )
+
+
+def test_content_hash_with_invalid_field():
+    differ = AssetDiffer(fields=["tagz"])
+
+    with pytest.raises(ArmisError, match="Field 'tagz' doesn't exist on 'Device'"):
+        differ.content_hash(DEVICE_1)
+
+
+async def test_diff():
+    differ = AssetDiffer()
+    changed = DEVICE_1.model_copy(
+        update={"tags": ["Critical"], "custom": {"Owner": "John", "Team": "IT"}}
+    )
+    added = Device(device_id=3)
+
+    changes = [
+        change async for change in differ.diff([DEVICE_1, DEVICE_2], [changed, added])
+    ]
+
+    assert changes == [
+        AssetChange("changed", 1, changed, ("custom.Owner", "custom.Team", "tags")),
+        AssetChange("added", 3, added),
+        AssetChange("removed", 2),
+    ]
+
+
+async def test_diff_with_snapshot():
+    differ = AssetDiffer(fields=["ipv4_addresses"])
+
+    async def devices():
+        yield DEVICE_1.model_copy(update={"tags": []})
+        yield DEVICE_2
+
+    snapshot = await differ.snapshot([DEVICE_1, DEVICE_2])
+    changes = [change async for change in differ.diff(snapshot, devices())]
+
+    assert set(snapshot) == {1, 2}
+    assert not changes
+
+
+async def test_diff_without_id():
+    differ = AssetDiffer()
+
+    with pytest.raises(ArmisError, match="doesn't have a 'device_id'"):
+        await differ.snapshot([Device()])
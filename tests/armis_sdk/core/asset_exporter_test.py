@@ -0,0 +1,112 @@
+import json
+
+import pyarrow
+import pyarrow.parquet
+import pytest
+
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.core.arrow_decoder import ArrowDecoder
+from armis_sdk.core.asset_decoder import AssetDecoder
+from armis_sdk.core.asset_exporter import NdjsonExporter
+from armis_sdk.core.asset_exporter import ParquetExporter
+from armis_sdk.entities.device import Device
+
+FIELDS = ["device_id", "last_seen", "tags", "custom.Owner"]
+
+
+def make_batch(start: int, stop: int) -> pyarrow.RecordBatch:
+    decoder = ArrowDecoder.for_fields(Device, FIELDS)
+    return decoder.decode_page(
+        [
+            {"fields": {"device_id": device_id, "tags": [f"tag{device_id}"]}}
+            for device_id in range(start, stop)
+        ]
+    )
+
+
+async def devices(count: int):
+    for device_id in range(count):
+        yield Device(device_id=device_id, custom={"Owner": f"owner{device_id}"})
+
+
+async def test_parquet_exporter_batches(tmp_path):
+    exporter = ParquetExporter(tmp_path / "export", row_group_size=4)
+    batches = [make_batch(0, 3), make_batch(3, 6), make_batch(6, 7)]
+
+    paths = await exporter.export(batches)
+
+    assert paths == [tmp_path / "export" / "assets-00000.parquet"]
+    parquet_file = pyarrow.parquet.ParquetFile(paths[0])
+    assert parquet_file.metadata.num_row_groups == 2
+    assert parquet_file.metadata.row_group(0).column(0).compression == "ZSTD"
+    table = parquet_file.read()
+    assert table.column("device_id").to_pylist() == list(range(7))
+    assert table.column("tags").to_pylist()[6] == ["tag6"]
+
+
+async def test_parquet_exporter_assets_rolls_files(tmp_path):
+    exporter = ParquetExporter(
+        tmp_path,
+        prefix="devices",
+        max_file_size=1,
+        row_group_size=10,
+        compression=None,
+        fields=FIELDS,
+    )
+
+    paths = await exporter.export(devices(25))
+
+    assert [path.name for path in paths] == [
+        "devices-00000.parquet",
+        "devices-00001.parquet",
+        "devices-00002.parquet",
+    ]
+    table = pyarrow.parquet.read_table(paths[1])
+    assert table.column_names == FIELDS
+    assert table.column("device_id").to_pylist() == list(range(10, 20))
+    assert table.column("custom.Owner").to_pylist()[0] == "owner10"
+
+
+async def test_parquet_exporter_lazy_assets(tmp_path):
+    exporter = ParquetExporter(tmp_path, fields=["device_id", "site"])
+    items = [
+        {"fields": {"device_id": device_id, "site": {"id": device_id}}}
+        for device_id in range(3)
+    ]
+    lazy_devices = AssetDecoder.for_class(Device).decode_page_lazy(items)
+
+    paths = await exporter.export(lazy_devices)
+
+    table = pyarrow.parquet.read_table(paths[0])
+    assert table.column("device_id").to_pylist() == [0, 1, 2]
+    assert [site["id"] for site in table.column("site").to_pylist()] == [0, 1, 2]
+
+
+async def test_ndjson_exporter(tmp_path):
+    exporter = NdjsonExporter(tmp_path, chunk_size=2)
+
+    paths = await exporter.export([device async for device in devices(3)])
+
+    assert paths == [tmp_path / "assets-00000.ndjson"]
+    lines = paths[0].read_text().splitlines()
+    assert [json.loads(line)["device_id"] for line in lines] == [0, 1, 2]
+    assert json.loads(lines[2])["custom"] == {"Owner": "owner2"}
+
+
+async def test_ndjson_exporter_compressed_batches(tmp_path):
+    exporter = NdjsonExporter(tmp_path, compression="zstd", max_file_size=1)
+
+    paths = await exporter.export([make_batch(0, 2)])
+
+    assert paths == [tmp_path / "assets-00000.ndjson.zst"]
+    with pyarrow.CompressedInputStream(str(paths[0]), "zstd") as stream:
+        lines = stream.read().decode().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"device_id": 0, "last_seen": None, "tags": ["tag0"], "custom.Owner": None},
+        {"device_id": 1, "last_seen": None, "tags": ["tag1"], "custom.Owner": None},
+    ]
+
+
+def test_ndjson_exporter_invalid_compression(tmp_path):
+    with pytest.raises(ArmisError, match="Unsupported compression 'lz4'"):
+        NdjsonExporter(tmp_path, compression="lz4")
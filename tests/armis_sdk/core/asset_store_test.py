@@ -0,0 +1,114 @@
+import pytest
+
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.core.asset_store import SqliteAssetStore
+from armis_sdk.entities.asq_rule import AsqRule
+from armis_sdk.entities.device import Device
+from armis_sdk.entities.site import Site
+from tests.armis_sdk.clients import assets_test_data
+
+DEVICE = Device(
+    device_id=2,
+    custom={"Owner": "Jane", "Size": 3},
+    integration={"qualys_agent_id": "abc"},
+    ipv4_addresses=["10.0.0.2"],
+    mac_addresses=["AA:BB:CC:DD:EE:02"],
+    site=Site(id=1, name="HQ", asq_rule=AsqRule(or_=["asq1"])),
+)
+
+
+def test_write_and_get():
+    with SqliteAssetStore() as store:
+        assert store.write([assets_test_data.MOCK_DEVICE_FULL, DEVICE]) == 2
+
+        assert len(store) == 2
+        assert store.get(1) == assets_test_data.MOCK_DEVICE_FULL
+        assert store.get(2) == DEVICE
+        assert store.get(3) is None
+        assert list(store) == [assets_test_data.MOCK_DEVICE_FULL, DEVICE]
+
+
+def test_write_and_get_empty_lists():
+    device = Device(
+        device_id=3,
+        ipv6_addresses=[],
+        names=[],
+        network_interfaces=[],
+        boundaries=[],
+        tags=None,
+    )
+
+    with SqliteAssetStore() as store:
+        store.write([device])
+
+        assert store.get(3) == device
+        assert store.get(3).tags is None
+
+
+@pytest.mark.parametrize(
+    ["asset_id", "asset_id_source", "expected_ids"],
+    [
+        (1, "ASSET_ID", [1]),
+        ("10.246.212.12", "IPV4_ADDRESS", [1]),
+        ("aa:bb:cc:dd:ee:02", "MAC_ADDRESS", [2]),
+        ("FE80::4D68:8D3E:D3A5:C930", "IPV6_ADDRESS", [1]),
+        ("SN", "SERIAL_NUMBER", []),
+        ("abc", "ASSET_ID", []),
+    ],
+)
+def test_find(asset_id, asset_id_source, expected_ids):
+    with SqliteAssetStore() as store:
+        store.write([assets_test_data.MOCK_DEVICE_FULL, DEVICE])
+
+        devices = store.find(asset_id, asset_id_source)
+
+        assert [device.device_id for device in devices] == expected_ids
+
+
+def test_write_replaces_existing_device():
+    with SqliteAssetStore() as store:
+        store.write([DEVICE])
+        updated = Device(device_id=2, custom={"Owner": "John"}, tags=["Managed"])
+
+        store.write([updated])
+
+        assert store.get(2) == updated
+        assert store.find("10.0.0.2", "IPV4_ADDRESS") == []
+        assert store.query(
+            "SELECT key, value FROM device_properties WHERE device_id = ?", [2]
+        ) == [("Owner", '"John"')]
+
+
+def test_write_duplicate_devices():
+    with SqliteAssetStore() as store:
+        updated = Device(device_id=2, tags=["Managed"])
+
+        store.write([assets_test_data.MOCK_DEVICE_FULL, DEVICE, updated])
+        store.write([assets_test_data.MOCK_DEVICE_FULL] * 2)
+
+        assert len(store) == 2
+        assert store.get(1) == assets_test_data.MOCK_DEVICE_FULL
+        assert store.get(2) == updated
+
+
+async def test_ingest(tmp_path):
+    async def devices():
+        for device_id in range(1, 6):
+            yield Device(device_id=device_id, tags=["Managed"])
+
+    path = str(tmp_path / "devices.db")
+    with SqliteAssetStore(path) as store:
+        assert await store.ingest(devices(), batch_size=2) == 5
+
+    with SqliteAssetStore(path) as store:
+        assert store.query(
+            "SELECT COUNT(*) FROM device_tags WHERE tag = ?", ["Managed"]
+        ) == [(5,)]
+
+
+def test_write_without_device_id():
+    with SqliteAssetStore() as store:
+        with pytest.raises(
+            ArmisError, match="Can't store a device without a device id"
+        ):
+            store.write([Device()])
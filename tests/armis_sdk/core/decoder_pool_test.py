@@ -0,0 +1,66 @@
+import json
+
+import pydantic
+import pytest
+
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.core.decoder_pool import DecoderPool
+from armis_sdk.core.records import DeviceRecord
+from armis_sdk.entities.device import Device
+from armis_sdk.entities.site import Site
+
+
+@pytest.fixture(name="decoder_pool", scope="module")
+def fixture_decoder_pool():
+    with DecoderPool(max_workers=2, max_pending=3) as decoder_pool:
+        yield decoder_pool
+
+
+async def contents(*pages: list[dict]):
+    for page in pages:
+        yield json.dumps({"items": page}).encode()
+
+
+def make_item(device_id: int) -> dict:
+    return {"fields": {"device_id": device_id, "site": {"id": 1}, "custom.Team": "IT"}}
+
+
+async def test_decode_pages(decoder_pool: DecoderPool):
+    pages = [[make_item(index), make_item(index + 1)] for index in range(0, 20, 2)]
+
+    decoded = [
+        page async for page in decoder_pool.decode_pages(Device, contents(*pages))
+    ]
+
+    assert [[device.device_id for device in page] for page in decoded] == [
+        [index, index + 1] for index in range(0, 20, 2)
+    ]
+    assert decoded[0][0] == Device.from_search_result(make_item(0))
+    assert decoded[0][0].site == Site(id=1)
+    assert not decoded[0][0].changed_fields()
+
+
+async def test_decode_pages_records(decoder_pool: DecoderPool):
+    decoded = [
+        page
+        async for page in decoder_pool.decode_pages(
+            Device, contents([make_item(1)]), records=True
+        )
+    ]
+
+    assert decoded == [
+        [DeviceRecord.from_model(Device.from_search_result(make_item(1)))]
+    ]
+
+
+async def test_decode_pages_invalid(decoder_pool: DecoderPool):
+    pages = [[make_item(1)], [{"fields": {"device_id": "not a number"}}]]
+
+    with pytest.raises(pydantic.ValidationError):
+        async for _ in decoder_pool.decode_pages(Device, contents(*pages)):
+            pass
+
+
+def test_invalid_max_pending():
+    with pytest.raises(ArmisError, match="max_pending must be at least 1"):
+        DecoderPool(max_pending=0)
@@ -0,0 +1,103 @@
+import pytest
+
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.core.device_index import DeviceIndex
+from armis_sdk.entities.device import Device
+from armis_sdk.entities.site import Site
+
+DEVICE_1 = Device(
+    device_id=1,
+    ipv4_addresses=["1.1.1.1", "10.0.0.1"],
+    mac_addresses=["AA:BB:CC:DD:EE:01"],
+    serial_numbers=["SN1"],
+    site=Site(id=10),
+    tags=["Critical"],
+)
+DEVICE_2 = Device(
+    device_id=2,
+    ipv4_addresses=["10.0.0.1"],
+    ipv6_addresses=["fe80::2"],
+    site=Site(id=10),
+    tags=["Critical", "Managed"],
+)
+
+
+@pytest.mark.parametrize(
+    ["asset_id", "asset_id_source", "expected"],
+    [
+        (1, "ASSET_ID", [DEVICE_1]),
+        ("2", "ASSET_ID", [DEVICE_2]),
+        (3, "ASSET_ID", []),
+        ("abc", "ASSET_ID", []),
+        ("1.1.1.1", "IPV4_ADDRESS", [DEVICE_1]),
+        ("10.0.0.1", "IPV4_ADDRESS", [DEVICE_1, DEVICE_2]),
+        ("fe80::2", "IPV6_ADDRESS", [DEVICE_2]),
+        ("aa:bb:cc:dd:ee:01", "MAC_ADDRESS", [DEVICE_1]),
+        ("SN1", "SERIAL_NUMBER", [DEVICE_1]),
+        ("SN2", "SERIAL_NUMBER", []),
+    ],
+)
+def test_find(asset_id, asset_id_source, expected):
+    index = DeviceIndex([DEVICE_1, DEVICE_2])
+
+    assert index.find(asset_id, asset_id_source) == expected
+
+
+def test_by_site_and_tag():
+    index = DeviceIndex([DEVICE_1, DEVICE_2])
+
+    assert index.by_site(10) == [DEVICE_1, DEVICE_2]
+    assert index.by_tag("Managed") == [DEVICE_2]
+    assert index.by_tag("Unknown") == []
+
+
+def test_upsert_replaces_index_entries():
+    index = DeviceIndex([DEVICE_1, DEVICE_2])
+    updated = Device(device_id=2, ipv4_addresses=["2.2.2.2"])
+
+    index.upsert(updated)
+
+    assert len(index) == 2
+    assert index.find("10.0.0.1", "IPV4_ADDRESS") == [DEVICE_1]
+    assert index.find("2.2.2.2", "IPV4_ADDRESS") == [updated]
+    assert index.by_tag("Managed") == []
+
+
+def test_remove():
+    index = DeviceIndex([DEVICE_1, DEVICE_2])
+    size = index.memory_usage()
+
+    assert index.remove(1) == DEVICE_1
+    assert index.remove(1) is None
+    assert 1 not in index
+    assert index.find("SN1", "SERIAL_NUMBER") == []
+    assert index.memory_usage() < size
+    assert index.memory_usage(deep=True) > index.memory_usage()
+
+
+async def test_ingest():
+    async def devices():
+        yield DEVICE_1
+        yield DEVICE_2
+
+    index = DeviceIndex()
+
+    assert await index.ingest(devices()) == 2
+    assert list(index) == [DEVICE_1, DEVICE_2]
+
+
+def test_upsert_without_device_id():
+    index = DeviceIndex()
+
+    with pytest.raises(ArmisError, match="Can't index a device without a device id"):
+        index.upsert(Device())
+
+
+def test_remove_with_duplicate_keys():
+    index = DeviceIndex(
+        [Device(device_id=1, mac_addresses=["AA:BB:CC:DD:EE:01", "aa:bb:cc:dd:ee:01"])]
+    )
+
+    index.remove(1)
+
+    assert index.find("aa:bb:cc:dd:ee:01", "MAC_ADDRESS") == []
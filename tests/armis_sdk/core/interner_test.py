@@ -0,0 +1,90 @@
+import pydantic
+import pytest
+
+from armis_sdk.core.asset_decoder import AssetDecoder
+from armis_sdk.core.interner import Interner
+from armis_sdk.entities.boundary import Boundary
+from armis_sdk.entities.device import Device
+from armis_sdk.entities.site import Site
+
+
+def make_item(device_id: int) -> dict:
+    return {
+        "fields": {
+            "device_id": device_id,
+            "boundaries": [{"id": 1, "name": "Corporate"}],
+            "category": "".join(["Compu", "ters"]),
+            "custom.Owner": "".join(["Ja", "ne"]),
+            "site": {"id": 1, "name": "Geneva"},
+            "tags": ["".join(["Crit", "ical"])],
+        }
+    }
+
+
+def test_from_search_result():
+    interner = Interner()
+
+    device1 = Device.from_search_result(make_item(1), interner=interner)
+    device2 = Device.from_search_result(make_item(2), interner=interner)
+
+    assert device1.site is device2.site
+    assert device1.boundaries[0] is device2.boundaries[0]
+    assert device1.category is device2.category
+    assert device1.tags[0] is device2.tags[0]
+    assert device1.custom["Owner"] is device2.custom["Owner"]
+    assert device1.boundaries is not device2.boundaries
+    assert len(interner) == 2
+
+
+def test_decode_page():
+    interner = Interner()
+    decoder = AssetDecoder.for_class(Device)
+
+    devices = decoder.decode_page([make_item(1), make_item(2)], interner=interner)
+
+    assert devices == [
+        Device.from_search_result(make_item(1)),
+        Device.from_search_result(make_item(2)),
+    ]
+    assert devices[0].site is devices[1].site
+    assert not devices[0].changed_fields()
+
+
+def test_interned_models_are_frozen():
+    device = Device.from_search_result(make_item(1), interner=Interner())
+
+    with pytest.raises(pydantic.ValidationError):
+        device.site.name = "Paris"
+
+    site = device.site.model_copy(update={"name": "Paris"})
+    assert site == Site(id=1, name="Paris")
+    assert device.site == Site(id=1, name="Geneva")
+    assert Boundary(id=1, name="Corporate") == device.boundaries[0]
+    assert repr(device.site) == repr(Site(id=1, name="Geneva"))
+
+
+def test_interned_lists_are_frozen():
+    item = make_item(1)
+    item["fields"]["site"] = {"id": 1, "children": [{"id": 2}]}
+    device = Device.from_search_result(item, interner=Interner())
+
+    with pytest.raises(TypeError):
+        device.site.children.append(Site(id=3))
+    with pytest.raises(pydantic.ValidationError):
+        device.site.children[0].name = "Paris"
+
+    assert device.site == Site(id=1, children=[Site(id=2)])
+    assert device.site.model_dump() == Site(id=1, children=[Site(id=2)]).model_dump()
+    assert list(device.site.children) + [Site(id=3)] == [Site(id=2), Site(id=3)]
+
+
+def test_max_size():
+    interner = Interner(max_size=1)
+
+    device1 = Device.from_search_result(make_item(1), interner=interner)
+    device2 = Device.from_search_result(make_item(2), interner=interner)
+
+    assert len(interner) == 1
+    assert device1.boundaries[0] is device2.boundaries[0]
+    assert device1.site is not device2.site
+    assert device1.site == device2.site
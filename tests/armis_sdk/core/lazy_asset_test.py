@@ -0,0 +1,126 @@
+import pickle
+from typing import Optional
+
+import pydantic
+import pytest
+from pydantic import Field
+from pydantic import TypeAdapter
+
+from armis_sdk.core.asset_decoder import AssetDecoder
+from armis_sdk.core.base_entity import BaseEntity
+from armis_sdk.core.lazy_asset import LazyAsset
+from armis_sdk.entities.asset import Asset
+from armis_sdk.entities.boundary import Boundary
+from armis_sdk.entities.device import Device
+from armis_sdk.entities.site import Site
+from tests.armis_sdk.clients.assets_test_data import MOCK_DEVICE_FULL
+from tests.armis_sdk.clients.assets_test_data import MOCK_DEVICE_FULL_RAW_DATA
+
+
+class LimitedDevice(Asset):
+    asset_type = "DEVICE"
+    device_id: Optional[int] = None
+    boundaries: Optional[list[Boundary]] = Field(default=None, max_length=1)
+
+
+class Inventory(BaseEntity):
+    devices: list[Device]
+
+
+def decode(raw_data: dict, asset_class=Device) -> LazyAsset:
+    (device,) = AssetDecoder.for_class(asset_class).decode_page_lazy(
+        [{"fields": raw_data}]
+    )
+    return device
+
+
+def test_field_access():
+    device = decode(MOCK_DEVICE_FULL_RAW_DATA)
+
+    assert device.device_id == 1
+    assert isinstance(device.site, Site)
+    assert device.site is device.site
+    assert device.lazy_fields == ["boundaries", "network_interfaces"]
+    assert device.asset_type == "DEVICE"
+    assert device.lazy_fields == ["boundaries", "network_interfaces"]
+
+
+def test_method_access_loads_all_fields():
+    device = decode(MOCK_DEVICE_FULL_RAW_DATA)
+    _ = device.site
+
+    assert device.model_dump() == MOCK_DEVICE_FULL.model_dump()
+    assert device.lazy_fields == []
+
+
+def test_load():
+    device = decode(MOCK_DEVICE_FULL_RAW_DATA)
+    _ = device.boundaries
+
+    loaded = device.load()
+
+    assert isinstance(loaded, Device)
+    assert loaded is device.load()
+    assert loaded == MOCK_DEVICE_FULL
+    assert list(loaded.__dict__) == list(Device.model_fields)
+    assert device == MOCK_DEVICE_FULL
+    assert MOCK_DEVICE_FULL == device
+    assert repr(device) == f"LazyAsset({MOCK_DEVICE_FULL!r})"
+
+
+def test_serialize_loaded_asset():
+    device = decode(MOCK_DEVICE_FULL_RAW_DATA)
+    _ = device.site
+
+    loaded = device.load()
+
+    adapter = TypeAdapter(list[Device])
+    assert adapter.dump_python([loaded]) == adapter.dump_python([MOCK_DEVICE_FULL])
+    assert adapter.dump_json([loaded]) == adapter.dump_json([MOCK_DEVICE_FULL])
+    assert Inventory(devices=[loaded]).model_dump() == (
+        Inventory(devices=[MOCK_DEVICE_FULL]).model_dump()
+    )
+    assert '"site":{' in Inventory(devices=[loaded]).model_dump_json()
+
+
+def test_assignment():
+    device = decode(MOCK_DEVICE_FULL_RAW_DATA)
+
+    device.site = Site(id=5)
+
+    assert device.lazy_fields == ["boundaries", "network_interfaces"]
+    assert device.load().site == Site(id=5)
+    assert device.boundaries == MOCK_DEVICE_FULL.boundaries
+
+
+def test_invalid_field():
+    device = decode({"device_id": 1, "site": {"id": "x"}})
+
+    assert device.device_id == 1
+    with pytest.raises(pydantic.ValidationError):
+        _ = device.site
+
+
+def test_field_constraints():
+    device = decode(
+        {"device_id": 1, "boundaries": [{"id": 1}, {"id": 2}]}, LimitedDevice
+    )
+
+    with pytest.raises(pydantic.ValidationError, match="at most 1 item"):
+        _ = device.boundaries
+
+
+def test_pickle():
+    device = decode(MOCK_DEVICE_FULL_RAW_DATA)
+
+    unpickled = pickle.loads(pickle.dumps(device))
+
+    assert unpickled.lazy_fields == ["boundaries", "network_interfaces", "site"]
+    assert unpickled == MOCK_DEVICE_FULL
+
+
+def test_uninitialized():
+    device = LazyAsset.__new__(LazyAsset)
+
+    with pytest.raises(AttributeError):
+        _ = device.device_id
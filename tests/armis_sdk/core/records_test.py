@@ -0,0 +1,119 @@
+import datetime
+import pickle
+
+import pytest
+
+from armis_sdk.core.asset_decoder import AssetDecoder
+from armis_sdk.core.records import BoundaryRecord
+from armis_sdk.core.records import DeviceRecord
+from armis_sdk.core.records import NetworkInterfaceRecord
+from armis_sdk.core.records import Record
+from armis_sdk.entities.boundary import Boundary
+from armis_sdk.entities.device import Device
+from armis_sdk.entities.device import LightDevice
+from armis_sdk.entities.network_interface import NetworkInterface
+from armis_sdk.entities.site import Site
+
+NETWORK_INTERFACE = NetworkInterface(
+    alias=None,
+    brand=None,
+    broadcast_ssid=None,
+    channels=[1, 6],
+    description=None,
+    hidden_broadcast_ssid=None,
+    ipv4_address="1.1.1.1",
+    ipv6_address=None,
+    last_connected_ssid=None,
+    mac_address="43:87:a2:05:bc:56",
+    name=None,
+    type=None,
+    vlan=1,
+)
+DEVICE = Device(
+    boundaries=[Boundary(id=1, name="Corporate")],
+    device_id=1,
+    ipv4_addresses=["1.1.1.1"],
+    last_seen=datetime.datetime(2025, 12, 3, tzinfo=datetime.timezone.utc),
+    network_interfaces=[NETWORK_INTERFACE],
+    site=Site(id=1, name="Geneva", children=[Site(id=2)]),
+    tags=["Critical"],
+    custom={"Owner": "Jane"},
+)
+
+
+def test_record_classes():
+    assert Record.for_model(Device) is DeviceRecord
+    assert Record.for_model(NetworkInterface) is NetworkInterfaceRecord
+    assert Record.for_model(Boundary) is BoundaryRecord
+    assert DeviceRecord.__name__ == "DeviceRecord"
+    assert DeviceRecord.model_class is Device
+    assert not hasattr(DeviceRecord.from_model(DEVICE), "__dict__")
+
+
+def test_from_model():
+    record = DeviceRecord.from_model(DEVICE)
+
+    assert record.device_id == 1
+    assert record.ipv4_addresses == ("1.1.1.1",)
+    assert record.boundaries == (BoundaryRecord(id=1, name="Corporate"),)
+    assert record.network_interfaces[0].channels == (1, 6)
+    assert record.site.children[0] == Record.for_model(Site)(id=2)
+    assert record.custom == {"Owner": "Jane"}
+    assert record.brand is None
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        DEVICE,
+        Device(),
+        LightDevice(device_id=1, tags=["Critical"]),
+        NETWORK_INTERFACE,
+        Boundary(id=1, name="Corporate"),
+    ],
+)
+def test_round_trip(model):
+    record = Record.for_model(type(model)).from_model(model)
+
+    assert record.to_model() == model
+    assert type(record.to_model()) is type(model)
+
+
+def test_init():
+    record = BoundaryRecord(id=1, name="Corporate")
+
+    assert record.to_model() == Boundary(id=1, name="Corporate")
+    assert DeviceRecord(device_id=1).to_model() == Device(device_id=1)
+    assert repr(record) == "BoundaryRecord(id=1, name='Corporate')"
+
+
+@pytest.mark.parametrize(
+    ["values", "expected_error"],
+    [
+        ({"id": 1}, "BoundaryRecord is missing the field 'name'"),
+        ({"id": 1, "name": "a", "x": 2}, "BoundaryRecord has no fields 'x'"),
+    ],
+)
+def test_init_with_errors(values, expected_error):
+    with pytest.raises(TypeError, match=expected_error):
+        BoundaryRecord(**values)
+
+
+def test_from_lazy_model():
+    decoder = AssetDecoder.for_class(Device)
+    (device,) = decoder.decode_page_lazy(
+        [{"fields": {"device_id": 1, "site": {"id": 2, "name": "Geneva"}}}]
+    )
+
+    record = DeviceRecord.from_model(device)
+
+    assert record.site == Record.for_model(Site).from_model(Site(id=2, name="Geneva"))
+    assert record.to_model() == device
+
+
+def test_pickle():
+    record = DeviceRecord.from_model(Device(device_id=1, site=Site(id=2), tags=["a"]))
+    light_record = Record.for_model(LightDevice).from_model(LightDevice(device_id=1))
+
+    assert pickle.loads(pickle.dumps(light_record)) == light_record
+    assert pickle.loads(pickle.dumps(record)) == record
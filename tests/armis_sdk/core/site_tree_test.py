@@ -0,0 +1,93 @@
+import pytest
+
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.core.site_tree import SiteTree
+from armis_sdk.entities.site import Site
+
+SITES = [
+    Site(id=1),
+    Site(id=2, parent_id=1),
+    Site(id=3, parent_id=1),
+    Site(id=4, parent_id=2),
+    Site(id=5),
+    Site(id=6, parent_id=5),
+    Site(id=7, parent_id=999),
+]
+
+
+def ids(sites: list[Site]) -> list[int]:
+    return [site.id for site in sites]  # type: ignore[misc]
+
+
+def test_queries():
+    tree = SiteTree(SITES)
+
+    assert len(tree) == 7
+    assert 4 in tree
+    assert tree.get(4) == Site(id=4, parent_id=2)
+    assert tree.get(999) is None
+    assert ids(tree.roots) == [1, 5, 7]
+    assert tree.parent(4) == Site(id=2, parent_id=1)
+    assert tree.parent(7) is None
+    assert ids(tree.children(1)) == [2, 3]
+    assert ids(tree.ancestors(4)) == [2, 1]
+    assert ids(tree.descendants(1)) == [2, 4, 3]
+    assert not tree.descendants(4)
+    assert [tree.depth(site_id) for site_id in range(1, 8)] == [0, 1, 1, 2, 0, 1, 0]
+    assert tree.is_ancestor(1, 4)
+    assert not tree.is_ancestor(4, 1)
+    assert not tree.is_ancestor(5, 4)
+    assert not tree.is_ancestor(4, 4)
+    assert not SITES[0].children
+
+
+def test_upsert_moves_subtree():
+    tree = SiteTree(SITES)
+    assert tree.depth(4) == 2
+
+    tree.upsert(Site(id=2, parent_id=6))
+    tree.upsert(Site(id=8, parent_id=4))
+
+    assert ids(tree.children(1)) == [3]
+    assert ids(tree.descendants(5)) == [6, 2, 4, 8]
+    assert ids(tree.ancestors(8)) == [4, 2, 6, 5]
+    assert tree.depth(8) == 4
+
+
+def test_remove():
+    tree = SiteTree(SITES)
+
+    assert tree.remove(2) == Site(id=2, parent_id=1)
+    assert tree.remove(2) is None
+
+    assert ids(tree.roots) == [1, 4, 5, 7]
+    assert ids(tree.descendants(1)) == [3]
+    assert tree.depth(4) == 0
+
+
+def test_cycle():
+    tree = SiteTree([Site(id=1, parent_id=2), Site(id=2, parent_id=1), Site(id=3)])
+
+    assert ids(tree.roots) == [3, 1]
+    assert ids(tree.ancestors(2)) == [1]
+    assert ids(tree.descendants(1)) == [2]
+
+
+def test_deep_hierarchy():
+    tree = SiteTree(Site(id=index, parent_id=index - 1) for index in range(1, 5001))
+
+    assert tree.depth(5000) == 4999
+    assert len(tree.descendants(1)) == 4999
+
+
+@pytest.mark.parametrize(
+    ["action", "expected_error"],
+    [
+        (lambda tree: tree.upsert(Site(name="x")), "Can't add a site without an id"),
+        (lambda tree: tree.descendants(999), "Site 999 isn't in the tree."),
+        (lambda tree: tree.is_ancestor(1, 999), "Site 999 isn't in the tree."),
+    ],
+)
+def test_errors(action, expected_error):
+    with pytest.raises(ArmisError, match=expected_error):
+        action(SiteTree(SITES))
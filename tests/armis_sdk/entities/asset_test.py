@@ -0,0 +1,54 @@
+import datetime
+
+import pydantic
+import pytest
+
+from armis_sdk.core.armis_error import ArmisError
+from armis_sdk.entities.asset import Asset
+from armis_sdk.entities.device import Device
+from armis_sdk.entities.device import LightDevice
+
+
+def test_projection():
+    projection = Device.projection("last_seen", "device_id")
+
+    device = projection(device_id=1, last_seen=datetime.datetime(2025, 12, 3))
+
+    assert projection.__name__ == "DeviceProjection"
+    assert issubclass(projection, Asset)
+    assert projection.asset_type == "DEVICE"
+    assert projection.all_fields() == {"device_id", "last_seen"}
+    assert device.device_id == 1
+    assert device.custom == {}
+    assert Device.projection("device_id", "last_seen") is projection
+    with pytest.raises(pydantic.ValidationError):
+        projection(device_id="1")
+
+
+def test_projection_subclass():
+    class DeviceSummary(Device.projection("device_id", "tags")):
+        pass
+
+    summary = DeviceSummary.from_search_result(
+        {"fields": {"device_id": 1, "tags": ["a"], "custom.Owner": "Jane"}}
+    )
+
+    assert summary == DeviceSummary(device_id=1, tags=["a"], custom={"Owner": "Jane"})
+    assert DeviceSummary.asset_type == "DEVICE"
+
+
+def test_projection_invalid_fields():
+    with pytest.raises(
+        ArmisError,
+        match="The following fields don't exist on 'Device': 'bar', 'foo'",
+    ):
+        Device.projection("device_id", "foo", "bar")
+
+
+def test_light_device():
+    assert LightDevice.asset_type == "DEVICE"
+    assert LightDevice.all_fields() == Device.all_fields() - {
+        "boundaries",
+        "network_interfaces",
+        "site",
+    }